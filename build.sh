@@ -4,5 +4,10 @@ set -o errexit
 
 pip install -r requirements.txt
 
+# manage.py defaults to the dev settings profile
+export DJANGO_PROFILE="${DJANGO_PROFILE:-prod}"
+
+# Minified, fingerprinted, gzip and brotli compressed (kitchen.staticfiles)
 python manage.py collectstatic --no-input
+python manage.py check_static_references
 python manage.py migrate
\ No newline at end of file
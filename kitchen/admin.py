@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 
-from kitchen.models import Cook, DishType, Dish
+from kitchen.models import Cook, DishType, Dish, KitchenStats
 
 
 @admin.register(Cook)
@@ -33,4 +33,14 @@ class DishAdmin(admin.ModelAdmin):
     list_filter = ("dish_type",)
 
 
-admin.site.register(DishType)
+@admin.register(DishType)
+class DishTypeAdmin(admin.ModelAdmin):
+    # Also orders the dish type filter of DishAdmin, which can then read
+    # the unique name index instead of scanning the table.
+    ordering = ("name",)
+
+
+@admin.register(KitchenStats)
+class KitchenStatsAdmin(admin.ModelAdmin):
+    list_display = ("cooks", "dish_types", "dishes")
+    readonly_fields = ("cooks", "dish_types", "dishes")
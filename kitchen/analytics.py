@@ -0,0 +1,136 @@
+from decimal import Decimal
+
+from django.db.models import Avg, Count, Q, Sum
+
+from kitchen.cache import cached
+from kitchen.models import Cook, Dish, DishType
+
+
+# (label, lowest, highest) years of experience, ``None`` leaves it open.
+EXPERIENCE_BUCKETS = (
+    ("0-1", 0, 1),
+    ("2-4", 2, 4),
+    ("5-9", 5, 9),
+    ("10+", 10, None),
+)
+
+CENTS = Decimal("0.01")
+
+
+def round_price(price):
+    return None if price is None else price.quantize(CENTS)
+
+
+def round_average(value):
+    return None if value is None else round(value, 1)
+
+
+def experience_filter(lowest, highest):
+    condition = Q(years_of_experience__gte=lowest)
+
+    if highest is not None:
+        condition &= Q(years_of_experience__lte=highest)
+    return condition
+
+
+def get_dish_type_stats():
+    # One grouped LEFT JOIN, so dish types without dishes are listed too.
+    rows = (
+        DishType.objects.annotate(
+            dishes_total=Count("dishes"),
+            average_price=Avg("dishes__price"),
+            assignments=Sum("dishes__cooks_count", default=0),
+        )
+        .order_by("name")
+        .values("id", "name", "dishes_total", "average_price", "assignments")
+    )
+
+    return [
+        {
+            "id": row["id"],
+            "name": row["name"],
+            "dishes": row["dishes_total"],
+            "average_price": round_price(row["average_price"]),
+            "assignments": row["assignments"],
+        }
+        for row in rows
+    ]
+
+
+def get_cooks_per_dish():
+    # Dishes grouped by their maintained Dish.cooks_count, not by counting
+    # the assignments of every dish.
+    rows = (
+        Dish.objects.order_by("cooks_count")
+        .values("cooks_count")
+        .annotate(dishes=Count("id"))
+    )
+
+    return [
+        {"cooks": row["cooks_count"], "dishes": row["dishes"]}
+        for row in rows
+    ]
+
+
+def get_position_stats():
+    buckets = {
+        f"experience_{index}": Count(
+            "id", filter=experience_filter(lowest, highest)
+        )
+        for index, (_, lowest, highest) in enumerate(EXPERIENCE_BUCKETS)
+    }
+    rows = (
+        Cook.objects.order_by("position")
+        .values("position")
+        .annotate(
+            cooks=Count("id"),
+            average_experience=Avg("years_of_experience"),
+            unknown_experience=Count(
+                "id", filter=Q(years_of_experience__isnull=True)
+            ),
+            **buckets,
+        )
+    )
+    names = dict(Cook.POSITION_CHOICES)
+
+    return [
+        {
+            "position": row["position"],
+            "name": names.get(row["position"], row["position"]),
+            "cooks": row["cooks"],
+            "average_experience": round_average(row["average_experience"]),
+            "experience": {
+                **{
+                    label: row[f"experience_{index}"]
+                    for index, (label, _, _) in enumerate(EXPERIENCE_BUCKETS)
+                },
+                "unknown": row["unknown_experience"],
+            },
+        }
+        for row in rows
+    ]
+
+
+def get_totals():
+    totals = Dish.objects.aggregate(
+        dishes=Count("id"),
+        average_price=Avg("price"),
+        average_cooks=Avg("cooks_count"),
+        unassigned=Count("id", filter=Q(cooks_count=0)),
+    )
+    totals["average_price"] = round_price(totals["average_price"])
+    totals["average_cooks"] = round_average(totals["average_cooks"])
+
+    return totals
+
+
+# Every part is a single grouped query; the result is kept until the next
+# write to a cook, dish or dish type (see kitchen.signals).
+@cached(Dish, Cook, DishType, name="kitchen_analytics", key=lambda: ())
+def get_kitchen_analytics():
+    return {
+        "totals": get_totals(),
+        "dish_types": get_dish_type_stats(),
+        "cooks_per_dish": get_cooks_per_dish(),
+        "positions": get_position_stats(),
+    }
@@ -0,0 +1,338 @@
+import asyncio
+import json
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.http import (
+    Http404,
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.views import View
+
+from kitchen.analytics import get_kitchen_analytics
+from kitchen.async_views import AsyncLoginRequiredMixin
+from kitchen.menu import CONTENT_TYPES, get_menu_snapshot
+from kitchen.models import Cook, Dish, DishType
+from kitchen.pagination import (
+    apaginate_keyset,
+    iterate_keyset,
+    paginate_keyset,
+)
+from kitchen.search import search
+
+
+EXPORT_CHUNK_SIZE = 2000
+
+
+class ApiError(Exception):
+    pass
+
+
+def get_int_param(request, name, default=None, maximum=None):
+    value = request.GET.get(name)
+
+    if value in (None, ""):
+        return default
+
+    try:
+        value = int(value)
+    except ValueError:
+        raise ApiError(f"{name} must be an integer")
+
+    if value < 1:
+        raise ApiError(f"{name} must be positive")
+
+    return min(value, maximum) if maximum else value
+
+
+class ApiView(LoginRequiredMixin, View):
+    raise_exception = True
+    read_replica = True
+    model = None
+    fields = ()
+    filters = {}
+
+    def get_queryset(self):
+        queryset = self.model._default_manager.order_by().values(*self.fields)
+
+        for param, lookup in self.filters.items():
+            value = get_int_param(self.request, param)
+            if value is not None:
+                queryset = queryset.filter(**{lookup: value})
+
+        return queryset
+
+    def dispatch(self, request, *args, **kwargs):
+        try:
+            response = super().dispatch(request, *args, **kwargs)
+        except ApiError as error:
+            return self.error_response(error)
+
+        if asyncio.iscoroutine(response):
+            return self.handle_async_errors(response)
+        return response
+
+    async def handle_async_errors(self, coroutine):
+        try:
+            return await coroutine
+        except ApiError as error:
+            return self.error_response(error)
+
+    def error_response(self, error):
+        return JsonResponse({"error": str(error)}, status=400)
+
+
+class ApiListView(ApiView):
+    ordering = ("id",)
+    page_size = 50
+    max_page_size = 500
+
+    def get_page_args(self):
+        limit = get_int_param(
+            self.request, "limit", self.page_size, self.max_page_size
+        )
+
+        return (
+            self.get_queryset(),
+            self.ordering,
+            limit,
+            self.request.GET.get("cursor"),
+        )
+
+    def page_response(self, page):
+        return JsonResponse({
+            "results": list(page),
+            "next": page.next_cursor,
+            "previous": page.previous_cursor,
+        })
+
+    def get(self, request):
+        try:
+            page = paginate_keyset(*self.get_page_args())
+        except ValueError as error:
+            raise ApiError(str(error))
+
+        return self.page_response(page)
+
+    async def aget(self, request):
+        try:
+            page = await apaginate_keyset(*self.get_page_args())
+        except ValueError as error:
+            raise ApiError(str(error))
+
+        return self.page_response(page)
+
+
+class ApiDetailView(ApiView):
+    def not_found(self):
+        return Http404(f"No {self.model._meta.verbose_name} found")
+
+    def get_object(self, pk):
+        obj = self.get_queryset().filter(pk=pk).first()
+
+        if obj is None:
+            raise self.not_found()
+        return obj
+
+    async def aget_object(self, pk):
+        obj = await self.get_queryset().filter(pk=pk).afirst()
+
+        if obj is None:
+            raise self.not_found()
+        return obj
+
+    def get(self, request, pk):
+        return JsonResponse(self.get_object(pk))
+
+    async def aget(self, request, pk):
+        return JsonResponse(await self.aget_object(pk))
+
+
+class AsyncApiMixin(AsyncLoginRequiredMixin):
+    # Serves GET through the view's ``aget`` coroutine, for ASGI deployments.
+
+    async def get(self, request, *args, **kwargs):
+        return await self.aget(request, *args, **kwargs)
+
+
+DISH_FIELDS = ("id", "name", "description", "price", "dish_type_id")
+COOK_FIELDS = (
+    "id",
+    "username",
+    "first_name",
+    "last_name",
+    "years_of_experience",
+    "position",
+)
+DISH_TYPE_FIELDS = ("id", "name")
+DISH_FILTERS = {"dish_type": "dish_type_id", "cook": "cooks"}
+
+
+class DishApiListView(ApiListView):
+    model = Dish
+    fields = DISH_FIELDS
+    ordering = ("name",)
+    filters = DISH_FILTERS
+
+
+class DishApiDetailView(ApiDetailView):
+    model = Dish
+    fields = DISH_FIELDS
+
+    def get_cook_pks(self, pk):
+        return (
+            Dish.cooks.through.objects.filter(dish_id=pk)
+            .order_by("cook_id")
+            .values_list("cook_id", flat=True)
+        )
+
+    def get_object(self, pk):
+        dish = super().get_object(pk)
+        dish["cooks"] = list(self.get_cook_pks(pk))
+        return dish
+
+    async def aget_object(self, pk):
+        dish = await super().aget_object(pk)
+        dish["cooks"] = [cook async for cook in self.get_cook_pks(pk)]
+        return dish
+
+
+class DishApiExportView(ApiView):
+    model = Dish
+    fields = DISH_FIELDS
+    filters = DISH_FILTERS
+
+    content_type = "application/x-ndjson"
+
+    def get_export_queryset(self):
+        return self.get_queryset().order_by("id")
+
+    def set_filename(self, response):
+        response["Content-Disposition"] = (
+            'attachment; filename="dishes.ndjson"'
+        )
+        return response
+
+    def get_export_rows(self):
+        queryset = self.get_export_queryset()
+
+        if connections[queryset.db].settings_dict.get(
+            "DISABLE_SERVER_SIDE_CURSORS"
+        ):
+            return iterate_keyset(queryset, ("id",), EXPORT_CHUNK_SIZE)
+        return queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+    def get_export_parts(self):
+        # One part per chunk of rows, which StreamingASGIHandler reads
+        # from a worker thread.
+        rows = iter(self.get_export_rows())
+
+        while chunk := list(islice(rows, EXPORT_CHUNK_SIZE)):
+            yield "".join(
+                json.dumps(row, cls=DjangoJSONEncoder) + "\n" for row in chunk
+            )
+
+    def get(self, request):
+        return self.set_filename(StreamingHttpResponse(
+            self.get_export_parts(), content_type=self.content_type
+        ))
+
+
+class CookApiListView(ApiListView):
+    model = Cook
+    fields = COOK_FIELDS
+    ordering = ("position", "id")
+    filters = {"dish": "dishes"}
+
+    def get_queryset(self):
+        return search(
+            super().get_queryset(), "username", self.request.GET.get("q", "")
+        )
+
+
+class CookApiDetailView(ApiDetailView):
+    model = Cook
+    fields = COOK_FIELDS
+
+
+class DishTypeApiListView(ApiListView):
+    model = DishType
+    fields = DISH_TYPE_FIELDS
+    ordering = ("name",)
+
+
+class DishTypeApiDetailView(ApiDetailView):
+    model = DishType
+    fields = DISH_TYPE_FIELDS
+
+
+class AnalyticsApiView(ApiView):
+    def get(self, request):
+        return JsonResponse(get_kitchen_analytics())
+
+    async def aget(self, request):
+        return JsonResponse(await sync_to_async(get_kitchen_analytics)())
+
+
+class MenuSnapshotView(View):
+    # The whole menu for menu boards, served from the snapshot kept in the
+    # cache by kitchen.menu. It is public, so no session or user is loaded
+    # and a warm snapshot is served without any query.
+
+    def get(self, request):
+        snapshot = get_menu_snapshot()
+        name = request.GET.get("format", "json")
+
+        if name not in snapshot["content"]:
+            return JsonResponse(
+                {
+                    "error": "format must be one of: "
+                    + ", ".join(snapshot["content"])
+                },
+                status=400,
+            )
+
+        etag = snapshot["etags"][name]
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(
+                snapshot["content"][name], content_type=CONTENT_TYPES[name]
+            )
+
+        response.headers["ETag"] = etag
+        patch_cache_control(response, public=True, no_cache=True)
+        return response
+
+
+class AsyncDishApiListView(AsyncApiMixin, DishApiListView):
+    pass
+
+
+class AsyncDishApiDetailView(AsyncApiMixin, DishApiDetailView):
+    pass
+
+
+class AsyncCookApiListView(AsyncApiMixin, CookApiListView):
+    pass
+
+
+class AsyncCookApiDetailView(AsyncApiMixin, CookApiDetailView):
+    pass
+
+
+class AsyncDishTypeApiListView(AsyncApiMixin, DishTypeApiListView):
+    pass
+
+
+class AsyncDishTypeApiDetailView(AsyncApiMixin, DishTypeApiDetailView):
+    pass
+
+
+class AsyncAnalyticsApiView(AsyncApiMixin, AnalyticsApiView):
+    pass
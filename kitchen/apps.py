@@ -1,6 +1,14 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class KitchenConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "kitchen"
+
+    def ready(self):
+        from kitchen import signals  # noqa: F401
+        from kitchen.warmup import warm_up_templates
+
+        if settings.KITCHEN_TEMPLATE_WARMUP:
+            warm_up_templates()
@@ -0,0 +1,56 @@
+from django.apps import apps as global_apps
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+
+# Denormalised ends of Dish.cooks: the count field of each model and the
+# through table column pointing at it.
+ASSIGNMENT_COUNTS = (
+    ("Cook", "dishes_count", "cook_id"),
+    ("Dish", "cooks_count", "dish_id"),
+)
+
+
+def count_assignments(through, column):
+    return Coalesce(
+        Subquery(
+            through.objects.filter(**{column: OuterRef("pk")})
+            .order_by()
+            .values(column)
+            .annotate(count=Count("*"))
+            .values("count")
+        ),
+        0,
+    )
+
+
+def reconcile_assignment_counts(
+    apps=global_apps, using=DEFAULT_DB_ALIAS, fix=True
+):
+    # Recounts the rows whose count drifted from the through table (bulk
+    # inserts, raw SQL, concurrent removals) and returns how many there
+    # were per model. Fixed rows are touched so cached cards refresh.
+    through = apps.get_model("kitchen", "Dish").cooks.through
+    drifted = {}
+
+    for model_name, field, column in ASSIGNMENT_COUNTS:
+        model = apps.get_model("kitchen", model_name)
+        actual = count_assignments(through, column)
+        queryset = model._base_manager.using(using).exclude(
+            **{field: actual}
+        )
+
+        if fix:
+            drifted[model] = queryset.update(
+                **{field: actual, "updated_at": timezone.now()}
+            )
+        else:
+            drifted[model] = queryset.count()
+
+    return drifted
+
+
+def populate_assignment_counts(apps, schema_editor):
+    reconcile_assignment_counts(apps, schema_editor.connection.alias)
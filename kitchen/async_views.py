@@ -0,0 +1,100 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.handlers.asgi import ASGIHandler
+from django.http import Http404
+
+
+def is_authenticated(request):
+    return request.user.is_authenticated
+
+
+class AsyncLoginRequiredMixin(LoginRequiredMixin):
+    # Django 4.1 has no async request.user, so the session and user are
+    # loaded in a worker thread. Once resolved, the synchronous checks of
+    # LoginRequiredMixin no longer touch the database.
+
+    async def dispatch(self, request, *args, **kwargs):
+        if not await sync_to_async(is_authenticated)(request):
+            return self.handle_no_permission()
+
+        return await super().dispatch(request, *args, **kwargs)
+
+
+class AsyncKeysetListMixin:
+    # Async counterpart of BaseListView.get for views paginated with
+    # kitchen.pagination.KeysetPaginationMixin.
+
+    async def get(self, request, *args, **kwargs):
+        self.object_list = self.get_queryset()
+        self.keyset_page = await self.apaginate_queryset(
+            self.object_list, self.get_paginate_by(self.object_list)
+        )
+
+        return self.render_to_response(self.get_context_data())
+
+    def paginate_queryset(self, queryset, page_size):
+        return self.keyset_page
+
+
+class AsyncDetailMixin:
+    async def aget_object(self):
+        queryset = self.get_queryset()
+
+        try:
+            return await queryset.aget(pk=self.kwargs[self.pk_url_kwarg])
+        except queryset.model.DoesNotExist:
+            raise Http404(
+                f"No {queryset.model._meta.verbose_name} found "
+                f"matching the query"
+            )
+
+    async def get(self, request, *args, **kwargs):
+        self.object = await self.aget_object()
+
+        return self.render_to_response(
+            self.get_context_data(object=self.object)
+        )
+
+
+def get_response_headers(response):
+    headers = [
+        (header.encode("ascii"), value.encode("latin1"))
+        for header, value in response.items()
+    ]
+    headers.extend(
+        (b"Set-Cookie", cookie.output(header="").encode("ascii").strip())
+        for cookie in response.cookies.values()
+    )
+    return headers
+
+
+class StreamingASGIHandler(ASGIHandler):
+    # Django 4.1 iterates streaming responses on the event loop, where the
+    # ORM may not run and a blocking generator stalls the whole worker.
+    # Here each part is read in the thread that ran the sync view (and
+    # holds its database connection), so exports stream chunk by chunk.
+
+    async def send_response(self, response, send):
+        if not response.streaming:
+            return await super().send_response(response, send)
+
+        await send({
+            "type": "http.response.start",
+            "status": response.status_code,
+            "headers": get_response_headers(response),
+        })
+
+        parts = iter(response)
+        read_part = sync_to_async(next, thread_sensitive=True)
+        end = object()
+
+        while (part := await read_part(parts, end)) is not end:
+            for chunk, _ in self.chunk_bytes(part):
+                await send({
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": True,
+                })
+
+        await send({"type": "http.response.body"})
+        await sync_to_async(response.close, thread_sensitive=True)()
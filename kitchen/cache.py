@@ -0,0 +1,89 @@
+import functools
+import hashlib
+import time
+from collections import Counter
+
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+
+CACHE_STATS = Counter()
+
+
+# Versions are shared by every worker through the cache, so a write in one
+# worker invalidates the entries of all of them (see
+# restaurant_kitchen_service.profiles.check_shared_cache).
+def version_key(model):
+    return f"kitchen:version:{model._meta.label_lower}"
+
+
+def get_model_version(model):
+    key = version_key(model)
+    version = cache.get(key)
+
+    if version is None:
+        # Seed from the clock so an evicted counter never restarts at a
+        # value that older cache entries were stored under.
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+
+    return version
+
+
+def get_model_versions(*models):
+    return tuple(get_model_version(model) for model in models)
+
+
+def bump_model_version(model):
+    try:
+        cache.incr(version_key(model))
+    except ValueError:
+        get_model_version(model)
+
+
+def make_key(name, models, parts):
+    digest = hashlib.md5(repr(parts).encode()).hexdigest()
+    versions = ".".join(
+        str(version) for version in get_model_versions(*models)
+    )
+
+    return f"kitchen:{name}:{versions}:{digest}"
+
+
+def record(name, hit):
+    CACHE_STATS[(name, "hit" if hit else "miss")] += 1
+
+
+def get_cache_stats():
+    stats = {}
+
+    for (name, outcome), count in sorted(CACHE_STATS.items()):
+        stats.setdefault(name, {"hit": 0, "miss": 0})[outcome] = count
+
+    return stats
+
+
+def cached(*models, timeout=DEFAULT_TIMEOUT, key=None, name=None):
+    # Results are stored under the current versions of ``models``, so any
+    # write to those models makes the old entries unreachable. ``key``
+    # maps the call arguments to the parts identifying the call.
+
+    def decorator(func):
+        stats_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            parts = key(*args, **kwargs) if key else (args, kwargs)
+            cache_key = make_key(stats_name, models, parts)
+            result = cache.get(cache_key)
+
+            record(stats_name, result is not None)
+            if result is None:
+                result = func(*args, **kwargs)
+                cache.set(cache_key, result, timeout)
+
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,100 @@
+import hashlib
+
+from asgiref.sync import sync_to_async
+from django.db.models import Max
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    quote_etag,
+)
+from django.utils.http import http_date
+
+from kitchen.cache import cached, get_model_versions
+
+
+def get_table_last_modified(model):
+    def aggregate():
+        return model.objects.aggregate(
+            last_modified=Max("updated_at")
+        )["last_modified"]
+
+    return cached(
+        model, name="table_last_modified", key=lambda: model._meta.label
+    )(aggregate)()
+
+
+class ConditionalGetMixin:
+    conditional_models = ()
+
+    def get_conditional_state(self):
+        # Version counters are part of the state because deletes do not
+        # move the table's max(updated_at).
+        timestamps = [
+            get_table_last_modified(model)
+            for model in self.conditional_models
+        ]
+        last_modified = max(filter(None, timestamps), default=None)
+
+        return last_modified, get_model_versions(*self.conditional_models)
+
+    def get_etag(self, last_modified, state):
+        user = self.request.user
+        digest = hashlib.md5(
+            repr(
+                (
+                    state,
+                    last_modified,
+                    self.request.get_full_path(),
+                    user.pk,
+                    getattr(user, "updated_at", None),
+                )
+            ).encode()
+        ).hexdigest()
+
+        return quote_etag(digest)
+
+    def evaluate_conditions(self):
+        last_modified, state = self.get_conditional_state()
+
+        if state is None:
+            return None, None
+
+        etag = self.get_etag(last_modified, state)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        response = get_conditional_response(
+            self.request, etag=etag, last_modified=timestamp
+        )
+
+        return (etag, timestamp), response
+
+    def set_validators(self, response, validators):
+        if validators is None or response.status_code not in (200, 304):
+            return response
+
+        etag, timestamp = validators
+        response.headers["ETag"] = etag
+        if timestamp is not None:
+            response.headers["Last-Modified"] = http_date(timestamp)
+        patch_cache_control(response, private=True, no_cache=True)
+
+        return response
+
+    def get(self, request, *args, **kwargs):
+        validators, response = self.evaluate_conditions()
+
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+
+        return self.set_validators(response, validators)
+
+
+class AsyncConditionalGetMixin(ConditionalGetMixin):
+    async def get(self, request, *args, **kwargs):
+        validators, response = await sync_to_async(
+            self.evaluate_conditions
+        )()
+
+        if response is None:
+            response = await super().get(request, *args, **kwargs)
+
+        return self.set_validators(response, validators)
@@ -0,0 +1,5 @@
+from django.conf import settings
+
+
+def live_board(request):
+    return {"live_board": settings.KITCHEN_LIVE_BOARD}
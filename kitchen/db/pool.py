@@ -0,0 +1,164 @@
+import threading
+import time
+from collections import Counter
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+def close_quietly(connection):
+    try:
+        connection.close()
+    except Exception:
+        pass
+
+
+class ConnectionPool:
+    # A per-process pool of database connections shared by all threads.
+    # Idle connections are reused newest first, so that the ones left
+    # unused when load drops expire after ``max_idle`` seconds.
+
+    def __init__(self, params, max_size=10, timeout=10, max_idle=300,
+                 check=None):
+        self.params = params
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.check = check
+        self.idle = []
+        self.in_use = 0
+        self.closed = False
+        self.counters = Counter()
+        self.condition = threading.Condition()
+
+    def expire_idle(self):
+        deadline = time.monotonic() - self.max_idle
+        expired = 0
+
+        while expired < len(self.idle) and self.idle[expired][1] < deadline:
+            expired += 1
+
+        stale = [connection for connection, _ in self.idle[:expired]]
+        del self.idle[:expired]
+        self.counters["expired"] += expired
+        return stale
+
+    def acquire(self, connect):
+        deadline = time.monotonic() + self.timeout
+
+        with self.condition:
+            stale = self.expire_idle()
+            while not self.idle and self.in_use >= self.max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.counters["timeouts"] += 1
+                    raise PoolTimeout(
+                        f"No database connection free after {self.timeout}s "
+                        f"({self.max_size} in use)"
+                    )
+                self.counters["waits"] += 1
+                self.condition.wait(remaining)
+
+            connection = self.idle.pop()[0] if self.idle else None
+            self.in_use += 1
+            self.counters["checkouts"] += 1
+
+        for old in stale:
+            close_quietly(old)
+
+        # Connecting and health checks wait on the network, so they run
+        # outside the lock.
+        try:
+            if connection is not None and self.check and not self.check(
+                connection
+            ):
+                close_quietly(connection)
+                self.count("discarded")
+                connection = None
+            if connection is None:
+                connection = connect()
+                self.count("created")
+        except BaseException:
+            self.release(None, discard=True)
+            raise
+
+        return connection
+
+    def release(self, connection, discard=False):
+        with self.condition:
+            self.in_use -= 1
+            discard = discard or self.closed
+            if not discard:
+                self.idle.append((connection, time.monotonic()))
+            elif connection is not None:
+                self.counters["discarded"] += 1
+            self.condition.notify()
+
+        if discard and connection is not None:
+            close_quietly(connection)
+
+    def count(self, name):
+        with self.condition:
+            self.counters[name] += 1
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            idle, self.idle = self.idle, []
+
+        for connection, _ in idle:
+            close_quietly(connection)
+
+    def get_stats(self):
+        with self.condition:
+            return {
+                "max_size": self.max_size,
+                "in_use": self.in_use,
+                "idle": len(self.idle),
+                **{
+                    name: self.counters[name]
+                    for name in (
+                        "checkouts",
+                        "created",
+                        "discarded",
+                        "expired",
+                        "waits",
+                        "timeouts",
+                    )
+                },
+            }
+
+
+_pools = {}
+_lock = threading.Lock()
+
+
+def get_pool(alias, params, **options):
+    # Settings overrides (tests switching to the test database) change the
+    # connection parameters; connections to the old database are dropped.
+    with _lock:
+        pool = _pools.get(alias)
+        if pool is not None and pool.params == params:
+            return pool
+
+        _pools[alias] = ConnectionPool(params, **options)
+
+    if pool is not None:
+        pool.close()
+    return _pools[alias]
+
+
+def close_pool(alias):
+    with _lock:
+        pool = _pools.pop(alias, None)
+
+    if pool is not None:
+        pool.close()
+
+
+def get_pool_stats():
+    with _lock:
+        pools = sorted(_pools.items())
+
+    return {alias: pool.get_stats() for alias, pool in pools}
@@ -0,0 +1,87 @@
+from django.db.backends.base.base import NO_DB_ALIAS
+from django.db.backends.postgresql import base, creation
+from psycopg2 import extensions
+
+from kitchen.db.pool import PoolTimeout, close_pool, get_pool
+
+
+def ping(connection):
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        if connection.get_transaction_status() != (
+            extensions.TRANSACTION_STATUS_IDLE
+        ):
+            connection.rollback()
+    except base.Database.Error:
+        return False
+    return True
+
+
+def reset(connection):
+    status = connection.get_transaction_status()
+
+    if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+        return False
+    if status != extensions.TRANSACTION_STATUS_IDLE:
+        try:
+            connection.rollback()
+        except base.Database.Error:
+            return False
+    return True
+
+
+class DatabaseCreation(creation.DatabaseCreation):
+    def _destroy_test_db(self, test_database_name, verbosity):
+        # PostgreSQL refuses to drop a database with open sessions.
+        close_pool(self.connection.alias)
+        super()._destroy_test_db(test_database_name, verbosity)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    # PostgreSQL backend drawing connections from a per-process pool
+    # (kitchen.db.pool). Django closes connections at the end of every
+    # request with CONN_MAX_AGE = 0, which hands them back to the pool.
+    creation_class = DatabaseCreation
+
+    pool = None
+
+    def get_new_connection(self, conn_params):
+        if self.alias == NO_DB_ALIAS:
+            return super().get_new_connection(conn_params)
+
+        options = self.settings_dict.get("POOL", {})
+        self.pool = get_pool(
+            self.alias,
+            conn_params,
+            max_size=options.get("MAX_SIZE", 10),
+            timeout=options.get("TIMEOUT", 10),
+            max_idle=options.get("MAX_IDLE", 300),
+            check=ping if self.settings_dict["CONN_HEALTH_CHECKS"] else None,
+        )
+
+        try:
+            return self.pool.acquire(
+                lambda: super(DatabaseWrapper, self).get_new_connection(
+                    conn_params
+                )
+            )
+        except PoolTimeout as error:
+            raise self.Database.OperationalError(str(error)) from error
+
+    def _close(self):
+        if self.pool is None:
+            return super()._close()
+
+        connection, pool, self.pool = self.connection, self.pool, None
+        # A connection closed inside atomic() stays referenced by Django,
+        # so it must not be handed to another thread.
+        pool.release(
+            connection,
+            discard=(
+                self.in_atomic_block
+                or self.errors_occurred
+                or connection.closed
+                or not reset(connection)
+            ),
+        )
@@ -1,6 +1,9 @@
+import copy
+
 from django import forms
 from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import UserCreationForm
+from django.urls import reverse_lazy
 
 from kitchen.models import Cook, Dish
 
@@ -23,6 +26,31 @@ class CookSearchForm(forms.Form):
     )
 
 
+class CookPickerWidget(forms.SelectMultiple):
+    class Media:
+        js = ("js/cook_picker.js",)
+
+    def __init__(self, attrs=None):
+        super().__init__({
+            "data-cook-picker": "",
+            "data-url": reverse_lazy("kitchen:api-cook-list"),
+            **(attrs or {}),
+        })
+
+    def optgroups(self, name, value, attrs=None):
+        # Only the selected cooks are rendered; the rest are fetched from
+        # the cook API as the user types.
+        selected = [pk for pk in value if str(pk).isdigit()]
+        choices = self.choices
+        self.choices = copy.copy(choices)
+        self.choices.queryset = choices.queryset.filter(pk__in=selected)
+
+        try:
+            return super().optgroups(name, value, attrs)
+        finally:
+            self.choices = choices
+
+
 class CookCreateForm(UserCreationForm):
     class Meta(UserCreationForm.Meta):
 
@@ -38,7 +66,7 @@ class CookCreateForm(UserCreationForm):
 class DishForm(forms.ModelForm):
     cooks = forms.ModelMultipleChoiceField(
         queryset=get_user_model().objects.all(),
-        widget=forms.CheckboxSelectMultiple,
+        widget=CookPickerWidget,
         required=False
     )
 
@@ -50,7 +78,7 @@ class DishForm(forms.ModelForm):
 class DishAddCookForm(forms.ModelForm):
     cooks = forms.ModelMultipleChoiceField(
         queryset=get_user_model().objects.all(),
-        widget=forms.CheckboxSelectMultiple,
+        widget=CookPickerWidget,
         required=False
     )
 
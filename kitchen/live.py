@@ -0,0 +1,330 @@
+import asyncio
+import io
+import json
+import logging
+import queue
+import threading
+import time
+from importlib import import_module
+
+import redis
+from asgiref.sync import sync_to_async
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, connections
+from django.urls import reverse
+
+from kitchen.models import Cook, Dish
+
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_INTERVAL = 15
+RETRY_MS = 5000
+KEEP_ALIVE = ": keep-alive\n\n"
+STREAM_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+
+def encode_event(event, data):
+    payload = json.dumps(data, cls=DjangoJSONEncoder, separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+def get_dish_rows(pks):
+    rows = list(
+        Dish.objects.for_list()
+        .filter(pk__in=pks)
+        .values("id", "name", "price", "dish_type__name", "cooks_count")
+    )
+    cooks = {}
+
+    for dish_id, cook_id in Dish.cooks.through.objects.filter(
+        dish_id__in=pks
+    ).values_list("dish_id", "cook_id"):
+        cooks.setdefault(dish_id, []).append(cook_id)
+
+    for row in rows:
+        row["dish_type"] = row.pop("dish_type__name")
+        row["cooks"] = sorted(cooks.get(row["id"], ()))
+
+    return rows
+
+
+def get_cook_rows(pks):
+    return [
+        {
+            "id": cook.id,
+            "username": cook.username,
+            "first_name": cook.first_name,
+            "last_name": cook.last_name,
+            "years_of_experience": cook.years_of_experience,
+            "position": cook.get_position_display(),
+            "dishes_count": cook.dishes_count,
+        }
+        for cook in Cook.objects.filter(pk__in=pks).only(
+            "username",
+            "first_name",
+            "last_name",
+            "years_of_experience",
+            "position",
+            "dishes_count",
+        )
+    ]
+
+
+EVENTS = {
+    Dish: ("dishes", get_dish_rows),
+    Cook: ("cooks", get_cook_rows),
+}
+
+
+class Subscriber:
+    def __init__(self):
+        self.queue = queue.SimpleQueue()
+
+    def put(self, message):
+        self.queue.put(message)
+
+    def get(self, timeout):
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class AsyncSubscriber:
+    def __init__(self, loop):
+        self.loop = loop
+        self.queue = asyncio.Queue()
+
+    def put(self, message):
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, message)
+
+
+class Hub:
+    # Fans model changes out to every open event stream of this process.
+    # Changes arriving within ``delay`` seconds are coalesced and read from
+    # the database once per burst, however many screens are listening.
+
+    def __init__(self, delay=0.25):
+        self.delay = delay
+        self.subscribers = set()
+        self.pending = {}
+        self.timer = None
+        self.lock = threading.Lock()
+
+    def subscribe(self, subscriber):
+        with self.lock:
+            self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self.lock:
+            self.subscribers.discard(subscriber)
+
+    def publish(self, model, pk, deleted=False):
+        self.publish_many(model, [pk], deleted)
+
+    def publish_many(self, model, pks, deleted=False):
+        with self.lock:
+            if not self.subscribers:
+                return
+
+            pending = self.pending.setdefault(model, {})
+            for pk in pks:
+                pending[pk] = deleted
+            if self.delay and self.timer is None:
+                self.timer = threading.Timer(self.delay, self.flush_in_thread)
+                self.timer.daemon = True
+                self.timer.start()
+
+        if not self.delay:
+            self.flush()
+
+    def flush_in_thread(self):
+        try:
+            self.flush()
+        finally:
+            connections.close_all()
+
+    def flush(self):
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            self.timer = None
+            subscribers = list(self.subscribers)
+
+        if not subscribers:
+            return
+
+        messages = []
+        for model, changes in pending.items():
+            event, get_rows = EVENTS[model]
+            deleted = sorted(pk for pk, gone in changes.items() if gone)
+            changed = [pk for pk, gone in changes.items() if not gone]
+            messages.append(encode_event(event, {
+                "changed": get_rows(changed) if changed else [],
+                "deleted": deleted,
+            }))
+
+        for subscriber in subscribers:
+            for message in messages:
+                subscriber.put(message)
+
+
+class RedisHub(Hub):
+    # Fans changes out to the hubs of every worker process through Redis
+    # pub/sub. Each process listens once it serves a board, and changes of
+    # this process come back through the channel like those of the others.
+    # Changes published while the listener reconnects are lost, as are
+    # those of a process that cannot reach Redis: boards miss the update.
+
+    channel = "kitchen:live"
+
+    def __init__(self, url, delay=0.25):
+        super().__init__(delay)
+        self.client = redis.Redis.from_url(url)
+        self.listener = None
+
+    def subscribe(self, subscriber):
+        super().subscribe(subscriber)
+        with self.lock:
+            if self.listener is None:
+                self.listener = threading.Thread(
+                    target=self.listen, daemon=True
+                )
+                self.listener.start()
+        return subscriber
+
+    def publish_many(self, model, pks, deleted=False):
+        message = json.dumps([model._meta.label, list(pks), deleted])
+
+        try:
+            self.client.publish(self.channel, message)
+        except redis.RedisError:
+            logger.warning("Could not publish live changes", exc_info=True)
+
+    def receive(self, message):
+        label, pks, deleted = json.loads(message)
+        super().publish_many(apps.get_model(label), pks, deleted)
+
+    def listen(self):
+        while True:
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                for message in pubsub.listen():
+                    self.receive(message["data"])
+            except redis.RedisError:
+                logger.warning("Live changes channel lost", exc_info=True)
+                time.sleep(RETRY_MS / 1000)
+
+
+def create_hub():
+    delay = getattr(settings, "KITCHEN_LIVE_COALESCE_DELAY", 0.25)
+    url = getattr(settings, "KITCHEN_LIVE_REDIS_URL", None)
+
+    if url:
+        return RedisHub(url, delay)
+    return Hub(delay)
+
+
+hub = create_hub()
+
+
+def stream_events(subscriber):
+    try:
+        yield f"retry: {RETRY_MS}\n\n"
+        while True:
+            yield subscriber.get(HEARTBEAT_INTERVAL) or KEEP_ALIVE
+    finally:
+        hub.unsubscribe(subscriber)
+
+
+async def is_authenticated(scope):
+    request = ASGIRequest(scope, io.BytesIO())
+    engine = import_module(settings.SESSION_ENGINE)
+    request.session = engine.SessionStore(
+        request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+    )
+
+    def check():
+        try:
+            return get_user(request).is_authenticated
+        finally:
+            close_old_connections()
+
+    return await sync_to_async(check)()
+
+
+async def wait_for_disconnect(receive):
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+class LiveEventsApp:
+    # Serves the event stream on the ASGI application directly: Django 4.1
+    # iterates streaming responses on the event loop, where a blocking
+    # generator would stall every other request of the worker.
+
+    def __init__(self, app):
+        self.app = app
+        self.path = reverse("kitchen:live-events")
+
+    async def __call__(self, scope, receive, send):
+        if (
+            not settings.KITCHEN_LIVE_BOARD
+            or scope["type"] != "http"
+            or scope["path"] != self.path
+        ):
+            return await self.app(scope, receive, send)
+
+        if not await is_authenticated(scope):
+            await send({"type": "http.response.start", "status": 403})
+            return await send({"type": "http.response.body"})
+
+        subscriber = hub.subscribe(
+            AsyncSubscriber(asyncio.get_running_loop())
+        )
+        disconnect = asyncio.ensure_future(wait_for_disconnect(receive))
+        headers = [(b"content-type", b"text/event-stream")] + [
+            (name.lower().encode(), value.encode())
+            for name, value in STREAM_HEADERS.items()
+        ]
+
+        try:
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": headers,
+            })
+            await self.send_body(send, f"retry: {RETRY_MS}\n\n")
+
+            while not disconnect.done():
+                message = asyncio.ensure_future(subscriber.queue.get())
+                done, _ = await asyncio.wait(
+                    {message, disconnect},
+                    timeout=HEARTBEAT_INTERVAL,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if message in done:
+                    await self.send_body(send, message.result())
+                else:
+                    message.cancel()
+                    if not disconnect.done():
+                        await self.send_body(send, KEEP_ALIVE)
+        finally:
+            hub.unsubscribe(subscriber)
+            disconnect.cancel()
+
+    async def send_body(self, send, text):
+        await send({
+            "type": "http.response.body",
+            "body": text.encode(),
+            "more_body": True,
+        })
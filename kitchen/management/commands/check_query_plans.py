@@ -0,0 +1,64 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+from kitchen.query_plans import (
+    LIST_REQUESTS,
+    explain,
+    find_sequential_scans,
+    record_queries,
+    resolve_params,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN the queries of every list and search view and flag full "
+        "table scans. Planners prefer scans on tiny tables, so run it "
+        "against realistic volumes (see seed_kitchen)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fail",
+            action="store_true",
+            help="Exit with an error when a sequential scan is found.",
+        )
+
+    def handle(self, *args, **options):
+        flagged = 0
+
+        for url_name, params in LIST_REQUESTS:
+            status, queries = record_queries(url_name, params)
+            label = f"{url_name} {resolve_params(params) or ''}".strip()
+            self.stdout.write(
+                self.style.MIGRATE_HEADING(f"{label} -> {status}")
+            )
+            if status != 200:
+                self.stdout.write(self.style.WARNING(
+                    f"  {reverse(url_name)} did not render, "
+                    f"its queries may be incomplete"
+                ))
+
+            for sql, query_params in queries:
+                plan = explain(sql, query_params)
+                scans = find_sequential_scans(plan)
+
+                if scans:
+                    flagged += 1
+                    self.stdout.write(self.style.WARNING(
+                        f"  sequential scan of {', '.join(scans)}: {sql}"
+                    ))
+                elif options["verbosity"] > 1:
+                    self.stdout.write(f"  {sql}")
+
+                if scans or options["verbosity"] > 1:
+                    for line in plan:
+                        self.stdout.write(f"    {line}")
+
+        if flagged and options["fail"]:
+            raise CommandError(f"{flagged} queries scan whole tables")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Checked {len(LIST_REQUESTS)} requests, "
+            f"{flagged} queries with sequential scans"
+        ))
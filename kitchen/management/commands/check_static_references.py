@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from kitchen.staticfiles import (
+    find_missing_static_files,
+    get_static_references,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Check that every {% static %} path in the project templates "
+        "resolves: in the collectstatic manifest with a manifest storage, "
+        "in the static finders otherwise. Run it after collectstatic."
+    )
+
+    def handle(self, *args, **options):
+        references = get_static_references()
+        missing = find_missing_static_files(references)
+
+        for name, path in missing:
+            self.stderr.write(f"{name}: {path} is not collected")
+
+        if missing:
+            raise CommandError(
+                f"{len(missing)} static references do not resolve"
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Checked {len(references)} static references"
+        ))
@@ -0,0 +1,242 @@
+import csv
+import json
+import time
+from collections import Counter
+from itertools import islice
+from pathlib import Path
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from kitchen.menu import discard_menu_snapshot
+from kitchen.models import Cook, Dish, DishType, KitchenStats
+from kitchen.signals import count_assignments, invalidate_cache
+
+
+def get_text(row, field):
+    return str(row.get(field) or "").strip()
+
+
+def clean_cooks(names):
+    names = (name.strip() for name in names)
+    return [name for name in names if name]
+
+
+def read_csv(file):
+    for row in csv.DictReader(file):
+        cooks = row.get("cooks") or ""
+        row["cooks"] = clean_cooks(cooks.split(";"))
+        yield row
+
+
+def read_jsonl(file):
+    for number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as error:
+            raise CommandError(f"Line {number}: invalid JSON ({error.msg})")
+        if not isinstance(row, dict):
+            raise CommandError(f"Line {number}: expected a JSON object")
+
+        cooks = row.get("cooks") or []
+        if not isinstance(cooks, list) or not all(
+            isinstance(name, str) for name in cooks
+        ):
+            raise CommandError(
+                f"Line {number}: cooks must be a list of usernames"
+            )
+        row["cooks"] = clean_cooks(cooks)
+        yield row
+
+
+READERS = {"csv": read_csv, "jsonl": read_jsonl}
+
+PRICE_FIELD = Dish._meta.get_field("price")
+
+
+def batched(rows, size):
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+class Command(BaseCommand):
+    help = "Import dishes from a CSV or JSONL menu file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=Path)
+        parser.add_argument(
+            "--format",
+            choices=READERS,
+            help="File format; guessed from the extension by default.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--create-dish-types",
+            action="store_true",
+            help="Create dish types that do not exist yet.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate and insert everything, then roll back.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["format"] or path.suffix.lstrip(".").lower()
+
+        if file_format not in READERS:
+            raise CommandError(
+                f"Unknown format {file_format!r}, use --format"
+            )
+
+        self.dish_types = {}
+        self.cooks = {}
+        self.create_dish_types = options["create_dish_types"]
+        started = time.perf_counter()
+        imported = 0
+
+        with open(path, newline="", encoding="utf-8") as file:
+            with transaction.atomic():
+                rows = READERS[file_format](file)
+                for batch in batched(rows, options["batch_size"]):
+                    self.import_batch(batch, first_line=imported + 1)
+                    imported += len(batch)
+
+                if options["dry_run"]:
+                    transaction.set_rollback(True)
+                else:
+                    KitchenStats.rebuild()
+                    invalidate_cache(Dish, DishType, Cook)
+                    # bulk_create() bypasses the menu signals.
+                    transaction.on_commit(discard_menu_snapshot)
+
+        elapsed = time.perf_counter() - started
+        action = "Validated" if options["dry_run"] else "Imported"
+        self.stdout.write(self.style.SUCCESS(
+            f"{action} {imported} dishes in {elapsed:.2f}s "
+            f"({imported / max(elapsed, 1e-9):.0f} rows/s)"
+        ))
+
+    def import_batch(self, batch, first_line):
+        for offset, row in enumerate(batch):
+            # Stored stripped, like the names in build_dish().
+            row["dish_type"] = get_text(row, "dish_type")
+            if not row["dish_type"]:
+                raise CommandError(
+                    f"Row {first_line + offset}: dish_type is required"
+                )
+            row.setdefault("cooks", [])
+
+        self.resolve_dish_types({row["dish_type"] for row in batch})
+        self.resolve_cooks({name for row in batch for name in row["cooks"]})
+
+        # Names are compared as build_dish() stores them.
+        existing = set(
+            Dish.objects.filter(
+                name__in=[get_text(row, "name") for row in batch]
+            ).values_list("name", flat=True)
+        )
+        dishes = [
+            self.build_dish(row, first_line + offset, existing)
+            for offset, row in enumerate(batch)
+        ]
+        Dish.objects.bulk_create(dishes)
+
+        if any(dish.pk is None for dish in dishes):
+            pks = dict(
+                Dish.objects.filter(
+                    name__in=[dish.name for dish in dishes]
+                ).values_list("name", "pk")
+            )
+            for dish in dishes:
+                dish.pk = pks[dish.name]
+
+        Dish.cooks.through.objects.bulk_create(
+            Dish.cooks.through(dish_id=dish.pk, cook_id=self.cooks[name])
+            for dish, row in zip(dishes, batch)
+            for name in set(row["cooks"])
+        )
+        self.count_cook_dishes(batch)
+
+    def count_cook_dishes(self, batch):
+        # The assignments were inserted without m2m_changed; the new dishes
+        # got their cooks_count in build_dish().
+        added = Counter(
+            self.cooks[name] for row in batch for name in set(row["cooks"])
+        )
+        cooks_by_delta = {}
+        for pk, delta in added.items():
+            cooks_by_delta.setdefault(delta, []).append(pk)
+
+        for delta, pks in cooks_by_delta.items():
+            count_assignments(Cook, pks, delta)
+
+    def build_dish(self, row, line, existing):
+        name = get_text(row, "name")
+
+        if not name:
+            raise CommandError(f"Row {line}: name is required")
+        if name in existing:
+            raise CommandError(f"Row {line}: dish {name!r} already exists")
+        existing.add(name)
+
+        # The field's own checks reject NaN, infinities and prices that do
+        # not fit its digits, which would otherwise be saved or fail late.
+        try:
+            price = PRICE_FIELD.clean(row.get("price"), None)
+        except ValidationError as error:
+            raise CommandError(
+                f"Row {line}: invalid price ({' '.join(error.messages)})"
+            )
+
+        return Dish(
+            name=name,
+            description=row.get("description") or None,
+            price=price,
+            dish_type_id=self.dish_types[row["dish_type"]],
+            cooks_count=len(set(row["cooks"])),
+        )
+
+    def resolve_dish_types(self, names):
+        missing = names - self.dish_types.keys()
+        if not missing:
+            return
+
+        self.dish_types.update(
+            DishType.objects.filter(name__in=missing).values_list("name", "pk")
+        )
+        missing -= self.dish_types.keys()
+
+        if missing and not self.create_dish_types:
+            raise CommandError(
+                f"Unknown dish types: {', '.join(sorted(missing))} "
+                f"(use --create-dish-types)"
+            )
+        if missing:
+            DishType.objects.bulk_create(
+                DishType(name=name) for name in missing
+            )
+            self.dish_types.update(
+                DishType.objects.filter(name__in=missing)
+                .values_list("name", "pk")
+            )
+
+    def resolve_cooks(self, usernames):
+        missing = usernames - self.cooks.keys()
+        if not missing:
+            return
+
+        self.cooks.update(
+            Cook.objects.filter(username__in=missing)
+            .values_list("username", "pk")
+        )
+        missing -= self.cooks.keys()
+
+        if missing:
+            raise CommandError(f"Unknown cooks: {', '.join(sorted(missing))}")
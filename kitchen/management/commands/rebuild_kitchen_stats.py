@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from kitchen.models import KitchenStats
+
+
+class Command(BaseCommand):
+    help = "Recount cooks, dish types and dishes for the home page."
+
+    def handle(self, *args, **options):
+        stats = KitchenStats.rebuild()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Kitchen stats rebuilt: {stats}")
+        )
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from kitchen.assignments import reconcile_assignment_counts
+from kitchen.signals import invalidate_cache
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount Cook.dishes_count and Dish.cooks_count from the "
+        "assignments, e.g. after importing them with raw SQL."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report drifted counts, exit with an error if any.",
+        )
+
+    def handle(self, *args, **options):
+        drifted = reconcile_assignment_counts(fix=not options["check"])
+        summary = ", ".join(
+            f"{model._meta.model_name}: {count}"
+            for model, count in drifted.items()
+        )
+
+        if options["check"]:
+            if any(drifted.values()):
+                raise CommandError(f"Drifted assignment counts ({summary})")
+            self.stdout.write(
+                self.style.SUCCESS("Assignment counts are in step")
+            )
+            return
+
+        if any(drifted.values()):
+            invalidate_cache(*drifted)
+        self.stdout.write(
+            self.style.SUCCESS(f"Assignment counts fixed ({summary})")
+        )
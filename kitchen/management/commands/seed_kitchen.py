@@ -0,0 +1,61 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from kitchen.seeding import DEFAULT_PASSWORD, is_seeded, seed_kitchen
+
+
+class Command(BaseCommand):
+    help = "Generate a deterministic synthetic kitchen for load testing."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dish-types", type=int, default=200)
+        parser.add_argument("--cooks", type=int, default=2000)
+        parser.add_argument("--dishes", type=int, default=10_000)
+        parser.add_argument(
+            "--cooks-per-dish",
+            type=float,
+            default=3,
+            help="Average number of cooks assigned to a dish.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed; the same seed always generates the same data.",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--password",
+            default=DEFAULT_PASSWORD,
+            help="Password of every generated cook.",
+        )
+
+    def handle(self, *args, **options):
+        if options["dish_types"] < 1 and options["dishes"]:
+            raise CommandError("Dishes need at least one dish type")
+        if is_seeded(options["seed"]):
+            raise CommandError(
+                f"Seed {options['seed']} is already loaded, "
+                f"use another --seed"
+            )
+
+        started = time.perf_counter()
+        counts = seed_kitchen(
+            dish_types=options["dish_types"],
+            cooks=options["cooks"],
+            dishes=options["dishes"],
+            cooks_per_dish=options["cooks_per_dish"],
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            password=options["password"],
+        )
+        elapsed = time.perf_counter() - started
+        rows = sum(counts.values())
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {counts['dish_types']} dish types, {counts['cooks']} "
+            f"cooks, {counts['dishes']} dishes and {counts['assignments']} "
+            f"cook assignments in {elapsed:.2f}s "
+            f"({rows / max(elapsed, 1e-9):.0f} rows/s)"
+        ))
@@ -0,0 +1,261 @@
+import json
+import time
+import uuid
+from contextlib import contextmanager
+
+from django.core.cache import cache
+from django.db import transaction
+
+from kitchen.models import Dish, DishType
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+# The menu is materialized per dish type: the dishes of each section and
+# the section encoded in every format. A change re-encodes the sections it
+# touches and the snapshot served to readers joins the encoded sections.
+INDEX_KEY = "kitchen:menu:index"
+SNAPSHOT_KEY = "kitchen:menu:snapshot"
+LOCK_KEY = "kitchen:menu:lock"
+LOCK_TIMEOUT = 30
+
+DISH_FIELDS = ("id", "name", "description", "price")
+
+
+def section_key(pk):
+    return f"kitchen:menu:section:{pk}"
+
+
+def dishes_key(pk):
+    return f"kitchen:menu:dishes:{pk}"
+
+
+def encode_json(value):
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def join_json(version, sections):
+    return b'{"version":%d,"dish_types":[%s]}' % (
+        version,
+        b",".join(sections),
+    )
+
+
+def join_msgpack(version, sections):
+    packer = msgpack.Packer()
+
+    return b"".join([
+        packer.pack_map_header(2),
+        packer.pack("version"),
+        packer.pack(version),
+        packer.pack("dish_types"),
+        packer.pack_array_header(len(sections)),
+        *sections,
+    ])
+
+
+# Format name: (encoder of a section, joiner of encoded sections).
+FORMATS = {"json": (encode_json, join_json)}
+if msgpack is not None:
+    FORMATS["msgpack"] = (msgpack.packb, join_msgpack)
+
+CONTENT_TYPES = {
+    "json": "application/json",
+    "msgpack": "application/msgpack",
+}
+
+
+@contextmanager
+def menu_lock():
+    # Every write of the menu reads the tables while holding the lock, so
+    # it is never replaced by a menu read before the last commit.
+    token = uuid.uuid4().hex
+    while not cache.add(LOCK_KEY, token, LOCK_TIMEOUT):
+        time.sleep(0.01)
+    try:
+        yield
+    finally:
+        # Past LOCK_TIMEOUT the lock may have been taken by another worker,
+        # whose lock stays in place.
+        if cache.get(LOCK_KEY) == token:
+            cache.delete(LOCK_KEY)
+
+
+def get_dish_rows(queryset):
+    for row in queryset.order_by().values(*DISH_FIELDS, "dish_type_id"):
+        row["price"] = str(row["price"])
+        yield row.pop("dish_type_id"), row
+
+
+def get_cached(make_key, pks):
+    keys = {make_key(pk): pk for pk in pks}
+
+    return {keys[key]: value for key, value in cache.get_many(keys).items()}
+
+
+def encode_section(pk, name, dishes):
+    section = {
+        "id": pk,
+        "name": name,
+        "dishes": sorted(dishes.values(), key=lambda dish: dish["name"]),
+    }
+
+    return {
+        "name": name,
+        "empty": not dishes,
+        "content": {
+            format_name: encode(section)
+            for format_name, (encode, _) in FORMATS.items()
+        },
+    }
+
+
+def store(index, sections, dishes, deleted=()):
+    # ``sections`` holds every section of the menu, ``dishes`` the dishes
+    # of the sections that changed.
+    listed = sorted(
+        (section for section in sections.values() if not section["empty"]),
+        key=lambda section: section["name"],
+    )
+    content = {
+        format_name: join(
+            index["version"],
+            [section["content"][format_name] for section in listed],
+        )
+        for format_name, (_, join) in FORMATS.items()
+    }
+    snapshot = {
+        "version": index["version"],
+        "content": content,
+        "etags": {
+            format_name: f'"menu-{index["version"]}-{format_name}"'
+            for format_name in content
+        },
+    }
+
+    cache.set_many(
+        {
+            INDEX_KEY: index,
+            SNAPSHOT_KEY: snapshot,
+            **{section_key(pk): sections[pk] for pk in dishes},
+            **{dishes_key(pk): rows for pk, rows in dishes.items()},
+        },
+        None,
+    )
+    cache.delete_many(
+        [key for pk in deleted for key in (section_key(pk), dishes_key(pk))]
+    )
+    return snapshot
+
+
+def build_menu_snapshot():
+    names = dict(DishType.objects.order_by().values_list("id", "name"))
+    dishes = {pk: {} for pk in names}
+    dish_types = {}
+
+    for dish_type_pk, row in get_dish_rows(Dish.objects.all()):
+        dishes[dish_type_pk][row["id"]] = row
+        dish_types[row["id"]] = dish_type_pk
+
+    # Seeded from the clock so a rebuilt menu never goes back to a version
+    # that readers have already seen.
+    index = {
+        "version": time.time_ns(),
+        "sections": set(names),
+        "dish_types": dish_types,
+    }
+    sections = {
+        pk: encode_section(pk, names[pk], rows)
+        for pk, rows in dishes.items()
+    }
+
+    return store(index, sections, dishes)
+
+
+def get_menu_snapshot():
+    snapshot = cache.get(SNAPSHOT_KEY)
+
+    if snapshot is None:
+        with menu_lock():
+            snapshot = cache.get(SNAPSHOT_KEY)
+            if snapshot is None:
+                snapshot = build_menu_snapshot()
+
+    return snapshot
+
+
+def refresh_menu_snapshot(dishes=(), dish_types=()):
+    # Reloads the given dishes and dish types, dropping the deleted ones
+    # along with the dishes of deleted dish types.
+    with menu_lock():
+        index = cache.get(INDEX_KEY)
+        # Nothing to refresh: the next reader builds the menu afresh.
+        if index is None:
+            return None
+
+        rows = list(get_dish_rows(Dish.objects.filter(pk__in=dishes)))
+        names = dict(
+            DishType.objects.filter(
+                pk__in={*dish_types, *(pk for pk, _ in rows)}
+            ).values_list("id", "name")
+        )
+        # The sections of the dish types and of the dishes, before and
+        # after the change.
+        changed = {
+            *dish_types,
+            *(pk for pk, _ in rows),
+            *(
+                index["dish_types"][pk]
+                for pk in dishes
+                if pk in index["dish_types"]
+            ),
+        }
+        sections = get_cached(section_key, index["sections"])
+        changed_dishes = get_cached(dishes_key, changed & index["sections"])
+
+        if len(sections) != len(index["sections"]) or len(
+            changed_dishes
+        ) != len(changed & index["sections"]):
+            # Parts were evicted, the next reader builds the menu afresh.
+            cache.delete_many([INDEX_KEY, SNAPSHOT_KEY])
+            return None
+
+        deleted = set(dish_types) - set(names)
+        for pk in deleted & index["sections"]:
+            for dish_pk in changed_dishes.pop(pk):
+                index["dish_types"].pop(dish_pk, None)
+            del sections[pk]
+        index["sections"] -= deleted
+
+        for pk in changed - deleted:
+            changed_dishes.setdefault(pk, {})
+        index["sections"] |= changed - deleted
+
+        for pk in dishes:
+            dish_type_pk = index["dish_types"].pop(pk, None)
+            if dish_type_pk in changed_dishes:
+                changed_dishes[dish_type_pk].pop(pk, None)
+        for dish_type_pk, row in rows:
+            changed_dishes[dish_type_pk][row["id"]] = row
+            index["dish_types"][row["id"]] = dish_type_pk
+
+        for pk, section_dishes in changed_dishes.items():
+            name = names[pk] if pk in names else sections[pk]["name"]
+            sections[pk] = encode_section(pk, name, section_dishes)
+        index["version"] += 1
+
+        return store(index, sections, changed_dishes, deleted)
+
+
+def discard_menu_snapshot():
+    with menu_lock():
+        cache.delete_many([INDEX_KEY, SNAPSHOT_KEY])
+
+
+def schedule_menu_refresh(dishes=(), dish_types=()):
+    transaction.on_commit(
+        lambda: refresh_menu_snapshot(dishes=dishes, dish_types=dish_types)
+    )
@@ -0,0 +1,159 @@
+import bisect
+import threading
+
+from kitchen.cache import get_cache_stats
+from kitchen.db.pool import get_pool_stats
+
+
+DURATION_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10
+)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500)
+
+METRICS = {
+    "kitchen_request_duration_seconds": (
+        "Wall time of sampled requests.",
+        DURATION_BUCKETS,
+    ),
+    "kitchen_request_db_seconds": (
+        "Time spent executing SQL per sampled request.",
+        DURATION_BUCKETS,
+    ),
+    "kitchen_request_queries": (
+        "SQL queries per sampled request.",
+        QUERY_BUCKETS,
+    ),
+    "kitchen_request_render_seconds": (
+        "Template render time per sampled request.",
+        DURATION_BUCKETS,
+    ),
+}
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        total = 0
+        for bound, count in zip((*self.buckets, "+Inf"), self.counts):
+            total += count
+            yield bound, total
+
+
+_histograms = {}
+_lock = threading.Lock()
+
+
+def observe(metric, view, value):
+    with _lock:
+        histogram = _histograms.get((metric, view))
+        if histogram is None:
+            histogram = _histograms[metric, view] = Histogram(
+                METRICS[metric][1]
+            )
+        histogram.observe(value)
+
+
+def get_histogram(metric, view):
+    return _histograms.get((metric, view))
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+
+
+def escape_label(value):
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\n", "\\n")
+        .replace('"', '\\"')
+    )
+
+
+def format_number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_prometheus():
+    lines = []
+
+    with _lock:
+        for metric, (description, _) in METRICS.items():
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} histogram")
+
+            for (name, view), histogram in sorted(_histograms.items()):
+                if name != metric:
+                    continue
+                label = f'view="{escape_label(view)}"'
+                for bound, count in histogram.cumulative():
+                    lines.append(
+                        f'{metric}_bucket{{{label},le="{bound}"}} {count}'
+                    )
+                lines.append(
+                    f"{metric}_sum{{{label}}} {format_number(histogram.sum)}"
+                )
+                lines.append(f"{metric}_count{{{label}}} {histogram.count}")
+
+    lines.append("# HELP kitchen_cache_requests_total Cache lookups.")
+    lines.append("# TYPE kitchen_cache_requests_total counter")
+    for name, outcomes in get_cache_stats().items():
+        for outcome, count in outcomes.items():
+            lines.append(
+                f'kitchen_cache_requests_total{{cache="{escape_label(name)}",'
+                f'outcome="{outcome}"}} {count}'
+            )
+
+    pools = get_pool_stats()
+    if pools:
+        lines.extend(render_pool_stats(pools))
+
+    return "\n".join(lines) + "\n"
+
+
+POOL_METRICS = (
+    (
+        "kitchen_db_pool_max_connections",
+        "gauge",
+        "Connection limit of the pool.",
+        None,
+        ("max_size",),
+    ),
+    (
+        "kitchen_db_pool_connections",
+        "gauge",
+        "Pooled connections by state.",
+        "state",
+        ("in_use", "idle"),
+    ),
+    (
+        "kitchen_db_pool_events_total",
+        "counter",
+        "Checkouts, new and dropped connections, waits and timeouts.",
+        "event",
+        ("checkouts", "created", "discarded", "expired", "waits", "timeouts"),
+    ),
+)
+
+
+def render_pool_stats(pools):
+    for metric, kind, description, label, keys in POOL_METRICS:
+        yield f"# HELP {metric} {description}"
+        yield f"# TYPE {metric} {kind}"
+        for alias, stats in pools.items():
+            for key in keys:
+                labels = f'alias="{escape_label(alias)}"'
+                if label:
+                    labels += f',{label}="{key}"'
+                yield f"{metric}{{{labels}}} {stats[key]}"
@@ -0,0 +1,233 @@
+import random
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from kitchen import metrics
+from kitchen.routers import (
+    PIN_SESSION_KEY,
+    ReplicaRouting,
+    current_routing,
+    get_replicas,
+)
+
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class QueryTimer:
+    def __init__(self):
+        self.queries = 0
+        self.duration = 0.0
+
+
+# The timer of the sampled request travels in a context variable, so that
+# queries run by sync_to_async worker threads are attributed to it too.
+# kitchen.signals adds time_query to every new database connection.
+current_timer = ContextVar("kitchen_query_timer", default=None)
+
+
+def time_query(execute, sql, params, many, context):
+    timer = current_timer.get()
+
+    if timer is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timer.queries += 1
+        timer.duration += time.perf_counter() - started
+
+
+class ProfilingMiddleware:
+    # Samples a share of requests and feeds wall, SQL and render timings
+    # into the per-process histograms of kitchen.metrics.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(
+            settings, "KITCHEN_PROFILING_SAMPLE_RATE", 0
+        )
+
+        if self.sample_rate <= 0:
+            raise MiddlewareNotUsed
+
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        if random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        timer, token, started = self.start(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_timer.reset(token)
+
+        self.finish(request, timer, started)
+        return response
+
+    async def __acall__(self, request):
+        if random.random() >= self.sample_rate:
+            return await self.get_response(request)
+
+        timer, token, started = self.start(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_timer.reset(token)
+
+        self.finish(request, timer, started)
+        return response
+
+    def start(self, request):
+        request.profiling_render_time = 0.0
+        timer = QueryTimer()
+
+        return timer, current_timer.set(timer), time.perf_counter()
+
+    def finish(self, request, timer, started):
+        match = request.resolver_match
+        view = match.view_name if match else "<unresolved>"
+        metrics.observe(
+            "kitchen_request_duration_seconds",
+            view,
+            time.perf_counter() - started,
+        )
+        metrics.observe("kitchen_request_queries", view, timer.queries)
+        metrics.observe("kitchen_request_db_seconds", view, timer.duration)
+        metrics.observe(
+            "kitchen_request_render_seconds",
+            view,
+            request.profiling_render_time,
+        )
+
+    def process_template_response(self, request, response):
+        if hasattr(request, "profiling_render_time"):
+            started = time.perf_counter()
+
+            def finish(response):
+                request.profiling_render_time += (
+                    time.perf_counter() - started
+                )
+
+            response.add_post_render_callback(finish)
+
+        return response
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    # WhiteNoise 6.5 is sync-only; one sync middleware would push every
+    # async view of an ASGI deployment back into a worker thread. Outside
+    # DEBUG, static lookups are in-memory and safe on the event loop.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, *args, **kwargs):
+        super().__init__(get_response, *args, **kwargs)
+
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = self.find_file(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
+
+
+class ReplicaRoutingMiddleware:
+    # Sends the reads of views marked ``read_replica = True`` to one of
+    # KITCHEN_READ_REPLICAS. A session that wrote something reads from the
+    # primary for KITCHEN_REPLICA_PIN_SECONDS, so authors see their edits.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.replicas = list(get_replicas())
+
+        if not self.replicas:
+            raise MiddlewareNotUsed
+
+        self.pin_seconds = getattr(settings, "KITCHEN_REPLICA_PIN_SECONDS", 5)
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+            # A coroutine hook keeps the routing context variable in the
+            # request's task instead of a sync_to_async worker thread.
+            self.process_view = self.aprocess_view
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        try:
+            response = self.get_response(request)
+        finally:
+            self.reset(request)
+
+        if request.method not in SAFE_METHODS:
+            self.pin(request)
+        return response
+
+    async def __acall__(self, request):
+        try:
+            response = await self.get_response(request)
+        finally:
+            self.reset(request)
+
+        if request.method not in SAFE_METHODS:
+            await sync_to_async(self.pin)(request)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        self.route(request, view_func)
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        self.route(request, view_func)
+
+    def route(self, request, view_func):
+        view_class = getattr(view_func, "view_class", None)
+
+        if request.method in SAFE_METHODS and getattr(
+            view_class, "read_replica", False
+        ):
+            request.replica_routing_token = current_routing.set(
+                ReplicaRouting(request.session, random.choice(self.replicas))
+            )
+
+    def reset(self, request):
+        token = getattr(request, "replica_routing_token", None)
+        if token is not None:
+            current_routing.reset(token)
+
+    def pin(self, request):
+        if hasattr(request, "session"):
+            request.session[PIN_SESSION_KEY] = time.time() + self.pin_seconds
@@ -0,0 +1,32 @@
+# Generated by Django 4.1 on 2026-10-18 20:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("kitchen", "0003_alter_cook_options"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="KitchenStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("cooks", models.PositiveIntegerField(default=0)),
+                ("dish_types", models.PositiveIntegerField(default=0)),
+                ("dishes", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name_plural": "kitchen stats",
+            },
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations
+
+from kitchen.search import install_search_indexes, uninstall_search_indexes
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("kitchen", "0004_kitchenstats"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            install_search_indexes, uninstall_search_indexes
+        ),
+    ]
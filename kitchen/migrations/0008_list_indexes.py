@@ -0,0 +1,24 @@
+# Generated by Django 4.1 on 2026-10-18 20:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("kitchen", "0007_updated_at_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="cook",
+            index=models.Index(
+                fields=["position", "id"], name="kitchen_cook_position_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dish",
+            index=models.Index(
+                fields=["dish_type", "name"], name="kitchen_dish_type_name_idx"
+            ),
+        ),
+    ]
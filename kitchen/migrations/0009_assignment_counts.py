@@ -0,0 +1,34 @@
+# Generated by Django 4.1 on 2026-10-18 21:46
+
+from django.db import migrations, models
+
+from kitchen.assignments import populate_assignment_counts
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("kitchen", "0008_list_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cook",
+            name="dishes_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="dish",
+            name="cooks_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="cook",
+            index=models.Index(
+                fields=["-dishes_count", "id"],
+                name="kitchen_cook_workload_idx",
+            ),
+        ),
+        migrations.RunPython(
+            populate_assignment_counts, migrations.RunPython.noop
+        ),
+    ]
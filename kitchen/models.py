@@ -16,6 +16,9 @@ class Cook(AbstractUser):
         choices=POSITION_CHOICES,
         default="B"
     )
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    # Maintained by kitchen.signals, see kitchen.assignments.
+    dishes_count = models.PositiveIntegerField(default=0, editable=False)
 
     def __str__(self):
         return f"{self.username} ({self.first_name} {self.last_name})"
@@ -25,15 +28,41 @@ class Cook(AbstractUser):
 
     class Meta:
         ordering = ["position"]
+        indexes = [
+            # Cook lists page through (position, id).
+            models.Index(
+                fields=["position", "id"], name="kitchen_cook_position_idx"
+            ),
+            # The workload page pages through the busiest cooks first.
+            models.Index(
+                fields=["-dishes_count", "id"],
+                name="kitchen_cook_workload_idx",
+            ),
+        ]
 
 
 class DishType(models.Model):
     name = models.CharField(max_length=255, unique=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return self.name
 
 
+class DishQuerySet(models.QuerySet):
+    def with_dish_type(self):
+        return self.select_related("dish_type")
+
+    def with_cooks(self):
+        return self.prefetch_related("cooks")
+
+    def for_list(self):
+        return self.with_dish_type().order_by("name")
+
+    def for_detail(self):
+        return self.with_dish_type().with_cooks()
+
+
 class Dish(models.Model):
     name = models.CharField(max_length=255, unique=True)
     description = models.TextField(null=True, blank=True)
@@ -42,15 +71,85 @@ class Dish(models.Model):
         DishType, related_name="dishes", on_delete=models.CASCADE
     )
     cooks = models.ManyToManyField(Cook, related_name="dishes")
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    # Maintained by kitchen.signals, see kitchen.assignments.
+    cooks_count = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = DishQuerySet.as_manager()
 
     class Meta:
         ordering = ["name"]
         verbose_name_plural = "dishes"
+        indexes = [
+            # Dishes filtered by type are still listed by name.
+            models.Index(
+                fields=["dish_type", "name"], name="kitchen_dish_type_name_idx"
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
 
+class KitchenStats(models.Model):
+    cooks = models.PositiveIntegerField(default=0)
+    dish_types = models.PositiveIntegerField(default=0)
+    dishes = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = "kitchen stats"
+
+    def __str__(self):
+        return (
+            f"cooks: {self.cooks}, dish types: {self.dish_types}, "
+            f"dishes: {self.dishes}"
+        )
+
+    @classmethod
+    def load(cls):
+        try:
+            return cls.objects.get(pk=1)
+        except cls.DoesNotExist:
+            return cls.rebuild()
+
+    @classmethod
+    async def aload(cls):
+        try:
+            return await cls.objects.aget(pk=1)
+        except cls.DoesNotExist:
+            return await cls.arebuild()
+
+    @classmethod
+    def rebuild(cls):
+        stats, _ = cls.objects.update_or_create(
+            pk=1,
+            defaults={
+                "cooks": Cook.objects.count(),
+                "dish_types": DishType.objects.count(),
+                "dishes": Dish.objects.count(),
+            }
+        )
+        return stats
+
+    @classmethod
+    async def arebuild(cls):
+        stats, _ = await cls.objects.aupdate_or_create(
+            pk=1,
+            defaults={
+                "cooks": await Cook.objects.acount(),
+                "dish_types": await DishType.objects.acount(),
+                "dishes": await Dish.objects.acount(),
+            }
+        )
+        return stats
+
+    @classmethod
+    def increment(cls, field, delta=1):
+        cls.objects.filter(pk=1).update(
+            **{field: models.F(field) + delta}
+        )
+
+
 class CookManager(BaseUserManager):
     def create_superuser(self, username, years_of_experience, password):
         user = self.model(
@@ -0,0 +1,277 @@
+import base64
+import binascii
+import json
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import Http404
+
+from kitchen.cache import cached
+
+
+NEXT = "n"
+PREVIOUS = "p"
+
+
+def encode_cursor(direction, values):
+    payload = json.dumps([direction, values], cls=DjangoJSONEncoder)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    try:
+        payload = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        direction, values = json.loads(payload)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise ValueError(f"Invalid cursor: {token!r}")
+
+    if direction not in (NEXT, PREVIOUS) or not isinstance(values, list):
+        raise ValueError(f"Invalid cursor: {token!r}")
+
+    return direction, values
+
+
+def reverse_ordering(ordering):
+    return [
+        field[1:] if field.startswith("-") else f"-{field}"
+        for field in ordering
+    ]
+
+
+def keyset_filter(ordering, values):
+    condition = Q()
+    equal_prefix = Q()
+
+    for field, value in zip(ordering, values):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        condition |= equal_prefix & Q(**{f"{name}__{lookup}": value})
+        equal_prefix &= Q(**{name: value})
+
+    return condition
+
+
+def get_keyset_values(obj, ordering):
+    if isinstance(obj, dict):
+        return [obj[field.lstrip("-")] for field in ordering]
+    return [getattr(obj, field.lstrip("-")) for field in ordering]
+
+
+class KeysetPage:
+    def __init__(self, object_list, ordering, has_next, has_previous):
+        self.object_list = object_list
+        self.ordering = ordering
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __repr__(self):
+        return f"<KeysetPage of {len(self)} objects>"
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    @property
+    def next_cursor(self):
+        if not self.has_next():
+            return None
+        return encode_cursor(
+            NEXT, get_keyset_values(self.object_list[-1], self.ordering)
+        )
+
+    @property
+    def previous_cursor(self):
+        if not self.has_previous():
+            return None
+        return encode_cursor(
+            PREVIOUS, get_keyset_values(self.object_list[0], self.ordering)
+        )
+
+
+def keyset_query(queryset, ordering, page_size, cursor=None):
+    if not cursor:
+        return queryset.order_by(*ordering)[:page_size + 1], None
+
+    direction, values = decode_cursor(cursor)
+
+    if direction == PREVIOUS:
+        ordering = reverse_ordering(ordering)
+
+    return (
+        queryset.filter(keyset_filter(ordering, values))
+        .order_by(*ordering)[:page_size + 1],
+        direction,
+    )
+
+
+def make_keyset_page(object_list, ordering, page_size, direction):
+    has_more = len(object_list) > page_size
+    object_list = object_list[:page_size]
+
+    if direction == PREVIOUS:
+        return KeysetPage(object_list[::-1], ordering, True, has_more)
+    return KeysetPage(object_list, ordering, has_more, direction == NEXT)
+
+
+def paginate_keyset(queryset, ordering, page_size, cursor=None):
+    ordering = list(ordering)
+    queryset, direction = keyset_query(queryset, ordering, page_size, cursor)
+
+    return make_keyset_page(list(queryset), ordering, page_size, direction)
+
+
+def iterate_keyset(queryset, ordering, chunk_size):
+    # Reads a whole ordered queryset one short keyset query per chunk, for
+    # connections that cannot keep a server-side cursor open (PgBouncer).
+    ordering = list(ordering)
+    chunk = list(queryset.order_by(*ordering)[:chunk_size])
+
+    while chunk:
+        yield from chunk
+        if len(chunk) < chunk_size:
+            return
+        values = get_keyset_values(chunk[-1], ordering)
+        chunk = list(
+            queryset.filter(keyset_filter(ordering, values))
+            .order_by(*ordering)[:chunk_size]
+        )
+
+
+async def apaginate_keyset(queryset, ordering, page_size, cursor=None):
+    ordering = list(ordering)
+    queryset, direction = keyset_query(queryset, ordering, page_size, cursor)
+    object_list = [obj async for obj in queryset]
+
+    return make_keyset_page(object_list, ordering, page_size, direction)
+
+
+class KeysetPaginationMixin:
+    keyset_ordering = None
+    cursor_kwarg = "cursor"
+
+    def get_keyset_ordering(self):
+        if self.keyset_ordering is not None:
+            return self.keyset_ordering
+        return [*self.model._meta.ordering, "pk"]
+
+    def paginate_queryset(self, queryset, page_size):
+        cursor = self.request.GET.get(self.cursor_kwarg)
+
+        try:
+            page = paginate_keyset(
+                queryset, self.get_keyset_ordering(), page_size, cursor
+            )
+        except ValueError as error:
+            raise Http404(str(error))
+
+        return None, page, page.object_list, page.has_other_pages()
+
+    async def apaginate_queryset(self, queryset, page_size):
+        cursor = self.request.GET.get(self.cursor_kwarg)
+
+        try:
+            page = await apaginate_keyset(
+                queryset, self.get_keyset_ordering(), page_size, cursor
+            )
+        except ValueError as error:
+            raise Http404(str(error))
+
+        return None, page, page.object_list, page.has_other_pages()
+
+
+class CachedSearchPaginationMixin(KeysetPaginationMixin):
+    search_form_class = None
+    search_field = None
+
+    def get_search_term(self):
+        # Keyed on the very term the view searches for: terms differing in
+        # case or spacing may match different rows.
+        form = self.search_form_class(self.request.GET)
+
+        if form.is_valid():
+            return form.cleaned_data[self.search_field]
+        return ""
+
+    def get_cache_models(self):
+        return (self.model,)
+
+    def get_cached_page_queryset(self):
+        return self.model._default_manager.all()
+
+    def get_search_page(self, queryset, term, cursor, page_size):
+        page = paginate_keyset(
+            queryset, self.get_keyset_ordering(), page_size, cursor
+        )
+
+        return [obj.pk for obj in page], page.has_next(), page.has_previous()
+
+    def get_cached_search_page(self, queryset, term, page_size):
+        get_search_page = cached(
+            *self.get_cache_models(),
+            name=f"{type(self).__name__}.search",
+            key=lambda queryset, *parts: parts,
+        )(self.get_search_page)
+        cursor = self.request.GET.get(self.cursor_kwarg, "")
+
+        try:
+            return get_search_page(queryset, term, cursor, page_size)
+        except ValueError as error:
+            raise Http404(str(error))
+
+    def get_search_page_queryset(self, pks):
+        return (
+            self.get_cached_page_queryset()
+            .filter(pk__in=pks)
+            .order_by(*self.get_keyset_ordering())
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        term = self.get_search_term()
+
+        if not term:
+            return super().paginate_queryset(queryset, page_size)
+
+        pks, has_next, has_previous = self.get_cached_search_page(
+            queryset, term, page_size
+        )
+        object_list = list(self.get_search_page_queryset(pks))
+        page = KeysetPage(
+            object_list, self.get_keyset_ordering(), has_next, has_previous
+        )
+
+        return None, page, object_list, page.has_other_pages()
+
+    async def apaginate_queryset(self, queryset, page_size):
+        term = self.get_search_term()
+
+        if not term:
+            return await super().apaginate_queryset(queryset, page_size)
+
+        # The cached lookup may run the search query, so it goes through
+        # a worker thread; the page rows themselves are fetched async.
+        pks, has_next, has_previous = await sync_to_async(
+            self.get_cached_search_page
+        )(queryset, term, page_size)
+        object_list = [
+            obj async for obj in self.get_search_page_queryset(pks)
+        ]
+        page = KeysetPage(
+            object_list, self.get_keyset_ordering(), has_next, has_previous
+        )
+
+        return None, page, object_list, page.has_other_pages()
@@ -0,0 +1,134 @@
+import re
+from contextlib import contextmanager
+from urllib.parse import urlencode
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.db import connection
+from django.http import HttpRequest, QueryDict
+from django.urls import resolve, reverse
+
+from kitchen.models import Cook, Dish, DishType
+
+
+# The list and search requests whose queries must stay index-backed. A
+# model class as a parameter value stands for the smallest pk of that model.
+LIST_REQUESTS = (
+    ("kitchen:dish-list", {}),
+    ("kitchen:dish-list", {"name": "dish 42"}),
+    ("kitchen:dish-type-list", {}),
+    ("kitchen:dish-type-list", {"name": "type 4"}),
+    ("kitchen:cook-list", {}),
+    ("kitchen:cook-list", {"username": "cook_42"}),
+    ("kitchen:cook-workload", {}),
+    ("kitchen:api-dish-list", {}),
+    ("kitchen:api-dish-list", {"dish_type": DishType}),
+    ("kitchen:api-dish-list", {"cook": Cook}),
+    ("kitchen:api-cook-list", {}),
+    ("kitchen:api-cook-list", {"q": "cook_42"}),
+    ("kitchen:api-cook-list", {"dish": Dish}),
+    ("kitchen:api-dish-type-list", {}),
+    ("admin:kitchen_dish_changelist", {"dish_type__id__exact": DishType}),
+)
+
+# Full table scans as reported by EXPLAIN; scans of an index or of a
+# full-text virtual table are not flagged.
+SEQUENTIAL_SCANS = {
+    "sqlite": re.compile(r"^SCAN (\S+)$"),
+    "postgresql": re.compile(r"Seq Scan on (\S+)"),
+}
+
+
+class QueryRecorder:
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        query = (sql, tuple(params or ()))
+
+        if sql.lstrip().upper().startswith("SELECT") and (
+            query not in self.queries
+        ):
+            self.queries.append(query)
+
+        return execute(sql, params, many, context)
+
+
+def resolve_params(params):
+    return {
+        name: (
+            value.objects.order_by("pk").values_list("pk", flat=True).first()
+            if isinstance(value, type)
+            else value
+        )
+        for name, value in params.items()
+    }
+
+
+def get_planner_user():
+    # Never saved: the views only read the permissions of request.user.
+    return get_user_model()(
+        pk=0, username="query-planner", is_staff=True, is_superuser=True
+    )
+
+
+@contextmanager
+def caching_disabled():
+    # Swaps the default cache of this thread for a dummy one, so that every
+    # request runs the queries it would run on a cache miss.
+    default = caches["default"]
+    caches["default"] = DummyCache("", {})
+    try:
+        yield
+    finally:
+        caches["default"] = default
+
+
+def build_request(url_name, params):
+    query_string = urlencode(resolve_params(params))
+    request = HttpRequest()
+    request.method = "GET"
+    request.path = request.path_info = reverse(url_name)
+    request.META = {"SCRIPT_NAME": "", "QUERY_STRING": query_string}
+    request.GET = QueryDict(query_string)
+    request.user = get_planner_user()
+    request.resolver_match = resolve(request.path_info)
+
+    return request
+
+
+def record_queries(url_name, params):
+    request = build_request(url_name, params)
+    match = request.resolver_match
+    recorder = QueryRecorder()
+
+    with caching_disabled(), connection.execute_wrapper(recorder):
+        response = match.func(request, *match.args, **match.kwargs)
+        if hasattr(response, "render"):
+            response.render()
+
+    return response.status_code, recorder.queries
+
+
+def explain(sql, params):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"{connection.ops.explain_query_prefix()} {sql}", params
+        )
+        rows = cursor.fetchall()
+
+    return [str(row[-1]) for row in rows]
+
+
+def find_sequential_scans(plan):
+    pattern = SEQUENTIAL_SCANS.get(connection.vendor)
+
+    if pattern is None:
+        return []
+
+    return [
+        match.group(1).strip('"')
+        for match in map(pattern.search, plan)
+        if match
+    ]
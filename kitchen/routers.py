@@ -0,0 +1,69 @@
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils.functional import cached_property
+
+
+PIN_SESSION_KEY = "kitchen_replica_pinned_until"
+
+# Sessions are written on login and read to decide about pinning, so they
+# never come from a replica.
+PRIMARY_ONLY_APPS = {"sessions"}
+
+
+def get_replicas():
+    return getattr(settings, "KITCHEN_READ_REPLICAS", ())
+
+
+class ReplicaRouting:
+    # The replica serving one request. The session is only read once the
+    # request queries the database, and it pins the request to the primary
+    # for a while after each write of that session.
+
+    def __init__(self, session, alias):
+        self.session = session
+        self.alias = alias
+
+    @cached_property
+    def pinned(self):
+        return self.session.get(PIN_SESSION_KEY, 0) > time.time()
+
+
+# Set by kitchen.middleware.ReplicaRoutingMiddleware for the views marked
+# with ``read_replica = True``.
+current_routing = ContextVar("kitchen_replica_routing", default=None)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        routing = current_routing.get()
+
+        # Reads inside a transaction on the primary must see its own
+        # uncommitted writes (TestCase runs every test in one).
+        if (
+            routing is None
+            or model._meta.app_label in PRIMARY_ONLY_APPS
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+            or routing.pinned
+        ):
+            return None
+        return routing.alias
+
+    def db_for_write(self, model, **hints):
+        # Without an answer, Django would save an object loaded from a
+        # replica back to that replica.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *get_replicas()}
+
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in get_replicas():
+            return False
+        return None
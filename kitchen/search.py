@@ -0,0 +1,181 @@
+import sqlite3
+
+from django.conf import settings
+from django.db import connections, router
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+
+SEARCH_INDEXES = (
+    ("kitchen", "Cook", "username"),
+    ("kitchen", "DishType", "name"),
+    ("kitchen", "Dish", "name"),
+)
+
+# The FTS5 trigram tokenizer ships with SQLite 3.34+ and cannot match
+# terms shorter than a single trigram.
+SQLITE_HAS_TRIGRAM = sqlite3.sqlite_version_info >= (3, 34, 0)
+FTS_MIN_LENGTH = 3
+
+
+def fts_table_name(table):
+    return f"{table}_fts"
+
+
+def trigram_index_name(table, column):
+    return f"{table}_{column}_trgm"
+
+
+class SearchBackend:
+    def search(self, queryset, field, term):
+        return queryset.filter(**{f"{field}__icontains": term})
+
+    def install(self, schema_editor, table, column):
+        pass
+
+    def uninstall(self, schema_editor, table, column):
+        pass
+
+
+class PostgresTrigramBackend(SearchBackend):
+    # icontains compiles to UPPER("col"::text) LIKE UPPER(%s) on PostgreSQL,
+    # so a trigram index on the same expression serves it directly.
+
+    def install(self, schema_editor, table, column):
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS "
+            f"{trigram_index_name(table, column)} ON {table} "
+            f"USING gin ((UPPER({column}::text)) gin_trgm_ops)"
+        )
+
+    def uninstall(self, schema_editor, table, column):
+        schema_editor.execute(
+            f"DROP INDEX IF EXISTS {trigram_index_name(table, column)}"
+        )
+
+
+class SQLiteFTSBackend(SearchBackend):
+    def search(self, queryset, field, term):
+        if not SQLITE_HAS_TRIGRAM or len(term) < FTS_MIN_LENGTH:
+            return super().search(queryset, field, term)
+
+        table = fts_table_name(queryset.model._meta.db_table)
+
+        phrase = '"{}"'.format(term.replace('"', '""'))
+
+        return queryset.filter(
+            pk__in=RawSQL(
+                f'SELECT rowid FROM "{table}" WHERE "{table}" MATCH %s',
+                (f"{field} : {phrase}",)
+            )
+        )
+
+    def install(self, schema_editor, table, column):
+        if not SQLITE_HAS_TRIGRAM:
+            return
+
+        fts_table = fts_table_name(table)
+        existing = schema_editor.connection.introspection.table_names()
+
+        schema_editor.execute(
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS "{fts_table}" '
+            f'USING fts5({column}, content="{table}", content_rowid="id", '
+            f'tokenize="trigram")'
+        )
+        schema_editor.execute(
+            f'CREATE TRIGGER IF NOT EXISTS "{fts_table}_ai" '
+            f'AFTER INSERT ON "{table}" BEGIN '
+            f'INSERT INTO "{fts_table}"(rowid, {column}) '
+            f"VALUES (new.id, new.{column}); END"
+        )
+        schema_editor.execute(
+            f'CREATE TRIGGER IF NOT EXISTS "{fts_table}_ad" '
+            f'AFTER DELETE ON "{table}" BEGIN '
+            f'INSERT INTO "{fts_table}"("{fts_table}", rowid, {column}) '
+            f"VALUES ('delete', old.id, old.{column}); END"
+        )
+        schema_editor.execute(
+            f'CREATE TRIGGER IF NOT EXISTS "{fts_table}_au" '
+            f'AFTER UPDATE OF {column} ON "{table}" BEGIN '
+            f'INSERT INTO "{fts_table}"("{fts_table}", rowid, {column}) '
+            f"VALUES ('delete', old.id, old.{column}); "
+            f'INSERT INTO "{fts_table}"(rowid, {column}) '
+            f"VALUES (new.id, new.{column}); END"
+        )
+
+        if fts_table not in existing:
+            schema_editor.execute(
+                f'INSERT INTO "{fts_table}"("{fts_table}") '
+                f"VALUES ('rebuild')"
+            )
+
+    def uninstall(self, schema_editor, table, column):
+        fts_table = fts_table_name(table)
+
+        for suffix in ("ai", "ad", "au"):
+            schema_editor.execute(
+                f'DROP TRIGGER IF EXISTS "{fts_table}_{suffix}"'
+            )
+        schema_editor.execute(f'DROP TABLE IF EXISTS "{fts_table}"')
+
+
+BACKENDS = {
+    "postgresql": PostgresTrigramBackend,
+    "sqlite": SQLiteFTSBackend,
+}
+
+
+def get_backend(using="default"):
+    backend_path = getattr(settings, "KITCHEN_SEARCH_BACKEND", None)
+
+    if backend_path:
+        return import_string(backend_path)()
+
+    return BACKENDS.get(connections[using].vendor, SearchBackend)()
+
+
+def search(queryset, field, term):
+    term = term.strip()
+
+    if not term:
+        return queryset
+
+    return get_backend(queryset.db).search(queryset, field, term)
+
+
+def install_search_indexes(apps, schema_editor):
+    backend = get_backend(schema_editor.connection.alias)
+
+    for app_label, model_name, column in SEARCH_INDEXES:
+        model = apps.get_model(app_label, model_name)
+
+        if router.allow_migrate_model(schema_editor.connection.alias, model):
+            backend.install(schema_editor, model._meta.db_table, column)
+
+
+def uninstall_search_indexes(apps, schema_editor):
+    backend = get_backend(schema_editor.connection.alias)
+
+    for app_label, model_name, column in SEARCH_INDEXES:
+        model = apps.get_model(app_label, model_name)
+
+        if router.allow_migrate_model(schema_editor.connection.alias, model):
+            backend.uninstall(schema_editor, model._meta.db_table, column)
+
+
+def reattach_search_triggers(apps, using):
+    # SQLite rebuilds a table on most ALTER operations, which drops its
+    # triggers, so they are re-created after every migrate.
+    backend = get_backend(using)
+    fts_tables = connections[using].introspection.table_names()
+
+    if not isinstance(backend, SQLiteFTSBackend):
+        return
+
+    with connections[using].schema_editor() as schema_editor:
+        for app_label, model_name, column in SEARCH_INDEXES:
+            table = apps.get_model(app_label, model_name)._meta.db_table
+
+            if fts_table_name(table) in fts_tables:
+                backend.install(schema_editor, table, column)
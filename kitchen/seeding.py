@@ -0,0 +1,210 @@
+import random
+from itertools import chain, islice
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection, models, transaction
+from django.utils import timezone
+
+from kitchen.assignments import reconcile_assignment_counts
+from kitchen.menu import discard_menu_snapshot
+from kitchen.models import Cook, Dish, DishType, KitchenStats
+from kitchen.signals import invalidate_cache
+
+
+DEFAULT_PASSWORD = "kitchen12345"
+
+
+def batched(rows, size):
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def get_prepared_defaults(model, columns):
+    now = timezone.now()
+    defaults = {}
+
+    for field in model._meta.concrete_fields:
+        if field.name in columns or isinstance(field, models.AutoField):
+            continue
+        if getattr(field, "auto_now", False) or getattr(
+            field, "auto_now_add", False
+        ):
+            value = now
+        else:
+            value = field.get_default()
+        defaults[field.column] = field.get_db_prep_save(value, connection)
+
+    return defaults
+
+
+# Rows are tuples of database-ready values: skipping model instances and
+# per-value field preparation is what makes million-row seeding fast.
+def insert_rows(model, columns, rows, batch_size):
+    defaults = get_prepared_defaults(model, columns)
+    column_names = [model._meta.get_field(name).column for name in columns]
+    column_names.extend(defaults)
+    default_values = tuple(defaults.values())
+
+    max_params = connection.features.max_query_params
+    if max_params:
+        batch_size = min(batch_size, max_params // len(column_names))
+
+    quote = connection.ops.quote_name
+    insert_sql = "INSERT INTO {} ({}) VALUES ".format(
+        quote(model._meta.db_table),
+        ", ".join(quote(name) for name in column_names),
+    )
+    placeholder = "({})".format(", ".join(["%s"] * len(column_names)))
+    inserted = 0
+
+    with connection.cursor() as cursor:
+        for batch in batched(rows, batch_size):
+            cursor.execute(
+                insert_sql + ", ".join([placeholder] * len(batch)),
+                list(
+                    chain.from_iterable(row + default_values for row in batch)
+                ),
+            )
+            inserted += len(batch)
+
+    return inserted
+
+
+def next_pk(model):
+    last = model.objects.aggregate(last=models.Max("pk"))["last"]
+    return (last or 0) + 1
+
+
+def reset_sequences(*model_classes):
+    statements = connection.ops.sequence_reset_sql(no_style(), model_classes)
+    with connection.cursor() as cursor:
+        for sql in statements:
+            cursor.execute(sql)
+
+
+def pick_cooks(rng, cook_pks, cooks_per_dish):
+    if not cooks_per_dish or not cook_pks:
+        return ()
+
+    count = min(
+        round(rng.expovariate(1 / cooks_per_dish)), len(cook_pks) // 2
+    )
+    picked = set()
+
+    # Squaring the uniform draw skews assignments towards the first cooks,
+    # so a few busy cooks carry many dishes like in a real kitchen.
+    while len(picked) < count:
+        picked.add(cook_pks[int(len(cook_pks) * rng.random() ** 2)])
+
+    return picked
+
+
+def seeded_prefix(seed):
+    return f"s{seed}"
+
+
+def is_seeded(seed):
+    return DishType.objects.filter(
+        name__startswith=f"{seeded_prefix(seed)} "
+    ).exists()
+
+
+@transaction.atomic
+def seed_kitchen(
+    dish_types=200,
+    cooks=2000,
+    dishes=10_000,
+    cooks_per_dish=3,
+    seed=0,
+    batch_size=5000,
+    password=DEFAULT_PASSWORD,
+):
+    rng = random.Random(seed)
+    prefix = seeded_prefix(seed)
+    hashed_password = make_password(password)
+
+    first = next_pk(DishType)
+    dish_type_pks = range(first, first + dish_types)
+    insert_rows(
+        DishType,
+        ("id", "name"),
+        (
+            (pk, f"{prefix} dish type {index}")
+            for index, pk in enumerate(dish_type_pks)
+        ),
+        batch_size,
+    )
+
+    first = next_pk(Cook)
+    cook_pks = range(first, first + cooks)
+    insert_rows(
+        Cook,
+        (
+            "id",
+            "username",
+            "password",
+            "first_name",
+            "last_name",
+            "position",
+            "years_of_experience",
+        ),
+        (
+            (
+                pk,
+                f"{prefix}_cook_{index}",
+                hashed_password,
+                f"First{index}",
+                f"Last{index}",
+                "A" if rng.random() < 0.1 else "B",
+                rng.randint(0, 30),
+            )
+            for index, pk in enumerate(cook_pks)
+        ),
+        batch_size,
+    )
+
+    first = next_pk(Dish)
+    dish_pks = range(first, first + dishes)
+    insert_rows(
+        Dish,
+        ("id", "name", "description", "price", "dish_type"),
+        (
+            (
+                pk,
+                f"{prefix} dish {index}",
+                f"Description of dish {index}",
+                "{}.{:02d}".format(*divmod(rng.randint(100, 99_999), 100)),
+                rng.choice(dish_type_pks),
+            )
+            for index, pk in enumerate(dish_pks)
+        ),
+        batch_size,
+    )
+
+    assignments = insert_rows(
+        Dish.cooks.through,
+        ("dish", "cook"),
+        (
+            (dish_pk, cook_pk)
+            for dish_pk in dish_pks
+            for cook_pk in pick_cooks(rng, cook_pks, cooks_per_dish)
+        ),
+        batch_size,
+    )
+
+    reset_sequences(DishType, Cook, Dish)
+    KitchenStats.rebuild()
+    # The assignments were inserted without m2m_changed.
+    reconcile_assignment_counts()
+    invalidate_cache(Cook, Dish, DishType)
+    # Bulk inserts bypass the menu signals.
+    transaction.on_commit(discard_menu_snapshot)
+
+    return {
+        "dish_types": dish_types,
+        "cooks": cooks,
+        "dishes": dishes,
+        "assignments": assignments,
+    }
@@ -0,0 +1,180 @@
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models import F
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_migrate,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from kitchen.cache import bump_model_version
+from kitchen.live import hub
+from kitchen.menu import schedule_menu_refresh
+from kitchen.middleware import time_query
+from kitchen.models import Cook, Dish, DishType, KitchenStats
+from kitchen.search import reattach_search_triggers
+
+
+STATS_FIELDS = {
+    Cook: "cooks",
+    DishType: "dish_types",
+    Dish: "dishes",
+}
+
+ASSIGNMENT_COUNT_FIELDS = {
+    Cook: "dishes_count",
+    Dish: "cooks_count",
+}
+
+
+@receiver(post_save, sender=Cook)
+@receiver(post_save, sender=DishType)
+@receiver(post_save, sender=Dish)
+def increment_kitchen_stats(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        KitchenStats.increment(STATS_FIELDS[sender])
+
+
+@receiver(post_delete, sender=Cook)
+@receiver(post_delete, sender=DishType)
+@receiver(post_delete, sender=Dish)
+def decrement_kitchen_stats(sender, instance, **kwargs):
+    KitchenStats.increment(STATS_FIELDS[sender], -1)
+
+
+def invalidate_cache(*models):
+    def bump():
+        for model in models:
+            bump_model_version(model)
+
+    # Bump again on commit so a reader that cached pre-commit rows under
+    # the first bump is invalidated as well.
+    bump()
+    transaction.on_commit(bump)
+
+
+@receiver(post_save, sender=Cook)
+@receiver(post_save, sender=DishType)
+@receiver(post_save, sender=Dish)
+@receiver(post_delete, sender=Cook)
+@receiver(post_delete, sender=DishType)
+@receiver(post_delete, sender=Dish)
+def invalidate_model_cache(sender, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= {"last_login"}:
+        return
+
+    invalidate_cache(sender)
+
+
+@receiver(m2m_changed, sender=Dish.cooks.through)
+def invalidate_dish_cooks_cache(sender, action, **kwargs):
+    if action.startswith("post_"):
+        invalidate_cache(Dish, Cook)
+
+
+def touch(model, pks, **values):
+    model.objects.filter(pk__in=pks).update(
+        updated_at=timezone.now(), **values
+    )
+
+
+def count_assignments(model, pks, delta):
+    field = ASSIGNMENT_COUNT_FIELDS[model]
+    touch(model, pks, **{field: F(field) + delta})
+
+
+def publish_live_changes(model, pks, deleted=False):
+    pks = list(pks)
+
+    transaction.on_commit(lambda: hub.publish_many(model, pks, deleted))
+
+
+@receiver(m2m_changed, sender=Dish.cooks.through)
+def count_dish_cooks(sender, instance, action, reverse, model, pk_set,
+                     **kwargs):
+    # Keeps Dish.cooks_count and Cook.dishes_count in step within the
+    # transaction of the change. Cards, detail pages and live boards show
+    # the other side of the relation, so both ends are refreshed as well.
+    if action == "post_add":
+        delta = 1
+    elif action in ("pre_remove", "pre_clear"):
+        # Counted before the rows go: remove() accepts unrelated objects.
+        related = instance.dishes if reverse else instance.cooks
+        if action == "pre_remove":
+            related = related.filter(pk__in=pk_set)
+        pk_set = set(related.values_list("pk", flat=True))
+        delta = -1
+    else:
+        return
+
+    if not pk_set:
+        return
+
+    count_assignments(type(instance), [instance.pk], delta * len(pk_set))
+    count_assignments(model, pk_set, delta)
+    publish_live_changes(type(instance), [instance.pk])
+    publish_live_changes(model, pk_set)
+
+
+@receiver(post_save, sender=Cook)
+@receiver(post_save, sender=Dish)
+def publish_live_save(sender, instance, update_fields=None, raw=False,
+                      **kwargs):
+    if raw or update_fields and set(update_fields) <= {"last_login"}:
+        return
+
+    publish_live_changes(sender, [instance.pk])
+
+
+@receiver(pre_delete, sender=Cook)
+@receiver(pre_delete, sender=Dish)
+def uncount_deleted_assignments(sender, instance, **kwargs):
+    # Deletes drop the assignments of the instance without m2m_changed.
+    if sender is Cook:
+        model, related = Dish, instance.dishes
+    else:
+        model, related = Cook, instance.cooks
+    pks = list(related.values_list("pk", flat=True))
+
+    if pks:
+        count_assignments(model, pks, -1)
+        invalidate_cache(model)
+        publish_live_changes(model, pks)
+
+
+@receiver(post_delete, sender=Cook)
+@receiver(post_delete, sender=Dish)
+def publish_live_delete(sender, instance, **kwargs):
+    publish_live_changes(sender, [instance.pk], deleted=True)
+
+
+@receiver(post_save, sender=Dish)
+@receiver(post_delete, sender=Dish)
+def refresh_menu_dish(sender, instance, origin=None, **kwargs):
+    # Dishes deleted along with their dish type go with its section.
+    if not isinstance(origin, DishType):
+        schedule_menu_refresh(dishes=[instance.pk])
+
+
+@receiver(post_save, sender=DishType)
+@receiver(post_delete, sender=DishType)
+def refresh_menu_dish_type(sender, instance, **kwargs):
+    schedule_menu_refresh(dish_types=[instance.pk])
+
+
+@receiver(post_migrate)
+def reattach_search_triggers_after_migrate(
+    sender, using, apps=None, **kwargs
+):
+    if sender.label == "kitchen" and apps is not None:
+        reattach_search_triggers(apps, using)
+
+
+@receiver(connection_created)
+def install_query_timer(sender, connection, **kwargs):
+    if time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(time_query)
@@ -0,0 +1,82 @@
+import rcssmin
+import rjsmin
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import ManifestFilesMixin
+from django.core.files.base import ContentFile
+from django.core.files.storage import get_storage_class
+from django.template import engines
+from django.templatetags.static import StaticNode
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+from kitchen.warmup import get_template_names
+
+
+MINIFIERS = {
+    ".css": rcssmin.cssmin,
+    ".js": rjsmin.jsmin,
+}
+
+
+class MinifiedManifestStaticFilesStorage(
+    CompressedManifestStaticFilesStorage
+):
+    # collectstatic pipeline: minify CSS and JS, fingerprint every file
+    # (served with far-future cache headers by WhiteNoise), then write
+    # .gz and .br copies next to them.
+
+    def post_process(self, paths, dry_run=False, **options):
+        if not dry_run:
+            for path in paths:
+                self.minify(path)
+            # Hash the minified copies rather than the sources.
+            paths = {path: (self, path) for path in paths}
+
+        yield from super().post_process(paths, dry_run, **options)
+
+    def minify(self, path):
+        extension = path[path.rfind("."):]
+        minifier = MINIFIERS.get(extension)
+        if minifier is None or path.endswith(f".min{extension}"):
+            return
+
+        with self.open(path) as file:
+            source = file.read().decode()
+        minified = minifier(source)
+
+        if minified != source:
+            self.delete(path)
+            self._save(path, ContentFile(minified.encode()))
+
+
+def get_static_references():
+    # (template, path) of every {% static "literal" %} in the project
+    # templates. Paths built from variables cannot be checked.
+    references = []
+
+    for engine in engines.all():
+        for directory in getattr(engine, "engine", engine).dirs:
+            for name in get_template_names(directory):
+                template = engine.get_template(name).template
+                for node in template.nodelist.get_nodes_by_type(StaticNode):
+                    if isinstance(node.path.var, str):
+                        references.append((name, str(node.path.var)))
+    return references
+
+
+def find_missing_static_files(references):
+    # A storage of its own: staticfiles_storage is lazy and still
+    # unevaluated in a process that did not collect anything.
+    storage = get_storage_class(settings.STATICFILES_STORAGE)()
+
+    if isinstance(storage, ManifestFilesMixin):
+        manifest = storage.load_manifest()
+
+        def exists(path):
+            return path in manifest
+    else:
+        exists = finders.find
+
+    return [
+        (name, path) for name, path in references if not exists(path)
+    ]
@@ -3,10 +3,15 @@ from django import template
 
 register = template.Library()
 
+PAGINATION_PARAMS = ("page", "cursor")
+
 
 @register.simple_tag
 def query_transform(request, **kwargs):
     updated = request.GET.copy()
+    if any(key in kwargs for key in PAGINATION_PARAMS):
+        for key in PAGINATION_PARAMS:
+            updated.pop(key, None)
     for key, value in kwargs.items():
         if value is not None:
             updated[key] = value
@@ -0,0 +1,102 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import skipUnless
+
+from django.test import (
+    AsyncClient,
+    Client,
+    TransactionTestCase,
+    override_settings,
+)
+from django.urls import include, path
+
+from kitchen import api, views
+from kitchen.models import Cook, Dish
+from kitchen.seeding import seed_kitchen
+
+
+DISHES = int(os.getenv("KITCHEN_BENCHMARK_URL_DISHES", 10_000))
+REQUESTS = int(os.getenv("KITCHEN_BENCHMARK_REQUESTS", 200))
+CONCURRENCY = int(os.getenv("KITCHEN_BENCHMARK_CONCURRENCY", 20))
+
+urlpatterns = [
+    path("", include("kitchen.urls", namespace="kitchen")),
+    path("accounts/", include("django.contrib.auth.urls")),
+    path("async/", views.AsyncIndexView.as_view()),
+    path("async/dishes/", views.AsyncDishListView.as_view()),
+    path("async/dishes/<int:pk>/", views.AsyncDishDetailView.as_view()),
+    path("async/api/dishes/", api.AsyncDishApiListView.as_view()),
+    path(
+        "async/api/dishes/<int:pk>/", api.AsyncDishApiDetailView.as_view()
+    ),
+]
+
+
+@skipUnless(os.getenv("KITCHEN_BENCHMARKS"), "set KITCHEN_BENCHMARKS=1")
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncThroughputBenchmark(TransactionTestCase):
+    def setUp(self):
+        seed_kitchen(dishes=DISHES, cooks=DISHES // 5, dish_types=200)
+        client = Client()
+        client.force_login(Cook.objects.order_by("pk").first())
+        self.cookies = client.cookies
+        pk = Dish.objects.order_by("pk").values_list("pk", flat=True)[10]
+        self.paths = (
+            "",
+            "dishes/",
+            "dishes/?name=dish+42",
+            f"dishes/{pk}/",
+            "api/dishes/",
+            f"api/dishes/{pk}/",
+        )
+
+    def run_wsgi(self, url):
+        def fetch(_):
+            client = Client()
+            client.cookies = self.cookies
+            return client.get(url).status_code
+
+        with ThreadPoolExecutor(CONCURRENCY) as executor:
+            return list(executor.map(fetch, range(REQUESTS)))
+
+    async def run_asgi(self, url):
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+
+        async def fetch():
+            async with semaphore:
+                client = AsyncClient()
+                client.cookies = self.cookies
+                return (await client.get(url)).status_code
+
+        return await asyncio.gather(*(fetch() for _ in range(REQUESTS)))
+
+    def measure(self, run):
+        started = time.perf_counter()
+        statuses = run()
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(set(statuses), {200})
+        return REQUESTS / elapsed
+
+    def test_throughput(self):
+        print(
+            f"\nRequests/s over {REQUESTS} requests, {CONCURRENCY} "
+            f"concurrent, {DISHES} dishes"
+        )
+        # The sync views behind ASGI run one at a time in the thread that
+        # Django keeps for them, as they would in an ASGI deployment.
+        print(f"{'path':<28}{'WSGI':>10}{'ASGI sync':>11}{'ASGI async':>12}")
+
+        for url in self.paths:
+            wsgi = self.measure(lambda: self.run_wsgi(f"/{url}"))
+            asgi_sync = self.measure(
+                lambda: asyncio.run(self.run_asgi(f"/{url}"))
+            )
+            asgi = self.measure(
+                lambda: asyncio.run(self.run_asgi(f"/async/{url}"))
+            )
+            print(
+                f"/{url:<27}{wsgi:>10.0f}{asgi_sync:>11.0f}{asgi:>12.0f}"
+            )
@@ -0,0 +1,74 @@
+import os
+import statistics
+import time
+from unittest import skipUnless
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from kitchen.menu import get_menu_snapshot, refresh_menu_snapshot
+from kitchen.models import Dish, DishType
+from kitchen.seeding import seed_kitchen
+
+
+ROUNDS = int(os.getenv("KITCHEN_BENCHMARK_ROUNDS", 5))
+DISHES = int(os.getenv("KITCHEN_BENCHMARK_MENU_DISHES", 10_000))
+
+
+def median_ms(func, rounds=ROUNDS):
+    timings = []
+
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return statistics.median(timings)
+
+
+@skipUnless(os.getenv("KITCHEN_BENCHMARKS"), "set KITCHEN_BENCHMARKS=1")
+class MenuSnapshotBenchmark(TestCase):
+    # The menu endpoint served from its snapshot, against a full rebuild
+    # of the snapshot and the incremental refresh after one change.
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_kitchen(dish_types=50, cooks=100, dishes=DISHES)
+        cls.dish = Dish.objects.order_by("pk").first()
+        cls.dish_type = DishType.objects.order_by("pk").first()
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def rebuild(self):
+        cache.clear()
+        get_menu_snapshot()
+
+    def test_menu_snapshot(self):
+        url = reverse("kitchen:api-menu")
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            warm = median_ms(lambda: self.client.get(url), ROUNDS * 20)
+        self.assertEqual(len(queries), 0)
+
+        timings = {
+            "warm read": warm,
+            "full rebuild": median_ms(self.rebuild),
+            "dish refresh": median_ms(
+                lambda: refresh_menu_snapshot(dishes=[self.dish.pk])
+            ),
+            "dish type refresh": median_ms(
+                lambda: refresh_menu_snapshot(dish_types=[self.dish_type.pk])
+            ),
+        }
+
+        print(f"\nMenu snapshot over {DISHES} dishes (median, ms)")
+        for name, elapsed in timings.items():
+            print(f"{name:<20}{elapsed:>10.2f}")
+
+        self.assertLess(timings["dish refresh"], timings["full rebuild"])
@@ -0,0 +1,62 @@
+import importlib
+import os
+import time
+from unittest import skipUnless
+
+from django.test import Client, SimpleTestCase, override_settings
+from django.urls import reverse
+
+
+REQUESTS = int(os.getenv("KITCHEN_BENCHMARK_REQUESTS", 1000))
+ROUNDS = int(os.getenv("KITCHEN_BENCHMARK_ROUNDS", 5))
+
+
+def load_profile(name):
+    return importlib.import_module(
+        f"restaurant_kitchen_service.settings.{name}"
+    )
+
+
+@skipUnless(os.getenv("KITCHEN_BENCHMARKS"), "set KITCHEN_BENCHMARKS=1")
+class MiddlewareOverheadBenchmark(SimpleTestCase):
+    # Per-request cost of the prod middleware stack against the former
+    # single settings module, which ran the dev stack everywhere and
+    # defaulted to DEBUG on (toolbar active for 127.0.0.1). The anonymous
+    # dish list only redirects to the login page, so the stacks dominate.
+
+    def measure(self, profile, debug=False):
+        with override_settings(
+            DEBUG=debug,
+            INSTALLED_APPS=profile.INSTALLED_APPS,
+            MIDDLEWARE=profile.MIDDLEWARE,
+        ):
+            client = Client()
+            url = reverse("kitchen:dish-list")
+            self.assertEqual(client.get(url).status_code, 302)
+
+            started = time.perf_counter()
+            for _ in range(REQUESTS):
+                client.get(url)
+            return (time.perf_counter() - started) / REQUESTS * 1_000_000
+
+    def test_middleware_overhead(self):
+        dev, prod = load_profile("dev"), load_profile("prod")
+        stacks = {
+            "dev, DEBUG on": (dev, True),
+            "dev, DEBUG off": (dev, False),
+            "prod": (prod, False),
+        }
+        # Alternate the stacks and keep the best round of each.
+        timings = dict.fromkeys(stacks, float("inf"))
+        for _ in range(ROUNDS):
+            for name, (profile, debug) in stacks.items():
+                timings[name] = min(
+                    timings[name], self.measure(profile, debug)
+                )
+
+        print(f"\nMiddleware stacks, best of {ROUNDS} (us/request)")
+        for name, timing in timings.items():
+            print(
+                f"{name:<16}{timing:>10.1f}"
+                f"{timing - timings['prod']:>+10.1f}"
+            )
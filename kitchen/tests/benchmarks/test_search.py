@@ -0,0 +1,67 @@
+import os
+import time
+from decimal import Decimal
+from unittest import skipUnless
+
+from django.test import TestCase
+
+from kitchen.models import Dish, DishType
+from kitchen.search import SearchBackend, get_backend
+
+
+DISHES = int(os.getenv("KITCHEN_BENCHMARK_DISHES", 100_000))
+ROUNDS = 20
+TERMS = ("soup", "0042", "Dish 9999", "tomato", "nothing-like-this")
+
+
+def measure(backend, term):
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        list(
+            backend.search(Dish.objects.order_by("name"), "name", term)
+            .values_list("pk", flat=True)[:7]
+        )
+    return (time.perf_counter() - started) / ROUNDS * 1000
+
+
+@skipUnless(os.getenv("KITCHEN_BENCHMARKS"), "set KITCHEN_BENCHMARKS=1")
+class SearchBenchmark(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        dish_types = DishType.objects.bulk_create(
+            DishType(name=f"Type {index}") for index in range(20)
+        )
+        Dish.objects.bulk_create(
+            (
+                Dish(
+                    name=f"Dish {index} {'soup' if index % 50 else 'tomato'}",
+                    price=Decimal(index % 100),
+                    dish_type=dish_types[index % len(dish_types)],
+                )
+                for index in range(DISHES)
+            ),
+            batch_size=5000,
+        )
+
+    def test_search_latency(self):
+        indexed = get_backend()
+        scan = SearchBackend()
+
+        print(f"\nSearch latency over {DISHES} dishes (ms per query)")
+        print(f"{'term':<20}{'icontains':>12}{type(indexed).__name__:>26}")
+
+        for term in TERMS:
+            self.assertEqual(
+                set(
+                    indexed.search(Dish.objects.all(), "name", term)
+                    .values_list("pk", flat=True)
+                ),
+                set(
+                    scan.search(Dish.objects.all(), "name", term)
+                    .values_list("pk", flat=True)
+                ),
+            )
+            print(
+                f"{term:<20}{measure(scan, term):>12.2f}"
+                f"{measure(indexed, term):>26.2f}"
+            )
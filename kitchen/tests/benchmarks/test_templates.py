@@ -0,0 +1,70 @@
+import os
+import statistics
+import time
+from unittest import skipUnless
+
+from django.core.cache import cache
+from django.template import engines
+from django.test import TestCase
+from django.urls import reverse
+
+from kitchen.models import Cook, Dish
+from kitchen.seeding import seed_kitchen
+from kitchen.warmup import warm_up_templates
+
+
+ROUNDS = int(os.getenv("KITCHEN_BENCHMARK_ROUNDS", 5))
+PAGES = (
+    ("kitchen:index", False),
+    ("kitchen:dish-list", False),
+    ("kitchen:dish-detail", True),
+    ("kitchen:dish-create", False),
+    ("kitchen:cook-list", False),
+    ("kitchen:dish-type-list", False),
+)
+
+
+@skipUnless(os.getenv("KITCHEN_BENCHMARKS"), "set KITCHEN_BENCHMARKS=1")
+class FirstRequestBenchmark(TestCase):
+    # First request of a fresh worker, with and without the template
+    # warm-up done at boot.
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_kitchen(dish_types=20, cooks=100, dishes=500)
+        cls.user = Cook.objects.create_superuser(
+            username="benchmark", password="benchmark12345"
+        )
+        cls.dish = Dish.objects.order_by("pk").first()
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.addCleanup(warm_up_templates)
+
+    def first_request(self, url, warm_up):
+        for loader in engines["django"].engine.template_loaders:
+            loader.reset()
+        cache.clear()
+        if warm_up:
+            warm_up_templates()
+
+        started = time.perf_counter()
+        response = self.client.get(url)
+        elapsed = (time.perf_counter() - started) * 1000
+
+        self.assertEqual(response.status_code, 200)
+        return elapsed
+
+    def test_first_request_latency(self):
+        print(f"\nFirst request latency (median of {ROUNDS}, ms)")
+        print(f"{'page':<24}{'cold':>10}{'warmed up':>12}")
+
+        for name, detail in PAGES:
+            url = reverse(name, args=[self.dish.pk] if detail else [])
+            cold, warm = (
+                statistics.median(
+                    self.first_request(url, warm_up) for _ in range(ROUNDS)
+                )
+                for warm_up in (False, True)
+            )
+            print(f"{name:<24}{cold:>10.2f}{warm:>12.2f}")
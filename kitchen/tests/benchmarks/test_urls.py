@@ -0,0 +1,289 @@
+import json
+import os
+import statistics
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from unittest import mock, skipUnless
+
+from django.core.cache import cache
+from django.db import connection
+from django.template import Context
+from django.template.base import Template
+from django.test import TestCase
+from django.urls import URLPattern, reverse
+
+from kitchen import urls
+from kitchen.models import Cook, Dish, DishType
+from kitchen.seeding import seed_kitchen
+
+
+VOLUMES = {
+    "dish_types": int(os.getenv("KITCHEN_BENCHMARK_DISH_TYPES", 200)),
+    "cooks": int(os.getenv("KITCHEN_BENCHMARK_COOKS", 2000)),
+    "dishes": int(os.getenv("KITCHEN_BENCHMARK_URL_DISHES", 10_000)),
+}
+ROUNDS = int(os.getenv("KITCHEN_BENCHMARK_ROUNDS", 5))
+THRESHOLD = float(os.getenv("KITCHEN_BENCHMARK_THRESHOLD", 0.5))
+SLACK_MS = 5
+CALIBRATION_ROUNDS = ROUNDS * 4
+BASELINE = Path(
+    os.getenv(
+        "KITCHEN_BENCHMARK_BASELINE",
+        Path(__file__).with_name("baseline.json"),
+    )
+)
+UPDATE_BASELINE = bool(os.getenv("KITCHEN_BENCHMARK_UPDATE"))
+
+EXTRA_REQUESTS = {
+    "dish-list": ({"name": "dish 42"},),
+    "cook-list": ({"username": "cook_42"},),
+    "dish-type-list": ({"name": "type 4"},),
+    "api-dish-list": ({"q": "dish 42"},),
+    "api-cook-list": ({"q": "cook_42"},),
+}
+TIMED_METRICS = ("total_ms", "db_ms", "render_ms")
+# A fixed query and render timed before the URLs. The baseline stores
+# latencies as multiples of it, so a faster or slower machine scales them
+# instead of passing or failing every route.
+CALIBRATION_TEMPLATE = (
+    "{% for pk, name in dishes %}<p>{{ pk }} {{ name }}</p>{% endfor %}"
+)
+# The event stream never ends, so it cannot be timed like a page.
+SKIPPED_ROUTES = {"live-events"}
+
+
+class Recorder:
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.render_time = 0.0
+        self.render_depth = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += time.perf_counter() - started
+
+    def wrap_render(self, render):
+        recorder = self
+
+        def timed_render(template, context):
+            recorder.render_depth += 1
+            started = time.perf_counter()
+            try:
+                return render(template, context)
+            finally:
+                recorder.render_depth -= 1
+                if not recorder.render_depth:
+                    recorder.render_time += time.perf_counter() - started
+
+        return timed_render
+
+
+def kitchen_routes():
+    for pattern in urls.urlpatterns:
+        if (
+            isinstance(pattern, URLPattern)
+            and pattern.name not in SKIPPED_ROUTES
+        ):
+            yield pattern.name, "pk" in pattern.pattern.converters
+
+
+def route_model(name):
+    name = name.removeprefix("api-")
+    if name.startswith("dish-type"):
+        return DishType
+    if name.startswith(("cook", "chef")):
+        return Cook
+    return Dish
+
+
+@skipUnless(os.getenv("KITCHEN_BENCHMARKS"), "set KITCHEN_BENCHMARKS=1")
+class UrlBenchmark(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_kitchen(**VOLUMES)
+        cls.user = Cook.objects.create_superuser(
+            username="benchmark", password="benchmark12345"
+        )
+        cls.pks = {
+            DishType: DishType.objects.order_by("pk").values_list(
+                "pk", flat=True
+            )[VOLUMES["dish_types"] // 2],
+            Cook: Cook.objects.filter(dishes__isnull=False)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+            .first(),
+            Dish: Dish.objects.filter(cooks__isnull=False)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+            .first(),
+        }
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def get_requests(self):
+        for name, has_pk in kitchen_routes():
+            kwargs = {"pk": self.pks[route_model(name)]} if has_pk else {}
+            url = reverse(f"kitchen:{name}", kwargs=kwargs)
+            yield name, url, {}
+            for index, params in enumerate(EXTRA_REQUESTS.get(name, ())):
+                yield f"{name}?{index}", url, params
+
+    def calibrate(self):
+        template = Template(CALIBRATION_TEMPLATE)
+
+        def workload():
+            dishes = list(
+                Dish.objects.order_by("pk").values_list("pk", "name")[:1000]
+            )
+            template.render(Context({"dishes": dishes}))
+
+        workload()
+        timings = []
+        for _ in range(CALIBRATION_ROUNDS):
+            started = time.perf_counter()
+            workload()
+            timings.append((time.perf_counter() - started) * 1000)
+
+        return statistics.median(timings)
+
+    def measure(self, url, params):
+        rounds = []
+        # The first request pays for imports and template compilation.
+        self.client.get(url, params)
+
+        for _ in range(ROUNDS):
+            cache.clear()
+            recorder = Recorder()
+            with ExitStack() as stack:
+                stack.enter_context(connection.execute_wrapper(recorder))
+                stack.enter_context(
+                    mock.patch.object(
+                        Template,
+                        "render",
+                        recorder.wrap_render(Template.render),
+                    )
+                )
+                started = time.perf_counter()
+                response = self.client.get(url, params)
+                if response.streaming:
+                    b"".join(response.streaming_content)
+                total = time.perf_counter() - started
+
+            self.assertEqual(response.status_code, 200, url)
+            rounds.append(
+                {
+                    "queries": recorder.queries,
+                    "total_ms": total * 1000,
+                    "db_ms": recorder.db_time * 1000,
+                    "render_ms": recorder.render_time * 1000,
+                }
+            )
+
+        result = {"queries": max(r["queries"] for r in rounds)}
+        for metric in TIMED_METRICS:
+            result[metric] = round(
+                statistics.median(r[metric] for r in rounds), 2
+            )
+        return result
+
+    def find_regressions(self, results, baseline, calibration_ms):
+        # Query counts must match exactly: fewer queries are recorded with
+        # KITCHEN_BENCHMARK_UPDATE=1 like any other intended change.
+        regressions = []
+
+        for name, result in results.items():
+            expected = baseline.get(name)
+            if expected is None:
+                continue
+            if result["queries"] != expected["queries"]:
+                regressions.append(
+                    f"{name}: {result['queries']} queries "
+                    f"(baseline {expected['queries']})"
+                )
+            for metric in TIMED_METRICS:
+                expected_ms = (
+                    expected[metric.removesuffix("_ms")] * calibration_ms
+                )
+                limit = expected_ms * (1 + THRESHOLD) + SLACK_MS
+                if result[metric] > limit:
+                    regressions.append(
+                        f"{name}: {metric} {result[metric]:.2f} "
+                        f"(baseline {expected_ms:.2f}, "
+                        f"limit {limit:.2f})"
+                    )
+
+        return regressions
+
+    def test_url_regressions(self):
+        calibration_ms = self.calibrate()
+        results = {
+            name: self.measure(url, params)
+            for name, url, params in self.get_requests()
+        }
+
+        print(
+            f"\nKitchen URLs over {VOLUMES} "
+            f"(median of {ROUNDS}, cold cache, "
+            f"calibration {calibration_ms:.2f} ms)"
+        )
+        print(
+            f"{'route':<28}{'queries':>8}{'total ms':>10}"
+            f"{'db ms':>10}{'render ms':>11}"
+        )
+        for name, result in results.items():
+            print(
+                f"{name:<28}{result['queries']:>8}"
+                f"{result['total_ms']:>10.2f}{result['db_ms']:>10.2f}"
+                f"{result['render_ms']:>11.2f}"
+            )
+
+        baseline = (
+            json.loads(BASELINE.read_text()) if BASELINE.exists() else None
+        )
+        if (
+            UPDATE_BASELINE
+            or baseline is None
+            or baseline["volumes"] != VOLUMES
+            or "calibration_ms" not in baseline
+        ):
+            relative = {
+                name: {
+                    "queries": result["queries"],
+                    **{
+                        metric.removesuffix("_ms"): round(
+                            result[metric] / calibration_ms, 3
+                        )
+                        for metric in TIMED_METRICS
+                    },
+                }
+                for name, result in results.items()
+            }
+            BASELINE.write_text(
+                json.dumps(
+                    {
+                        "volumes": VOLUMES,
+                        # Timings are stored in units of the calibration.
+                        "calibration_ms": round(calibration_ms, 2),
+                        "results": relative,
+                    },
+                    indent=2,
+                )
+                + "\n"
+            )
+            print(f"Baseline written to {BASELINE}")
+            return
+
+        regressions = self.find_regressions(
+            results, baseline["results"], calibration_ms
+        )
+        self.assertFalse(
+            regressions,
+            "Regressions against the baseline:\n" + "\n".join(regressions),
+        )
@@ -0,0 +1,150 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from kitchen.analytics import get_kitchen_analytics
+from kitchen.models import Dish, DishType
+
+
+ANALYTICS_URL = reverse("kitchen:analytics")
+ANALYTICS_API_URL = reverse("kitchen:api-analytics")
+
+
+class KitchenAnalyticsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        cooks = [
+            get_user_model().objects.create_user(
+                username=f"cook_{index}",
+                position=position,
+                years_of_experience=years,
+            )
+            for index, (position, years) in enumerate(
+                [("A", 12), ("A", 6), ("B", 1), ("B", 3), ("B", None)]
+            )
+        ]
+        self.chef = cooks[0]
+        self.soups = DishType.objects.create(name="Soups")
+        self.desserts = DishType.objects.create(name="Desserts")
+        DishType.objects.create(name="Drinks")
+
+        borscht = Dish.objects.create(
+            name="Borscht", price=5, dish_type=self.soups
+        )
+        ramen = Dish.objects.create(
+            name="Ramen", price="8.50", dish_type=self.soups
+        )
+        Dish.objects.create(name="Cake", price=4, dish_type=self.desserts)
+        borscht.cooks.add(*cooks[:3])
+        ramen.cooks.add(cooks[0])
+
+    def test_dish_type_stats(self):
+        self.assertEqual(
+            get_kitchen_analytics()["dish_types"],
+            [
+                {
+                    "id": self.desserts.id,
+                    "name": "Desserts",
+                    "dishes": 1,
+                    "average_price": Decimal("4.00"),
+                    "assignments": 0,
+                },
+                {
+                    "id": DishType.objects.get(name="Drinks").id,
+                    "name": "Drinks",
+                    "dishes": 0,
+                    "average_price": None,
+                    "assignments": 0,
+                },
+                {
+                    "id": self.soups.id,
+                    "name": "Soups",
+                    "dishes": 2,
+                    "average_price": Decimal("6.75"),
+                    "assignments": 4,
+                },
+            ],
+        )
+
+    def test_cooks_per_dish_and_totals(self):
+        analytics = get_kitchen_analytics()
+
+        self.assertEqual(
+            analytics["cooks_per_dish"],
+            [
+                {"cooks": 0, "dishes": 1},
+                {"cooks": 1, "dishes": 1},
+                {"cooks": 3, "dishes": 1},
+            ],
+        )
+        self.assertEqual(
+            analytics["totals"],
+            {
+                "dishes": 3,
+                "average_price": Decimal("5.83"),
+                "average_cooks": 1.3,
+                "unassigned": 1,
+            },
+        )
+
+    def test_experience_by_position(self):
+        chefs, cooks = get_kitchen_analytics()["positions"]
+
+        self.assertEqual(chefs["name"], "chef")
+        self.assertEqual(chefs["cooks"], 2)
+        self.assertEqual(chefs["average_experience"], 9.0)
+        self.assertEqual(
+            chefs["experience"],
+            {"0-1": 0, "2-4": 0, "5-9": 1, "10+": 1, "unknown": 0},
+        )
+        self.assertEqual(cooks["average_experience"], 2.0)
+        self.assertEqual(
+            cooks["experience"],
+            {"0-1": 1, "2-4": 1, "5-9": 0, "10+": 0, "unknown": 1},
+        )
+
+    def test_one_query_per_part_and_cached(self):
+        with CaptureQueriesContext(connection) as queries:
+            get_kitchen_analytics()
+        self.assertEqual(len(queries), 4)
+
+        with CaptureQueriesContext(connection) as queries:
+            get_kitchen_analytics()
+        self.assertEqual(len(queries), 0)
+
+    def test_writes_invalidate_the_cache(self):
+        get_kitchen_analytics()
+
+        Dish.objects.create(name="Tea", price=2, dish_type=self.soups)
+        self.assertEqual(get_kitchen_analytics()["totals"]["dishes"], 4)
+
+        self.chef.dishes.add(Dish.objects.get(name="Cake"))
+        self.assertEqual(get_kitchen_analytics()["totals"]["unassigned"], 1)
+
+        self.chef.years_of_experience = 2
+        self.chef.save()
+        chefs = get_kitchen_analytics()["positions"][0]
+        self.assertEqual(chefs["experience"]["2-4"], 1)
+
+    def test_login_required(self):
+        self.assertNotEqual(self.client.get(ANALYTICS_URL).status_code, 200)
+        self.assertEqual(self.client.get(ANALYTICS_API_URL).status_code, 403)
+
+    def test_page_and_json_endpoint(self):
+        self.client.force_login(self.chef)
+
+        response = self.client.get(ANALYTICS_URL)
+        self.assertContains(response, "Experience by position")
+        self.assertContains(response, "6.75")
+        self.assertIn("ETag", response.headers)
+
+        data = self.client.get(ANALYTICS_API_URL).json()
+        self.assertEqual(data["totals"]["average_price"], "5.83")
+        self.assertEqual(data["dish_types"][2]["name"], "Soups")
@@ -0,0 +1,163 @@
+import json
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+
+from kitchen.models import Dish, DishType
+
+DISH_API_URL = reverse("kitchen:api-dish-list")
+DISH_EXPORT_URL = reverse("kitchen:api-dish-export")
+
+
+class PublicApiTests(TestCase):
+    def test_login_required(self):
+        for url in (
+            DISH_API_URL,
+            DISH_EXPORT_URL,
+            reverse("kitchen:api-cook-list"),
+            reverse("kitchen:api-dish-type-list"),
+        ):
+            self.assertEqual(self.client.get(url).status_code, 403)
+
+
+class PrivateApiTests(TestCase):
+    def setUp(self) -> None:
+        self.cook = get_user_model().objects.create_user(
+            username="test_cook",
+            password="test_1234",
+            position="A",
+        )
+        self.soups = DishType.objects.create(name="Soups")
+        self.desserts = DishType.objects.create(name="Desserts")
+        for index in range(5):
+            dish = Dish.objects.create(
+                name=f"Soup {index}",
+                price=5,
+                dish_type=self.soups,
+            )
+            if index % 2:
+                dish.cooks.add(self.cook)
+        Dish.objects.create(name="Cake", price=7, dish_type=self.desserts)
+
+        self.client.force_login(self.cook)
+
+    def names(self, response):
+        return [row["name"] for row in response.json()["results"]]
+
+    def test_dish_list_is_cursor_paginated(self):
+        first = self.client.get(DISH_API_URL, {"limit": 4})
+        self.assertEqual(
+            self.names(first), ["Cake", "Soup 0", "Soup 1", "Soup 2"]
+        )
+        self.assertEqual(
+            first.json()["results"][0],
+            {
+                "id": Dish.objects.get(name="Cake").id,
+                "name": "Cake",
+                "description": None,
+                "price": "7.00",
+                "dish_type_id": self.desserts.id,
+            }
+        )
+
+        second = self.client.get(
+            DISH_API_URL, {"limit": 4, "cursor": first.json()["next"]}
+        )
+        self.assertEqual(self.names(second), ["Soup 3", "Soup 4"])
+        self.assertIsNone(second.json()["next"])
+
+    def test_dish_filters(self):
+        by_type = self.client.get(
+            DISH_API_URL, {"dish_type": self.desserts.id}
+        )
+        self.assertEqual(self.names(by_type), ["Cake"])
+
+        by_cook = self.client.get(DISH_API_URL, {"cook": self.cook.id})
+        self.assertEqual(self.names(by_cook), ["Soup 1", "Soup 3"])
+
+    def test_invalid_parameters(self):
+        for params in ({"cook": "x"}, {"limit": 0}, {"cursor": "broken"}):
+            response = self.client.get(DISH_API_URL, params)
+
+            self.assertEqual(response.status_code, 400)
+            self.assertIn("error", response.json())
+
+    def test_dish_detail(self):
+        dish = Dish.objects.get(name="Soup 1")
+
+        response = self.client.get(
+            reverse("kitchen:api-dish-detail", kwargs={"pk": dish.pk})
+        )
+
+        self.assertEqual(response.json()["cooks"], [self.cook.id])
+        self.assertEqual(
+            self.client.get(
+                reverse("kitchen:api-dish-detail", kwargs={"pk": 404})
+            ).status_code,
+            404
+        )
+
+    def test_cooks_and_dish_types(self):
+        cooks = self.client.get(reverse("kitchen:api-cook-list"))
+        self.assertEqual(
+            cooks.json()["results"][0]["username"], "test_cook"
+        )
+        self.assertNotIn("password", cooks.json()["results"][0])
+
+        dish_types = self.client.get(reverse("kitchen:api-dish-type-list"))
+        self.assertEqual(self.names(dish_types), ["Desserts", "Soups"])
+
+        detail = self.client.get(
+            reverse(
+                "kitchen:api-dish-type-detail", kwargs={"pk": self.soups.pk}
+            )
+        )
+        self.assertEqual(detail.json()["name"], "Soups")
+
+    def test_cook_search(self):
+        get_user_model().objects.create_user(username="pastry_chef")
+
+        response = self.client.get(
+            reverse("kitchen:api-cook-list"), {"q": "pastry"}
+        )
+
+        self.assertEqual(
+            [cook["username"] for cook in response.json()["results"]],
+            ["pastry_chef"]
+        )
+
+    def test_export_streams_ndjson(self):
+        response = self.client.get(
+            DISH_EXPORT_URL, {"dish_type": self.soups.id}
+        )
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]["name"], "Soup 0")
+
+    @mock.patch("kitchen.api.EXPORT_CHUNK_SIZE", 2)
+    def test_export_without_server_side_cursors_reads_keyset_chunks(self):
+        with mock.patch.dict(
+            connection.settings_dict, {"DISABLE_SERVER_SIDE_CURSORS": True}
+        ), self.assertNumQueries(5):  # session, user and three chunks
+            response = self.client.get(
+                DISH_EXPORT_URL, {"dish_type": self.soups.id}
+            )
+            rows = [
+                json.loads(line)
+                for line in b"".join(response.streaming_content).splitlines()
+            ]
+
+        self.assertEqual(
+            [row["name"] for row in rows],
+            [f"Soup {index}" for index in range(5)],
+        )
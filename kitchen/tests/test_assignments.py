@@ -0,0 +1,167 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from kitchen.assignments import reconcile_assignment_counts
+from kitchen.models import Cook, Dish, DishType
+from kitchen.seeding import seed_kitchen
+
+
+WORKLOAD_URL = reverse("kitchen:cook-workload")
+
+
+class AssignmentCountsTest(TestCase):
+    def setUp(self):
+        self.dish_type = DishType.objects.create(name="Soups")
+        self.cooks = [
+            get_user_model().objects.create_user(username=f"cook_{index}")
+            for index in range(3)
+        ]
+        self.dishes = [
+            Dish.objects.create(
+                name=f"Soup {index}", price=5, dish_type=self.dish_type
+            )
+            for index in range(3)
+        ]
+
+    def assertCounts(self, dishes_counts, cooks_counts):
+        self.assertEqual(
+            list(
+                Cook.objects.order_by("pk").values_list(
+                    "dishes_count", flat=True
+                )
+            ),
+            dishes_counts,
+        )
+        self.assertEqual(
+            list(
+                Dish.objects.order_by("pk").values_list(
+                    "cooks_count", flat=True
+                )
+            ),
+            cooks_counts,
+        )
+        self.assertFalse(any(reconcile_assignment_counts(fix=False).values()))
+
+    def test_add_and_remove_from_both_sides(self):
+        soup, stew, _ = self.dishes
+        first, second, third = self.cooks
+
+        soup.cooks.add(first, second)
+        soup.cooks.add(first)
+        third.dishes.add(soup, stew)
+        self.assertCounts([1, 1, 2], [3, 1, 0])
+
+        # Removing an unassigned cook must not count as a removal.
+        stew.cooks.remove(first, third)
+        second.dishes.remove(soup)
+        self.assertCounts([1, 0, 1], [2, 0, 0])
+
+    def test_set_and_clear(self):
+        soup, stew, _ = self.dishes
+
+        soup.cooks.set(self.cooks)
+        stew.cooks.set(self.cooks[:1])
+        soup.cooks.set(self.cooks[1:])
+        self.assertCounts([1, 1, 1], [2, 1, 0])
+
+        self.cooks[1].dishes.clear()
+        soup.cooks.clear()
+        self.assertCounts([1, 0, 0], [0, 1, 0])
+
+    def test_deletes(self):
+        soup, stew, borscht = self.dishes
+        for dish in self.dishes:
+            dish.cooks.set(self.cooks)
+
+        soup.delete()
+        self.cooks[0].delete()
+        self.assertCounts([2, 2], [2, 2])
+
+        self.dish_type.delete()
+        self.assertCounts([0, 0], [])
+
+    def test_reconcile_fixes_drift(self):
+        self.dishes[0].cooks.set(self.cooks)
+        Cook.objects.update(dishes_count=7)
+        Dish.objects.filter(pk=self.dishes[0].pk).update(cooks_count=0)
+
+        output = StringIO()
+        with self.assertRaisesMessage(CommandError, "cook: 3, dish: 1"):
+            call_command("reconcile_assignment_counts", "--check")
+        call_command("reconcile_assignment_counts", stdout=output)
+
+        self.assertIn("fixed (cook: 3, dish: 1)", output.getvalue())
+        self.assertCounts([1, 1, 1], [3, 0, 0])
+
+    def test_seeded_counts_are_in_step(self):
+        seed_kitchen(dish_types=3, cooks=10, dishes=50)
+
+        self.assertFalse(any(reconcile_assignment_counts(fix=False).values()))
+        self.assertTrue(Dish.objects.filter(cooks_count__gt=0).exists())
+
+
+class CookWorkloadViewTest(TestCase):
+    def setUp(self):
+        dish_type = DishType.objects.create(name="Soups")
+        self.idle, self.busy, self.chef = (
+            get_user_model().objects.create_user(username=username)
+            for username in ("idle", "busy", "chef")
+        )
+        for index in range(3):
+            dish = Dish.objects.create(
+                name=f"Soup {index}", price=5, dish_type=dish_type
+            )
+            dish.cooks.add(self.busy)
+            if index < 2:
+                dish.cooks.add(self.chef)
+        self.client.force_login(self.idle)
+
+    def test_login_required(self):
+        self.client.logout()
+
+        self.assertEqual(self.client.get(WORKLOAD_URL).status_code, 302)
+
+    def test_busiest_cooks_first_without_counting_assignments(self):
+        response, through_queries = self.get_through_table_queries(
+            WORKLOAD_URL
+        )
+
+        self.assertEqual(
+            list(response.context["cook_list"]),
+            [self.busy, self.chef, self.idle],
+        )
+        self.assertEqual(response.context["max_dishes_count"], 3)
+        self.assertContains(response, 'style="width: 67%"')
+        self.assertEqual(through_queries, [])
+
+    def get_through_table_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        return response, [
+            query for query in queries if "kitchen_dish_cooks" in query["sql"]
+        ]
+
+    def test_dish_list_reads_maintained_counts(self):
+        response, through_queries = self.get_through_table_queries(
+            reverse("kitchen:dish-list")
+        )
+
+        self.assertContains(response, "Dish Cooks Number: 2")
+        self.assertEqual(through_queries, [])
+
+    def test_cook_pages_show_counts(self):
+        response = self.client.get(reverse("kitchen:cook-list"))
+        self.assertContains(response, "Dishes: 3")
+
+        response = self.client.get(self.busy.get_absolute_url())
+        self.assertContains(
+            response, '<span data-live-field="dishes_count">3</span>'
+        )
@@ -0,0 +1,234 @@
+import json
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import PermissionDenied
+from django.core.signals import request_finished, request_started
+from django.db import close_old_connections
+from django.http import Http404
+from django.test import AsyncRequestFactory, RequestFactory, TestCase
+from django.urls import reverse
+
+from kitchen import api, views
+from kitchen.async_views import StreamingASGIHandler
+from kitchen.models import Dish, DishType, KitchenStats
+
+
+API_VIEWS = (
+    (api.DishApiListView, api.AsyncDishApiListView, {}, {"limit": 2}),
+    (api.DishApiListView, api.AsyncDishApiListView, {}, {"cook": 1}),
+    (api.CookApiListView, api.AsyncCookApiListView, {}, {"q": "chef"}),
+    (api.DishTypeApiListView, api.AsyncDishTypeApiListView, {}, {}),
+    (api.DishTypeApiDetailView, api.AsyncDishTypeApiDetailView, {}, {}),
+    (api.DishApiListView, api.AsyncDishApiListView, {}, {"limit": "x"}),
+)
+
+
+class AsyncViewsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.chef = get_user_model().objects.create_user(
+            username="chef", position="A"
+        )
+        cls.soups = DishType.objects.create(name="Soups")
+        for index in range(8):
+            dish = Dish.objects.create(
+                name=f"Soup {index}", price=index + 1, dish_type=cls.soups
+            )
+            if index % 2:
+                dish.cooks.add(cls.chef)
+        cls.dish = Dish.objects.get(name="Soup 1")
+
+    def setUp(self) -> None:
+        self.factory = RequestFactory()
+        self.async_factory = AsyncRequestFactory()
+
+    async def call(self, view, path="/", user=None, etag=None, **kwargs):
+        request = self.async_factory.get(path, kwargs.pop("data", {}))
+        request.user = user or self.chef
+        if etag:
+            request.META["HTTP_IF_NONE_MATCH"] = etag
+        response = await view.as_view()(request, **kwargs)
+
+        if hasattr(response, "render"):
+            await sync_to_async(response.render)()
+        return response
+
+    def call_sync(self, view, path="/", **kwargs):
+        request = self.factory.get(path, kwargs.pop("data", {}))
+        request.user = self.chef
+        response = view.as_view()(request, **kwargs)
+
+        if hasattr(response, "render"):
+            response.render()
+        return response
+
+    async def test_index_reads_stats(self):
+        await KitchenStats.objects.all().adelete()
+
+        response = await self.call(views.AsyncIndexView)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context_data["dishes"], 8)
+        self.assertEqual(await KitchenStats.objects.acount(), 1)
+
+    async def test_dish_list_matches_sync_view(self):
+        for data in ({"name": "soup 1"}, {}):
+            sync_response = await sync_to_async(self.call_sync)(
+                views.DishListView, data=data
+            )
+            response = await self.call(views.AsyncDishListView, data=data)
+
+            self.assertEqual(
+                list(response.context_data["dish_list"]),
+                list(sync_response.context_data["dish_list"]),
+            )
+            self.assertEqual(
+                response.context_data["page_obj"].next_cursor,
+                sync_response.context_data["page_obj"].next_cursor,
+            )
+
+        next_page = await self.call(
+            views.AsyncDishListView,
+            data={"cursor": response.context_data["page_obj"].next_cursor},
+        )
+        self.assertEqual(
+            [dish.name for dish in next_page.context_data["dish_list"]],
+            ["Soup 6", "Soup 7"],
+        )
+
+    async def test_dish_list_conditional_get(self):
+        response = await self.call(views.AsyncDishListView)
+
+        cached = await self.call(
+            views.AsyncDishListView,
+            etag=response["ETag"],
+        )
+
+        self.assertEqual(cached.status_code, 304)
+
+    async def test_dish_detail(self):
+        response = await self.call(
+            views.AsyncDishDetailView, pk=self.dish.pk
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Soup 1")
+        self.assertContains(response, "chef")
+
+        with self.assertRaises(Http404):
+            await self.call(views.AsyncDishDetailView, pk=0)
+
+    async def test_login_required(self):
+        response = await self.call(
+            views.AsyncDishListView, user=AnonymousUser()
+        )
+        self.assertEqual(response.status_code, 302)
+
+        with self.assertRaises(PermissionDenied):
+            await self.call(api.AsyncDishApiListView, user=AnonymousUser())
+
+    async def test_api_matches_sync_views(self):
+        for view, async_view, kwargs, data in API_VIEWS:
+            if view is api.DishTypeApiDetailView:
+                kwargs = {"pk": self.soups.pk}
+            if data.get("cook"):
+                data = {"cook": self.chef.pk}
+
+            sync_response = await sync_to_async(self.call_sync)(
+                view, data=data, **kwargs
+            )
+            response = await self.call(async_view, data=data, **kwargs)
+
+            self.assertEqual(response.status_code, sync_response.status_code)
+            self.assertEqual(
+                response.content,
+                await sync_to_async(sync_response.getvalue)(),
+            )
+
+    async def test_api_dish_detail_lists_cooks(self):
+        response = await self.call(
+            api.AsyncDishApiDetailView, pk=self.dish.pk
+        )
+
+        self.assertEqual(
+            json.loads(response.content)["cooks"], [self.chef.pk]
+        )
+
+        with self.assertRaises(Http404):
+            await self.call(api.AsyncDishApiDetailView, pk=0)
+
+
+class StreamingASGIHandlerTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.chef = get_user_model().objects.create_user(username="chef")
+        soups = DishType.objects.create(name="Soups")
+        for index in range(8):
+            Dish.objects.create(
+                name=f"Soup {index}", price=index + 1, dish_type=soups
+            )
+
+    def setUp(self):
+        # As the test client does, so the handler keeps the connection of
+        # the test transaction.
+        for signal in (request_started, request_finished):
+            signal.disconnect(close_old_connections)
+            self.addCleanup(signal.connect, close_old_connections)
+
+        self.client.force_login(self.chef)
+        self.session = self.client.cookies[settings.SESSION_COOKIE_NAME]
+
+    async def request(self, path):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "root_path": "",
+            "query_string": b"",
+            "server": ("testserver", 80),
+            "headers": [
+                (b"host", b"testserver"),
+                (
+                    b"cookie",
+                    f"{self.session.key}={self.session.value}".encode(),
+                ),
+            ],
+        }
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        await StreamingASGIHandler()(scope, receive, send)
+        return messages
+
+    @mock.patch("kitchen.api.EXPORT_CHUNK_SIZE", 3)
+    async def test_export_streams_chunks_read_off_the_event_loop(self):
+        start, *bodies, end = await self.request(
+            reverse("kitchen:api-dish-export")
+        )
+
+        self.assertEqual(start["status"], 200)
+        self.assertIn(
+            (b"Content-Type", b"application/x-ndjson"), start["headers"]
+        )
+        self.assertEqual(
+            [body["body"].count(b"\n") for body in bodies], [3, 3, 2]
+        )
+        self.assertEqual(end, {"type": "http.response.body"})
+
+    async def test_other_responses_are_sent_as_usual(self):
+        start, body = await self.request(reverse("kitchen:api-dish-list"))
+
+        self.assertEqual(start["status"], 200)
+        self.assertEqual(len(json.loads(body["body"])["results"]), 8)
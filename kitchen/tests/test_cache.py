@@ -0,0 +1,162 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest import skipUnless
+
+import redis
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.cache.backends.redis import RedisCache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from kitchen.cache import (
+    CACHE_STATS,
+    bump_model_version,
+    cached,
+    get_model_version,
+    version_key,
+)
+from kitchen.models import Dish, DishType
+from restaurant_kitchen_service.cache_url import parse_cache_url
+
+
+# Any server speaking the Redis protocol (Redis, Valkey, KeyDB) will do.
+# Keys are prefixed, nothing else on the server is touched.
+REDIS_URL = os.getenv("KITCHEN_TEST_REDIS_URL", "redis://127.0.0.1:6379/15")
+
+
+def redis_available():
+    try:
+        return redis.Redis.from_url(
+            REDIS_URL, socket_connect_timeout=0.5
+        ).ping()
+    except redis.RedisError:
+        return False
+
+
+class CacheUrlTest(TestCase):
+    def test_locmem(self):
+        config = parse_cache_url("locmem://menu?max_entries=1000")
+
+        self.assertEqual(
+            config["BACKEND"],
+            "django.core.cache.backends.locmem.LocMemCache"
+        )
+        self.assertEqual(config["LOCATION"], "menu")
+        self.assertEqual(config["OPTIONS"], {"MAX_ENTRIES": 1000})
+
+    def test_file(self):
+        config = parse_cache_url("file:///var/tmp/kitchen")
+
+        self.assertEqual(config["LOCATION"], "/var/tmp/kitchen")
+
+    def test_redis(self):
+        config = parse_cache_url("redis://127.0.0.1:6379/1", timeout=60)
+
+        self.assertEqual(
+            config["BACKEND"],
+            "django.core.cache.backends.redis.RedisCache"
+        )
+        self.assertEqual(config["LOCATION"], "redis://127.0.0.1:6379/1")
+        self.assertEqual(config["TIMEOUT"], 60)
+
+    def test_unknown_scheme(self):
+        with self.assertRaises(ImproperlyConfigured):
+            parse_cache_url("memcache://127.0.0.1")
+
+
+class VersionedCacheTest(TestCase):
+    def setUp(self) -> None:
+        self.dish_type = DishType.objects.create(name="Soups")
+        self.calls = 0
+
+    def count_dishes(self):
+        self.calls += 1
+        return Dish.objects.count()
+
+    def test_versions_change_on_writes(self):
+        version = get_model_version(Dish)
+
+        dish = Dish.objects.create(
+            name="Borscht", price=5, dish_type=self.dish_type
+        )
+        self.assertNotEqual(get_model_version(Dish), version)
+
+        version = get_model_version(Dish)
+        dish.cooks.add(get_user_model().objects.create_user(username="cook"))
+        self.assertNotEqual(get_model_version(Dish), version)
+
+    def test_cached_result_is_invalidated(self):
+        count = cached(Dish, key=lambda: ())(self.count_dishes)
+
+        self.assertEqual((count(), count()), (0, 0))
+        self.assertEqual(self.calls, 1)
+
+        Dish.objects.create(name="Borscht", price=5, dish_type=self.dish_type)
+        self.assertEqual(count(), 1)
+        self.assertEqual(self.calls, 2)
+
+
+@skipUnless(redis_available(), f"no Redis server at {REDIS_URL}")
+class SharedVersionedCacheTest(TestCase):
+    # Every worker bumps and seeds the versions through incr() and add(),
+    # which the server applies atomically.
+
+    def setUp(self) -> None:
+        config = parse_cache_url(REDIS_URL, key_prefix="kitchen-test")
+        settings_override = override_settings(CACHES={"default": config})
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.addCleanup(cache.delete, version_key(Dish))
+        cache.delete(version_key(Dish))
+
+        # The cache of another worker process.
+        self.worker = RedisCache(config["LOCATION"], config)
+
+    def test_versions_are_shared_between_workers(self):
+        version = get_model_version(Dish)
+
+        self.assertEqual(self.worker.get(version_key(Dish)), version)
+        self.worker.incr(version_key(Dish))
+        self.assertEqual(get_model_version(Dish), version + 1)
+
+    def test_concurrent_bumps_are_not_lost(self):
+        version = get_model_version(Dish)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(50):
+                executor.submit(bump_model_version, Dish)
+
+        self.assertEqual(get_model_version(Dish), version + 50)
+
+    def test_the_first_seed_wins(self):
+        self.assertTrue(self.worker.add(version_key(Dish), 1, None))
+
+        self.assertEqual(get_model_version(Dish), 1)
+        self.assertFalse(cache.add(version_key(Dish), 2, None))
+
+
+class CacheStatsViewTest(TestCase):
+    def test_staff_only(self):
+        user = get_user_model().objects.create_user(username="cook")
+        self.client.force_login(user)
+
+        response = self.client.get(reverse("kitchen:cache-stats"))
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_reports_hits_and_misses(self):
+        admin = get_user_model().objects.create_user(
+            username="admin", is_staff=True
+        )
+        self.client.force_login(admin)
+        CACHE_STATS.clear()
+
+        for _ in range(2):
+            self.client.get(reverse("kitchen:cook-list"), {"username": "ad"})
+        response = self.client.get(reverse("kitchen:cache-stats"))
+
+        self.assertEqual(
+            response.json()["CookListView.search"], {"hit": 1, "miss": 1}
+        )
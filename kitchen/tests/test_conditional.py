@@ -0,0 +1,90 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from kitchen.models import Dish, DishType
+
+DISH_LIST_URL = reverse("kitchen:dish-list")
+
+
+class ConditionalGetTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(
+            username="test_username",
+            password="test_1234",
+        )
+        self.dish_type = DishType.objects.create(name="Soups")
+        self.dish = Dish.objects.create(
+            name="Borscht",
+            price=5,
+            dish_type=self.dish_type
+        )
+
+        self.client.force_login(self.user)
+
+    def revalidate(self, url):
+        response = self.client.get(url)
+
+        return self.client.get(
+            url,
+            HTTP_IF_NONE_MATCH=response.headers["ETag"],
+            HTTP_IF_MODIFIED_SINCE=response.headers["Last-Modified"],
+        )
+
+    def test_validators_are_sent(self):
+        response = self.client.get(DISH_LIST_URL)
+
+        self.assertIn("ETag", response.headers)
+        self.assertIn("Last-Modified", response.headers)
+        self.assertIn("no-cache", response.headers["Cache-Control"])
+
+    def test_unchanged_list_returns_304_without_rendering(self):
+        response = self.revalidate(DISH_LIST_URL)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertTemplateNotUsed(response, "kitchen/dish_list.html")
+
+    def test_list_changes_after_write_and_delete(self):
+        first = self.client.get(DISH_LIST_URL).headers["ETag"]
+
+        self.dish_type.name = "Broths"
+        self.dish_type.save()
+        second = self.client.get(DISH_LIST_URL).headers["ETag"]
+
+        Dish.objects.create(name="Okroshka", price=4, dish_type=self.dish_type)
+        Dish.objects.get(name="Okroshka").delete()
+        third = self.client.get(DISH_LIST_URL).headers["ETag"]
+
+        self.assertEqual(len({first, second, third}), 3)
+
+    def test_etag_depends_on_query_and_user(self):
+        etag = self.client.get(DISH_LIST_URL).headers["ETag"]
+
+        searched = self.client.get(DISH_LIST_URL, {"name": "bor"})
+        self.assertNotEqual(searched.headers["ETag"], etag)
+
+        self.client.force_login(
+            get_user_model().objects.create_user(username="another")
+        )
+        self.assertNotEqual(
+            self.client.get(DISH_LIST_URL).headers["ETag"], etag
+        )
+
+    def test_detail_views(self):
+        dish_url = reverse("kitchen:dish-detail", kwargs={"pk": self.dish.pk})
+        cook_url = reverse("kitchen:cook-detail", kwargs={"pk": self.user.pk})
+
+        self.assertEqual(self.revalidate(dish_url).status_code, 304)
+        self.assertEqual(self.revalidate(cook_url).status_code, 304)
+
+        etag = self.client.get(dish_url).headers["ETag"]
+        self.dish.cooks.add(self.user)
+        self.assertNotEqual(self.client.get(dish_url).headers["ETag"], etag)
+
+    def test_missing_object(self):
+        response = self.client.get(
+            reverse("kitchen:dish-detail", kwargs={"pk": 404})
+        )
+
+        self.assertEqual(response.status_code, 404)
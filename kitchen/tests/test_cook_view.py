@@ -1,7 +1,9 @@
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 
+from kitchen.models import Dish, DishType
+
 
 COOK_LIST_URL = reverse("kitchen:cook-list")
 
@@ -86,6 +88,28 @@ class PrivateCookTests(TestCase):
         )
         self.assertTemplateUsed(response, "kitchen/cook_detail.html")
 
+    @override_settings(USE_THOUSAND_SEPARATOR=True, KITCHEN_LIVE_BOARD=True)
+    def test_ids_are_not_localized(self):
+        cook = get_user_model().objects.create_user(
+            pk=23456, username="chef"
+        )
+        dish = Dish.objects.create(
+            pk=12345,
+            name="Borscht",
+            price=5,
+            dish_type=DishType.objects.create(name="Soups"),
+        )
+        dish.cooks.add(cook)
+
+        response = self.client.get(
+            reverse("kitchen:cook-detail", kwargs={"pk": cook.pk})
+        )
+
+        self.assertContains(response, 'data-live-cook="23456"')
+        self.assertContains(response, 'data-cook="23456"')
+        self.assertContains(response, 'data-live-dish="12345"')
+        self.assertContains(response, "<strong>Id:</strong> 12345")
+
     def test_use_cook_create(self):
         data = {
             "username": "new_cook",
@@ -173,3 +197,24 @@ class CookListSearchTest(TestCase):
 
         self.assertContains(response, "Test1 User1")
         self.assertContains(response, "Test2 User2")
+
+
+class CookCardCacheTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(
+            username="cached_cook",
+            first_name="Cached",
+            last_name="Cook",
+        )
+        self.client.force_login(self.user)
+        self.client.get(COOK_LIST_URL)
+
+    def test_card_is_cached_until_cook_changes(self):
+        get_user_model().objects.filter(pk=self.user.pk).update(
+            first_name="Silent"
+        )
+        self.assertContains(self.client.get(COOK_LIST_URL), "Cached Cook")
+
+        self.user.first_name = "Renamed"
+        self.user.save()
+        self.assertContains(self.client.get(COOK_LIST_URL), "Renamed Cook")
@@ -0,0 +1,205 @@
+import threading
+from unittest import mock, skipUnless
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django.test import SimpleTestCase, TestCase
+
+from kitchen import metrics
+from kitchen.db.pool import (
+    ConnectionPool,
+    PoolTimeout,
+    close_pool,
+    get_pool,
+    get_pool_stats,
+)
+from restaurant_kitchen_service.database_pool import configure_pool
+
+
+POSTGRES_CONFIG = {
+    "ENGINE": "django.db.backends.postgresql",
+    "NAME": "kitchen",
+    "CONN_MAX_AGE": 500,
+    "CONN_HEALTH_CHECKS": True,
+}
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class ConnectionPoolTest(SimpleTestCase):
+    def test_released_connections_are_reused(self):
+        pool = ConnectionPool({})
+
+        first = pool.acquire(FakeConnection)
+        pool.release(first)
+
+        self.assertIs(pool.acquire(FakeConnection), first)
+        self.assertEqual(pool.get_stats()["created"], 1)
+        self.assertEqual(pool.get_stats()["checkouts"], 2)
+
+    def test_full_pool_times_out(self):
+        pool = ConnectionPool({}, max_size=1, timeout=0.01)
+        pool.acquire(FakeConnection)
+
+        with self.assertRaises(PoolTimeout):
+            pool.acquire(FakeConnection)
+        self.assertEqual(pool.get_stats()["timeouts"], 1)
+
+    def test_waiter_gets_released_connection(self):
+        pool = ConnectionPool({}, max_size=1, timeout=5)
+        first = pool.acquire(FakeConnection)
+        acquired = []
+        waiter = threading.Thread(
+            target=lambda: acquired.append(pool.acquire(FakeConnection))
+        )
+
+        waiter.start()
+        pool.release(first)
+        waiter.join()
+
+        self.assertEqual(acquired, [first])
+
+    def test_failed_health_check_reconnects(self):
+        pool = ConnectionPool({}, check=lambda connection: False)
+        dead = pool.acquire(FakeConnection)
+        pool.release(dead)
+
+        fresh = pool.acquire(FakeConnection)
+
+        self.assertIsNot(fresh, dead)
+        self.assertTrue(dead.closed)
+        self.assertEqual(pool.get_stats()["discarded"], 1)
+
+    def test_idle_connections_expire(self):
+        pool = ConnectionPool({}, max_idle=0)
+        old = pool.acquire(FakeConnection)
+        pool.release(old)
+
+        self.assertIsNot(pool.acquire(FakeConnection), old)
+        self.assertTrue(old.closed)
+        self.assertEqual(pool.get_stats()["expired"], 1)
+
+    def test_failed_connect_frees_the_slot(self):
+        pool = ConnectionPool({}, max_size=1)
+
+        with self.assertRaises(OSError):
+            pool.acquire(mock.Mock(side_effect=OSError))
+
+        self.assertEqual(pool.get_stats()["in_use"], 0)
+
+    def test_discarded_and_closed_pool_connections_are_closed(self):
+        pool = ConnectionPool({})
+        broken = pool.acquire(FakeConnection)
+        pool.release(broken, discard=True)
+        kept = pool.acquire(FakeConnection)
+
+        pool.close()
+        pool.release(kept)
+
+        self.assertTrue(broken.closed)
+        self.assertTrue(kept.closed)
+        self.assertEqual(pool.get_stats()["idle"], 0)
+
+    def test_registry_replaces_pool_when_parameters_change(self):
+        self.addCleanup(close_pool, "test")
+        pool = get_pool("test", {"dbname": "kitchen"})
+        idle = pool.acquire(FakeConnection)
+        pool.release(idle)
+
+        self.assertIs(get_pool("test", {"dbname": "kitchen"}), pool)
+        self.assertIsNot(get_pool("test", {"dbname": "test_kitchen"}), pool)
+        self.assertTrue(idle.closed)
+
+    def test_stats_are_exported_as_prometheus_metrics(self):
+        self.addCleanup(close_pool, "test")
+        get_pool("test", {}, max_size=4).acquire(FakeConnection)
+
+        text = metrics.render_prometheus()
+
+        self.assertIn("test", get_pool_stats())
+        self.assertIn(
+            'kitchen_db_pool_max_connections{alias="test"} 4', text
+        )
+        self.assertIn(
+            'kitchen_db_pool_connections{alias="test",state="in_use"} 1', text
+        )
+        self.assertIn(
+            'kitchen_db_pool_events_total{alias="test",event="created"} 1',
+            text,
+        )
+
+
+class ConfigurePoolTest(SimpleTestCase):
+    def test_no_pool(self):
+        self.assertEqual(configure_pool(POSTGRES_CONFIG, ""), POSTGRES_CONFIG)
+
+    def test_pgbouncer_disables_server_side_cursors(self):
+        config = configure_pool(POSTGRES_CONFIG, "pgbouncer")
+
+        self.assertTrue(config["DISABLE_SERVER_SIDE_CURSORS"])
+        self.assertEqual(config["ENGINE"], POSTGRES_CONFIG["ENGINE"])
+
+    def test_process_pool(self):
+        config = configure_pool(POSTGRES_CONFIG, "process", max_size=20)
+
+        self.assertEqual(config["ENGINE"], "kitchen.db.postgresql")
+        self.assertEqual(config["CONN_MAX_AGE"], 0)
+        self.assertEqual(config["POOL"]["MAX_SIZE"], 20)
+        self.assertTrue(config["CONN_HEALTH_CHECKS"])
+
+    def test_invalid_configurations(self):
+        sqlite = {"ENGINE": "django.db.backends.sqlite3"}
+
+        for config, mode in ((sqlite, "process"), (POSTGRES_CONFIG, "x")):
+            with self.assertRaises(ImproperlyConfigured):
+                configure_pool(config, mode)
+
+
+@skipUnless(
+    connection.settings_dict["ENGINE"] == "kitchen.db.postgresql",
+    "DATABASE_POOL=process with a PostgreSQL DATABASE_URL",
+)
+class PooledBackendTest(TestCase):
+    def setUp(self):
+        self.wrapper = connections.create_connection(DEFAULT_DB_ALIAS)
+        self.addCleanup(self.wrapper.close)
+
+    def test_closed_connection_returns_to_pool(self):
+        self.wrapper.ensure_connection()
+        raw = self.wrapper.connection
+        self.wrapper.close()
+
+        self.wrapper.ensure_connection()
+
+        self.assertIs(self.wrapper.connection, raw)
+
+    def test_broken_connection_is_discarded(self):
+        self.wrapper.ensure_connection()
+        raw = self.wrapper.connection
+        raw.close()
+        self.wrapper.close()
+
+        self.wrapper.ensure_connection()
+
+        self.assertIsNot(self.wrapper.connection, raw)
+        self.assertTrue(self.wrapper.is_usable())
+
+    def test_open_transaction_is_rolled_back(self):
+        self.wrapper.ensure_connection()
+        self.wrapper.set_autocommit(False)
+        with self.wrapper.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        raw = self.wrapper.connection
+        self.wrapper.close()
+
+        # Switching back to autocommit fails inside a transaction.
+        self.wrapper.ensure_connection()
+
+        self.assertIs(self.wrapper.connection, raw)
+        self.assertTrue(self.wrapper.get_autocommit())
@@ -1,5 +1,8 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from kitchen.models import Dish, DishType
@@ -194,3 +197,195 @@ class DishListSearchTest(TestCase):
 
         self.assertContains(response, "1_test_dish")
         self.assertContains(response, "2_test_dish")
+
+    def test_search_term_round_trips(self):
+        response = self.client.get(DISH_LIST_URL, {"name": "1_te"})
+
+        self.assertEqual(
+            response.context["search_form"].initial, {"name": "1_te"}
+        )
+        self.assertContains(response, 'value="1_te"')
+
+    def test_repeated_search_is_served_from_cache(self):
+        self.client.get(DISH_LIST_URL, {"name": "test_d"})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(DISH_LIST_URL, {"name": " test_d "})
+
+        dish_query = queries.captured_queries[-1]["sql"]
+        self.assertIn('"kitchen_dish"."id" IN', dish_query)
+        self.assertNotIn("test_d", dish_query.lower())
+        self.assertEqual(
+            [dish.name for dish in response.context["dish_list"]],
+            ["1_test_dish", "2_test_dish"]
+        )
+
+    def test_terms_differing_in_spacing_are_cached_apart(self):
+        Dish.objects.create(
+            name="red  soup", price=5, dish_type=self.dish.dish_type
+        )
+        Dish.objects.create(
+            name="red soup", price=5, dish_type=self.dish.dish_type
+        )
+
+        for term in ("red  soup", "red soup"):
+            response = self.client.get(DISH_LIST_URL, {"name": term})
+            self.assertEqual(
+                [dish.name for dish in response.context["dish_list"]],
+                [term],
+            )
+
+    def test_dish_changes_invalidate_cached_search(self):
+        self.client.get(DISH_LIST_URL, {"name": "test_d"})
+
+        self.dish.name = "renamed"
+        self.dish.save()
+        response = self.client.get(DISH_LIST_URL, {"name": "test_d"})
+
+        self.assertNotContains(response, "renamed")
+        self.assertContains(response, "2_test_dish")
+
+
+class DishListQueryCountTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(
+            username="test_username_3",
+            password="test_1234",
+            years_of_experience=2,
+            position="A"
+        )
+        self.dish_type = DishType.objects.create(name="dish_type_name_3")
+
+        self.client.force_login(self.user)
+
+    def create_dishes(self, number):
+        for index in range(Dish.objects.count(), number):
+            dish = Dish.objects.create(
+                name=f"dish_{index}",
+                price=5,
+                dish_type=self.dish_type
+            )
+            dish.cooks.add(self.user)
+
+    def test_query_count_does_not_depend_on_page_size(self):
+        self.create_dishes(1)
+        cache.clear()
+        with self.assertNumQueries(5):
+            self.client.get(DISH_LIST_URL)
+
+        self.create_dishes(6)
+        cache.clear()
+        with self.assertNumQueries(5):
+            response = self.client.get(DISH_LIST_URL)
+
+        self.assertEqual(len(response.context["dish_list"]), 6)
+        self.assertContains(response, "Dish Cooks Number: 1")
+
+    def test_dish_detail_query_count(self):
+        self.create_dishes(1)
+        dish = Dish.objects.get()
+        url = reverse("kitchen:dish-detail", kwargs={"pk": dish.pk})
+
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+
+        self.assertContains(response, "dish_type_name_3")
+
+
+class DishCardCacheTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(
+            username="test_username_4",
+            password="test_1234",
+            position="A"
+        )
+        self.dish_type = DishType.objects.create(name="dish_type_name_4")
+        self.dish = Dish.objects.create(
+            name="cached_dish",
+            price=5,
+            dish_type=self.dish_type
+        )
+
+        self.client.force_login(self.user)
+        self.client.get(DISH_LIST_URL)
+
+    def test_unchanged_card_is_served_from_cache(self):
+        Dish.objects.filter(pk=self.dish.pk).update(name="silent_rename")
+
+        response = self.client.get(DISH_LIST_URL)
+
+        self.assertContains(response, "cached_dish")
+
+    def test_card_is_rerendered_after_save(self):
+        self.dish.name = "renamed_dish"
+        self.dish.save()
+
+        response = self.client.get(DISH_LIST_URL)
+
+        self.assertContains(response, "renamed_dish")
+
+    def test_card_is_rerendered_after_cooks_change(self):
+        self.dish.cooks.add(self.user)
+
+        response = self.client.get(DISH_LIST_URL)
+
+        self.assertContains(response, "Dish Cooks Number: 1")
+
+        self.user.dishes.clear()
+        response = self.client.get(DISH_LIST_URL)
+
+        self.assertContains(response, "Dish Cooks Number: 0")
+
+    def test_card_is_rerendered_after_dish_type_rename(self):
+        self.dish_type.name = "renamed_type"
+        self.dish_type.save()
+
+        response = self.client.get(DISH_LIST_URL)
+
+        self.assertContains(response, "renamed_type")
+
+
+class DishCookPickerTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(
+            username="picker_chef",
+            password="test_1234",
+            position="A"
+        )
+        self.cooks = [
+            get_user_model().objects.create_user(username=f"picker_{index}")
+            for index in range(20)
+        ]
+        self.dish = Dish.objects.create(
+            name="picked_dish",
+            price=5,
+            dish_type=DishType.objects.create(name="picker_type")
+        )
+        self.dish.cooks.add(*self.cooks[:2])
+
+        self.client.force_login(self.user)
+
+    def test_only_selected_cooks_are_rendered(self):
+        url = reverse("kitchen:dish-add-cooks", kwargs={"pk": self.dish.pk})
+
+        response = self.client.get(url)
+
+        self.assertContains(response, "<option", count=2)
+        self.assertContains(response, "data-cook-picker")
+        self.assertContains(response, "js/cook_picker.js")
+
+    def test_submitted_cooks_are_validated(self):
+        url = reverse("kitchen:dish-add-cooks", kwargs={"pk": self.dish.pk})
+
+        response = self.client.post(
+            url, {"cooks": [self.cooks[5].pk, self.cooks[6].pk]}
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            set(self.dish.cooks.all()), {self.cooks[5], self.cooks[6]}
+        )
+
+        response = self.client.post(url, {"cooks": [404]})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["form"].errors)
@@ -0,0 +1,199 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from kitchen.models import Dish, DishType, KitchenStats
+
+
+CSV_MENU = """name,description,price,dish_type,cooks
+Borscht,Beet soup,5.50,Soups,chef;cook
+Okroshka,,4,Soups,
+Napoleon,Layered cake,6.25,Desserts,chef
+"""
+
+
+class ImportMenuTest(TestCase):
+    def setUp(self) -> None:
+        self.chef = get_user_model().objects.create_user(username="chef")
+        self.cook = get_user_model().objects.create_user(username="cook")
+        DishType.objects.create(name="Soups")
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def write(self, name, content):
+        path = Path(self.directory.name) / name
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def import_menu(self, path, *args):
+        output = StringIO()
+        call_command("import_menu", str(path), *args, stdout=output)
+        return output.getvalue()
+
+    def test_import_csv(self):
+        output = self.import_menu(
+            self.write("menu.csv", CSV_MENU),
+            "--create-dish-types",
+            "--batch-size=2",
+        )
+
+        self.assertIn("Imported 3 dishes", output)
+        self.assertIn("rows/s", output)
+        borscht = Dish.objects.get(name="Borscht")
+        self.assertEqual(str(borscht.price), "5.50")
+        self.assertEqual(
+            set(borscht.cooks.all()), {self.chef, self.cook}
+        )
+        self.assertEqual(
+            Dish.objects.get(name="Napoleon").dish_type.name, "Desserts"
+        )
+        self.assertIsNone(Dish.objects.get(name="Okroshka").description)
+        self.assertEqual(KitchenStats.load().dishes, 3)
+
+    def test_import_maintains_assignment_counts(self):
+        soup = Dish.objects.create(
+            name="Shchi", price=4, dish_type=DishType.objects.get()
+        )
+        soup.cooks.add(self.chef)
+
+        menu = CSV_MENU.replace("chef;cook", "chef;cook;chef")
+        self.import_menu(
+            self.write("menu.csv", menu),
+            "--create-dish-types",
+            "--batch-size=2",
+        )
+
+        self.assertEqual(
+            dict(Dish.objects.values_list("name", "cooks_count")),
+            {"Borscht": 2, "Okroshka": 0, "Napoleon": 1, "Shchi": 1},
+        )
+        self.chef.refresh_from_db()
+        self.cook.refresh_from_db()
+        self.assertEqual(self.chef.dishes_count, 3)
+        self.assertEqual(self.cook.dishes_count, 1)
+        call_command(
+            "reconcile_assignment_counts", "--check", stdout=StringIO()
+        )
+
+    def test_import_jsonl(self):
+        rows = [
+            {"name": "Borscht", "price": "5", "dish_type": "Soups",
+             "cooks": ["chef"]},
+            {"name": "Solyanka", "price": 6, "dish_type": "Soups"},
+        ]
+        self.import_menu(self.write(
+            "menu.jsonl", "\n".join(json.dumps(row) for row in rows)
+        ))
+
+        self.assertEqual(
+            list(Dish.objects.values_list("name", flat=True)),
+            ["Borscht", "Solyanka"]
+        )
+
+    def test_dry_run_rolls_back(self):
+        output = self.import_menu(
+            self.write("menu.csv", CSV_MENU), "--create-dish-types",
+            "--dry-run",
+        )
+
+        self.assertIn("Validated 3 dishes", output)
+        self.assertFalse(Dish.objects.exists())
+        self.assertFalse(DishType.objects.filter(name="Desserts").exists())
+
+    def test_error_rolls_back_whole_import(self):
+        path = self.write("menu.csv", CSV_MENU + "Pelmeni,,x,Soups,\n")
+
+        with self.assertRaisesMessage(CommandError, "Row 4: invalid price"):
+            self.import_menu(path, "--create-dish-types", "--batch-size=2")
+
+        self.assertFalse(Dish.objects.exists())
+
+    def test_unknown_references(self):
+        with self.assertRaisesMessage(CommandError, "Unknown dish types"):
+            self.import_menu(self.write("menu.csv", CSV_MENU))
+
+        path = self.write("menu.csv", CSV_MENU.replace("chef;", "ghost;"))
+        with self.assertRaisesMessage(CommandError, "Unknown cooks: ghost"):
+            self.import_menu(path, "--create-dish-types")
+
+    def test_duplicate_names(self):
+        path = self.write("menu.csv", CSV_MENU + "Borscht,,1,Soups,\n")
+
+        with self.assertRaisesMessage(CommandError, "already exists"):
+            self.import_menu(path, "--create-dish-types")
+
+    def test_names_are_compared_stripped(self):
+        Dish.objects.create(
+            name="Borscht", price=5, dish_type=DishType.objects.get()
+        )
+        path = self.write(
+            "menu.csv", "name,price,dish_type\n\" Borscht \",1,Soups\n"
+        )
+
+        with self.assertRaisesMessage(
+            CommandError, "Row 1: dish 'Borscht' already exists"
+        ):
+            self.import_menu(path)
+
+    def test_blank_cook_names_are_skipped(self):
+        path = self.write("menu.csv", CSV_MENU.replace("chef;cook", "chef; "))
+
+        self.import_menu(path, "--create-dish-types")
+
+        borscht = Dish.objects.get(name="Borscht")
+        self.assertEqual(list(borscht.cooks.all()), [self.chef])
+
+    def test_prices_are_validated(self):
+        for price in ("NaN", "Infinity", "-inf", "123456.78", "1.234"):
+            path = self.write(
+                "menu.csv", f"name,price,dish_type\nShchi,{price},Soups\n"
+            )
+            with self.subTest(price=price), self.assertRaisesMessage(
+                CommandError, "Row 1: invalid price"
+            ):
+                self.import_menu(path)
+
+        self.assertFalse(Dish.objects.exists())
+
+    def test_invalid_jsonl_lines(self):
+        row = json.dumps({"name": "Shchi", "price": 4, "dish_type": "Soups"})
+        for content, message in (
+            (f"{row}\n\n{{broken\n", "Line 3: invalid JSON"),
+            (f'{row}\n["Shchi", 4]\n', "Line 2: expected a JSON object"),
+            ("5\n", "Line 1: expected a JSON object"),
+            (
+                row[:-1] + ', "cooks": "chef"}\n',
+                "Line 1: cooks must be a list of usernames",
+            ),
+            (
+                row[:-1] + ', "cooks": ["chef", 5]}\n',
+                "Line 1: cooks must be a list of usernames",
+            ),
+        ):
+            with self.subTest(content=content), self.assertRaisesMessage(
+                CommandError, message
+            ):
+                self.import_menu(self.write("menu.jsonl", content))
+
+        self.assertFalse(Dish.objects.exists())
+
+    def test_dish_types_are_stripped(self):
+        path = self.write(
+            "menu.csv",
+            "name,price,dish_type\nShchi,4,\" Soups\"\nUkha,5,Soups \n",
+        )
+
+        self.import_menu(path)
+
+        self.assertEqual(
+            set(Dish.objects.values_list("dish_type__name", flat=True)),
+            {"Soups"},
+        )
+        self.assertEqual(DishType.objects.count(), 1)
@@ -0,0 +1,277 @@
+import json
+from unittest import mock
+
+import redis
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from kitchen import live
+from kitchen.live import Hub, LiveEventsApp, RedisHub, Subscriber
+from kitchen.models import Dish, DishType
+
+
+LIVE_URL = reverse("kitchen:live-events")
+
+
+def drain(subscriber):
+    messages = []
+    while (message := subscriber.get(timeout=0)) is not None:
+        event, data = message.strip().split("\n")
+        messages.append((event[len("event: "):], json.loads(data[6:])))
+    return messages
+
+
+class LiveTestCase(TestCase):
+    def setUp(self) -> None:
+        self.cook = get_user_model().objects.create_user(username="chef")
+        self.dish_type = DishType.objects.create(name="Soups")
+        self.dish = Dish.objects.create(
+            name="Borscht", price=5, dish_type=self.dish_type
+        )
+
+
+class HubTest(LiveTestCase):
+    def test_burst_is_read_once_for_all_subscribers(self):
+        hub = Hub(delay=60)
+        subscribers = [hub.subscribe(Subscriber()) for _ in range(3)]
+        soup = Dish.objects.create(
+            name="Okroshka", price=4, dish_type=self.dish_type
+        )
+        soup.cooks.add(self.cook)
+
+        for pk in (self.dish.pk, soup.pk, self.dish.pk):
+            hub.publish(Dish, pk)
+        hub.publish(Dish, 999, deleted=True)
+        hub.timer.cancel()
+
+        with self.assertNumQueries(2):
+            hub.flush()
+
+        for subscriber in subscribers:
+            ((event, data),) = drain(subscriber)
+            self.assertEqual(event, "dishes")
+            self.assertEqual(data["deleted"], [999])
+            self.assertEqual(
+                sorted(data["changed"], key=lambda row: row["id"]),
+                [
+                    {
+                        "id": self.dish.pk,
+                        "name": "Borscht",
+                        "price": "5.00",
+                        "dish_type": "Soups",
+                        "cooks_count": 0,
+                        "cooks": [],
+                    },
+                    {
+                        "id": soup.pk,
+                        "name": "Okroshka",
+                        "price": "4.00",
+                        "dish_type": "Soups",
+                        "cooks_count": 1,
+                        "cooks": [self.cook.pk],
+                    },
+                ],
+            )
+
+    def test_nothing_is_queued_without_subscribers(self):
+        hub = Hub(delay=60)
+
+        hub.publish(Dish, self.dish.pk)
+
+        self.assertEqual(hub.pending, {})
+        self.assertIsNone(hub.timer)
+
+
+class RedisHubTest(LiveTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.hub = RedisHub("redis://127.0.0.1:1/0", delay=0)
+        self.hub.client = mock.Mock()
+
+    def test_changes_go_through_the_channel(self):
+        with mock.patch.object(self.hub, "listen") as listen:
+            subscriber = self.hub.subscribe(Subscriber())
+            self.hub.subscribe(Subscriber())
+        self.hub.listener.join()
+        listen.assert_called_once_with()
+
+        self.hub.publish_many(Dish, [self.dish.pk])
+        # Delivered once the message comes back from Redis.
+        self.assertEqual(drain(subscriber), [])
+        ((channel, message),) = [
+            call.args for call in self.hub.client.publish.call_args_list
+        ]
+        self.assertEqual(channel, "kitchen:live")
+
+        self.hub.receive(message)
+        ((event, data),) = drain(subscriber)
+        self.assertEqual(event, "dishes")
+        self.assertEqual(data["changed"][0]["id"], self.dish.pk)
+
+    def test_unreachable_redis_does_not_fail_the_write(self):
+        self.hub.client.publish.side_effect = redis.ConnectionError
+
+        with self.assertLogs("kitchen.live", "WARNING"):
+            self.hub.publish_many(Dish, [self.dish.pk], deleted=True)
+
+    def test_created_for_a_redis_url(self):
+        with override_settings(KITCHEN_LIVE_REDIS_URL=None):
+            self.assertIs(type(live.create_hub()), Hub)
+        with override_settings(KITCHEN_LIVE_REDIS_URL="redis://cache:6379"):
+            self.assertIs(type(live.create_hub()), RedisHub)
+
+
+@mock.patch.object(live.hub, "delay", 0)
+class LiveSignalsTest(LiveTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.subscriber = live.hub.subscribe(Subscriber())
+
+    def tearDown(self) -> None:
+        live.hub.unsubscribe(self.subscriber)
+
+    def test_changes_are_published_on_commit(self):
+        self.dish.price = 7
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.dish.save()
+
+        self.assertEqual(drain(self.subscriber), [])
+        for callback in callbacks:
+            callback()
+
+        ((event, data),) = drain(self.subscriber)
+        self.assertEqual(event, "dishes")
+        self.assertEqual(data["changed"][0]["price"], "7.00")
+
+    def test_assignment_publishes_both_sides(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dish.cooks.add(self.cook)
+
+        events = dict(drain(self.subscriber))
+        self.assertEqual(events["dishes"]["changed"][0]["cooks_count"], 1)
+        self.assertEqual(events["cooks"]["changed"][0]["username"], "chef")
+        self.assertEqual(events["cooks"]["changed"][0]["dishes_count"], 1)
+
+    def test_delete_is_published(self):
+        pk = self.dish.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dish.delete()
+
+        self.assertEqual(
+            drain(self.subscriber),
+            [("dishes", {"changed": [], "deleted": [pk]})],
+        )
+
+    def test_deleting_dish_refreshes_its_cooks(self):
+        self.dish.cooks.add(self.cook)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dish.delete()
+
+        events = dict(drain(self.subscriber))
+        self.assertEqual(events["cooks"]["changed"][0]["dishes_count"], 0)
+
+    def test_deleting_cook_refreshes_its_dishes(self):
+        self.dish.cooks.add(self.cook)
+        pk = self.cook.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            self.cook.delete()
+
+        events = dict(drain(self.subscriber))
+        self.assertEqual(events["cooks"]["deleted"], [pk])
+        self.assertEqual(events["dishes"]["changed"][0]["cooks_count"], 0)
+
+
+@override_settings(KITCHEN_LIVE_BOARD=True)
+class LiveEventsViewTest(LiveTestCase):
+    def test_login_required(self):
+        self.assertEqual(self.client.get(LIVE_URL).status_code, 302)
+
+    def test_board_follows_the_setting(self):
+        self.client.force_login(self.cook)
+        dishes_url = reverse("kitchen:dish-list")
+
+        self.assertContains(self.client.get(dishes_url), "data-live-board")
+        with override_settings(KITCHEN_LIVE_BOARD=False):
+            self.assertNotContains(
+                self.client.get(dishes_url), "data-live-board"
+            )
+            self.assertEqual(self.client.get(LIVE_URL).status_code, 404)
+
+    def test_stream(self):
+        self.client.force_login(self.cook)
+
+        response = self.client.get(LIVE_URL)
+
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        self.assertEqual(response["Cache-Control"], "no-cache")
+        self.assertEqual(
+            next(iter(response.streaming_content)), b"retry: 5000\n\n"
+        )
+        self.assertEqual(len(live.hub.subscribers), 1)
+
+        response.close()
+        self.assertEqual(live.hub.subscribers, set())
+
+
+@override_settings(KITCHEN_LIVE_BOARD=True)
+@mock.patch("kitchen.live.close_old_connections", mock.Mock())
+class LiveEventsAppTest(LiveTestCase):
+    async def request(self, cookie=""):
+        app = LiveEventsApp(mock.AsyncMock())
+        sent = []
+        disconnect = mock.AsyncMock(return_value={"type": "http.disconnect"})
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": LIVE_URL,
+            "query_string": b"",
+            "headers": [(b"cookie", cookie.encode())],
+        }
+        await app(scope, disconnect, send)
+        return sent
+
+    async def test_anonymous_is_forbidden(self):
+        sent = await self.request()
+
+        self.assertEqual(sent[0]["status"], 403)
+
+    async def test_stream_until_disconnect(self):
+        await sync_to_async(self.client.force_login)(self.cook)
+        session = self.client.cookies[settings.SESSION_COOKIE_NAME].value
+
+        sent = await self.request(
+            f"{settings.SESSION_COOKIE_NAME}={session}"
+        )
+
+        self.assertEqual(sent[0]["status"], 200)
+        self.assertIn(
+            (b"content-type", b"text/event-stream"), sent[0]["headers"]
+        )
+        self.assertEqual(sent[1]["body"], b"retry: 5000\n\n")
+        self.assertEqual(live.hub.subscribers, set())
+
+    async def test_other_paths_go_to_django(self):
+        django_app = mock.AsyncMock()
+        app = LiveEventsApp(django_app)
+        scope = {"type": "http", "path": "/dishes/"}
+
+        await app(scope, None, None)
+
+        django_app.assert_awaited_once_with(scope, None, None)
+
+    @override_settings(KITCHEN_LIVE_BOARD=False)
+    async def test_turned_off_goes_to_django(self):
+        django_app = mock.AsyncMock()
+        app = LiveEventsApp(django_app)
+        scope = {"type": "http", "path": LIVE_URL}
+
+        await app(scope, None, None)
+
+        django_app.assert_awaited_once_with(scope, None, None)
@@ -0,0 +1,240 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock, skipUnless
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from kitchen import menu
+from kitchen.menu import get_menu_snapshot, refresh_menu_snapshot
+from kitchen.models import Dish, DishType
+from kitchen.seeding import seed_kitchen
+
+
+MENU_URL = reverse("kitchen:api-menu")
+
+
+class MenuSnapshotTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        self.soups = DishType.objects.create(name="Soups")
+        self.desserts = DishType.objects.create(name="Desserts")
+        DishType.objects.create(name="Drinks")
+        self.borscht = Dish.objects.create(
+            name="Borscht", price=5, dish_type=self.soups
+        )
+        Dish.objects.create(
+            name="Ramen", price="8.50", dish_type=self.soups,
+            description="Pork broth",
+        )
+        Dish.objects.create(name="Cake", price=4, dish_type=self.desserts)
+
+    def get_menu(self, **headers):
+        return self.client.get(MENU_URL, **headers)
+
+    def dish_names(self):
+        return {
+            dish_type["name"]: [dish["name"] for dish in dish_type["dishes"]]
+            for dish_type in self.get_menu().json()["dish_types"]
+        }
+
+    def test_menu_is_grouped_by_dish_type(self):
+        response = self.get_menu()
+
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(
+            response.json()["dish_types"],
+            [
+                {
+                    "id": self.desserts.id,
+                    "name": "Desserts",
+                    "dishes": [
+                        {
+                            "id": Dish.objects.get(name="Cake").id,
+                            "name": "Cake",
+                            "description": None,
+                            "price": "4.00",
+                        },
+                    ],
+                },
+                {
+                    "id": self.soups.id,
+                    "name": "Soups",
+                    "dishes": [
+                        {
+                            "id": self.borscht.id,
+                            "name": "Borscht",
+                            "description": None,
+                            "price": "5.00",
+                        },
+                        {
+                            "id": Dish.objects.get(name="Ramen").id,
+                            "name": "Ramen",
+                            "description": "Pork broth",
+                            "price": "8.50",
+                        },
+                    ],
+                },
+            ],
+        )
+
+    def test_readers_do_not_query_the_database(self):
+        self.get_menu()
+
+        with self.assertNumQueries(0):
+            response = self.get_menu()
+        self.assertEqual(response.status_code, 200)
+
+    def test_etag(self):
+        etag = self.get_menu()["ETag"]
+
+        response = self.get_menu(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertIn("public", response["Cache-Control"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.borscht.save()
+        self.assertNotEqual(self.get_menu()["ETag"], etag)
+
+    def test_dish_changes_are_applied_incrementally(self):
+        version = get_menu_snapshot()["version"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.borscht.name = "Beet soup"
+            self.borscht.dish_type = self.desserts
+            self.borscht.save()
+            Dish.objects.create(name="Tea", price=2, dish_type=self.soups)
+            Dish.objects.get(name="Ramen").delete()
+
+        self.assertEqual(get_menu_snapshot()["version"], version + 3)
+        self.assertEqual(
+            self.dish_names(),
+            {"Desserts": ["Beet soup", "Cake"], "Soups": ["Tea"]},
+        )
+
+    def test_dish_type_changes(self):
+        self.get_menu()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.desserts.name = "Sweets"
+            self.desserts.save()
+        self.assertEqual(
+            self.dish_names(),
+            {"Soups": ["Borscht", "Ramen"], "Sweets": ["Cake"]},
+        )
+
+        soups_id = self.soups.id
+        with mock.patch.object(
+            menu, "refresh_menu_snapshot", wraps=refresh_menu_snapshot
+        ) as refresh:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.soups.delete()
+        # The cascaded dishes go with their dish type.
+        refresh.assert_called_once_with(dishes=(), dish_types=[soups_id])
+        self.assertEqual(self.dish_names(), {"Sweets": ["Cake"]})
+
+    def test_incremental_changes_match_a_rebuild(self):
+        self.get_menu()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            drinks = DishType.objects.get(name="Drinks")
+            teas = DishType.objects.create(name="Teas")
+            Dish.objects.create(name="Green tea", price=3, dish_type=teas)
+            self.borscht.dish_type = drinks
+            self.borscht.price = "5.25"
+            self.borscht.save()
+            self.desserts.delete()
+            Dish.objects.filter(name="Ramen").update(description="Spicy")
+            Dish.objects.get(name="Ramen").save()
+
+        refreshed = self.get_menu().json()
+        cache.clear()
+        rebuilt = self.get_menu().json()
+
+        self.assertGreater(rebuilt["version"], refreshed["version"])
+        self.assertEqual(refreshed["dish_types"], rebuilt["dish_types"])
+        self.assertEqual(
+            [dish_type["name"] for dish_type in rebuilt["dish_types"]],
+            ["Drinks", "Soups", "Teas"],
+        )
+
+    def test_evicted_sections_are_rebuilt_by_readers(self):
+        self.get_menu()
+        cache.delete(menu.section_key(self.desserts.pk))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.borscht.save()
+        self.assertIsNone(cache.get(menu.SNAPSHOT_KEY))
+        self.assertEqual(
+            self.dish_names(),
+            {"Desserts": ["Cake"], "Soups": ["Borscht", "Ramen"]},
+        )
+
+    def test_refresh_without_a_snapshot_leaves_it_to_readers(self):
+        with self.assertNumQueries(0):
+            self.assertIsNone(refresh_menu_snapshot(dishes=[self.borscht.pk]))
+
+    def test_rolled_back_changes_are_not_applied(self):
+        self.get_menu()
+
+        # Without execute=True the callbacks are dropped, as on rollback.
+        with self.captureOnCommitCallbacks():
+            Dish.objects.create(name="Tea", price=2, dish_type=self.soups)
+
+        self.assertNotIn("Tea", self.dish_names()["Soups"])
+
+    def test_bulk_writes_discard_the_snapshot(self):
+        self.get_menu()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            seed_kitchen(dish_types=2, cooks=2, dishes=5)
+        self.assertIsNone(cache.get(menu.SNAPSHOT_KEY))
+
+    def test_import_discards_the_snapshot(self):
+        self.get_menu()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "menu.csv"
+            path.write_text("name,price,dish_type\nTea,2,Soups\n")
+            with self.captureOnCommitCallbacks(execute=True):
+                call_command("import_menu", str(path), stdout=StringIO())
+
+        self.assertIn("Tea", self.dish_names()["Soups"])
+
+    def test_unknown_format(self):
+        response = self.client.get(MENU_URL, {"format": "xml"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("json", response.json()["error"])
+
+    @skipUnless(menu.msgpack, "msgpack is not installed")
+    def test_msgpack(self):
+        response = self.client.get(MENU_URL, {"format": "msgpack"})
+
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        payload = menu.msgpack.unpackb(response.content)
+        self.assertEqual(payload["dish_types"][1]["name"], "Soups")
+
+
+class MenuLockTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_lock_is_released(self):
+        with menu.menu_lock():
+            self.assertIsNotNone(cache.get(menu.LOCK_KEY))
+
+        self.assertIsNone(cache.get(menu.LOCK_KEY))
+
+    def test_expired_lock_taken_by_another_worker_is_kept(self):
+        with menu.menu_lock():
+            # The lock timed out and another worker took it.
+            cache.set(menu.LOCK_KEY, "other", menu.LOCK_TIMEOUT)
+
+        self.assertEqual(cache.get(menu.LOCK_KEY), "other")
@@ -0,0 +1,123 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from kitchen import metrics
+from kitchen.models import Dish, DishType
+
+
+METRICS_URL = reverse("kitchen:metrics")
+
+
+class HistogramTest(TestCase):
+    def test_buckets_are_cumulative(self):
+        histogram = metrics.Histogram((1, 5))
+
+        for value in (0, 1, 3, 7):
+            histogram.observe(value)
+
+        self.assertEqual(
+            list(histogram.cumulative()), [(1, 2), (5, 3), ("+Inf", 4)]
+        )
+        self.assertEqual((histogram.sum, histogram.count), (11, 4))
+
+
+@override_settings(KITCHEN_PROFILING_SAMPLE_RATE=1)
+class ProfilingMiddlewareTest(TestCase):
+    def setUp(self) -> None:
+        metrics.reset()
+        self.user = get_user_model().objects.create_user(
+            username="test", password="test12345", is_staff=True
+        )
+        self.client.force_login(self.user)
+        dish_type = DishType.objects.create(name="Soups")
+        Dish.objects.create(name="Borscht", price=5, dish_type=dish_type)
+
+    def tearDown(self) -> None:
+        metrics.reset()
+
+    def test_request_is_profiled_per_view(self):
+        self.client.get(reverse("kitchen:dish-list"))
+
+        view = "kitchen:dish-list"
+        duration = metrics.get_histogram(
+            "kitchen_request_duration_seconds", view
+        )
+        queries = metrics.get_histogram("kitchen_request_queries", view)
+        render = metrics.get_histogram(
+            "kitchen_request_render_seconds", view
+        )
+        self.assertEqual(duration.count, 1)
+        self.assertGreater(queries.sum, 0)
+        self.assertGreater(render.sum, 0)
+        self.assertLessEqual(render.sum, duration.sum)
+
+    async def test_async_request_is_profiled(self):
+        await sync_to_async(self.async_client.force_login)(self.user)
+
+        await self.async_client.get(reverse("kitchen:dish-list"))
+
+        queries = metrics.get_histogram(
+            "kitchen_request_queries", "kitchen:dish-list"
+        )
+        self.assertEqual(queries.count, 1)
+        self.assertGreater(queries.sum, 0)
+
+    @override_settings(KITCHEN_PROFILING_SAMPLE_RATE=0)
+    def test_disabled_when_sample_rate_is_zero(self):
+        self.client.get(reverse("kitchen:dish-list"))
+
+        self.assertIsNone(
+            metrics.get_histogram(
+                "kitchen_request_duration_seconds", "kitchen:dish-list"
+            )
+        )
+
+    def test_metrics_endpoint_renders_prometheus_text(self):
+        self.client.get(reverse("kitchen:index"))
+
+        response = self.client.get(METRICS_URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        body = response.content.decode()
+        self.assertIn(
+            "# TYPE kitchen_request_duration_seconds histogram", body
+        )
+        self.assertIn(
+            'kitchen_request_queries_count{view="kitchen:index"} 1', body
+        )
+        self.assertIn(
+            'kitchen_request_duration_seconds_bucket{view="kitchen:index",'
+            'le="+Inf"} 1',
+            body,
+        )
+        self.assertIn("kitchen_cache_requests_total", body)
+
+
+class MetricsAccessTest(TestCase):
+    def test_anonymous_is_forbidden(self):
+        self.assertEqual(self.client.get(METRICS_URL).status_code, 403)
+
+    def test_regular_cook_is_forbidden(self):
+        self.client.force_login(
+            get_user_model().objects.create_user(username="cook")
+        )
+
+        self.assertEqual(self.client.get(METRICS_URL).status_code, 403)
+
+    @override_settings(KITCHEN_METRICS_TOKEN="secret")
+    def test_bearer_token(self):
+        self.assertEqual(
+            self.client.get(
+                METRICS_URL, HTTP_AUTHORIZATION="Bearer secret"
+            ).status_code,
+            200,
+        )
+        self.assertEqual(
+            self.client.get(
+                METRICS_URL, HTTP_AUTHORIZATION="Bearer wrong"
+            ).status_code,
+            403,
+        )
@@ -1,8 +1,11 @@
+from io import StringIO
+
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.test import TestCase
 from django.urls import reverse
 
-from kitchen.models import Dish, DishType
+from kitchen.models import Dish, DishType, KitchenStats
 
 
 class ModelsTest(TestCase):
@@ -59,3 +62,57 @@ class ModelsTest(TestCase):
             self.chef.get_absolute_url(),
             reverse("kitchen:cook-detail", kwargs={"pk": self.chef.pk})
         )
+
+
+class KitchenStatsTest(TestCase):
+    def setUp(self):
+        self.cook = get_user_model().objects.create_user(
+            username="test_cook",
+            password="123password123",
+        )
+        self.dish_type = DishType.objects.create(name="dish_type")
+        Dish.objects.create(
+            name="test_dish",
+            dish_type=self.dish_type,
+            price=10,
+        )
+
+    def assertStats(self, cooks, dish_types, dishes):
+        stats = KitchenStats.load()
+
+        self.assertEqual(
+            (stats.cooks, stats.dish_types, stats.dishes),
+            (cooks, dish_types, dishes)
+        )
+
+    def test_load_counts_existing_rows(self):
+        self.assertStats(1, 1, 1)
+
+    def test_counters_follow_creates_and_deletes(self):
+        KitchenStats.load()
+
+        get_user_model().objects.create_user(username="another_cook")
+        Dish.objects.create(
+            name="another_dish",
+            dish_type=self.dish_type,
+            price=12,
+        )
+        self.assertStats(2, 1, 2)
+
+        self.dish_type.delete()
+        self.assertStats(2, 0, 0)
+
+    def test_rebuild_command(self):
+        KitchenStats.objects.update_or_create(pk=1, defaults={"dishes": 42})
+
+        call_command("rebuild_kitchen_stats", stdout=StringIO())
+
+        self.assertStats(1, 1, 1)
+
+    def test_index_uses_single_stats_query(self):
+        KitchenStats.load()
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("kitchen:index"))
+
+        self.assertEqual(response.context["dishes"], 1)
@@ -0,0 +1,113 @@
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+from kitchen.models import Dish, DishType
+from kitchen.pagination import decode_cursor, encode_cursor
+from kitchen.templatetags.query_transform import query_transform
+
+COOK_LIST_URL = reverse("kitchen:cook-list")
+DISH_LIST_URL = reverse("kitchen:dish-list")
+
+
+class CursorTokenTest(TestCase):
+    def test_round_trip(self):
+        token = encode_cursor("n", ["B", 12])
+
+        self.assertEqual(decode_cursor(token), ("n", ["B", 12]))
+
+    def test_invalid_token(self):
+        for token in ("not-a-cursor", encode_cursor("x", ["a"])):
+            with self.assertRaises(ValueError):
+                decode_cursor(token)
+
+    def test_query_transform_replaces_page_with_cursor(self):
+        request = RequestFactory().get("/", {"name": "soup", "page": 3})
+
+        self.assertEqual(
+            query_transform(request, cursor="abc"),
+            "name=soup&cursor=abc"
+        )
+
+
+class DishKeysetPaginationTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(
+            username="test_username",
+            password="test_1234",
+        )
+        dish_type = DishType.objects.create(name="dish_type")
+        for index in range(14):
+            Dish.objects.create(
+                name=f"dish_{index:02}",
+                price=5,
+                dish_type=dish_type
+            )
+
+        self.client.force_login(self.user)
+
+    def get_names(self, response):
+        return [dish.name for dish in response.context["dish_list"]]
+
+    def test_walk_forward_and_back(self):
+        first = self.client.get(DISH_LIST_URL)
+        self.assertEqual(self.get_names(first)[0], "dish_00")
+        self.assertIsNone(first.context["paginator"])
+        self.assertFalse(first.context["page_obj"].has_previous())
+
+        second = self.client.get(
+            DISH_LIST_URL,
+            {"cursor": first.context["page_obj"].next_cursor}
+        )
+        self.assertEqual(self.get_names(second)[0], "dish_06")
+
+        third = self.client.get(
+            DISH_LIST_URL,
+            {"cursor": second.context["page_obj"].next_cursor}
+        )
+        self.assertEqual(self.get_names(third), ["dish_12", "dish_13"])
+        self.assertFalse(third.context["page_obj"].has_next())
+
+        back = self.client.get(
+            DISH_LIST_URL,
+            {"cursor": third.context["page_obj"].previous_cursor}
+        )
+        self.assertEqual(self.get_names(back), self.get_names(second))
+
+    def test_cursor_keeps_search(self):
+        response = self.client.get(DISH_LIST_URL, {"name": "dish_1"})
+
+        self.assertEqual(len(response.context["dish_list"]), 4)
+        self.assertFalse(response.context["is_paginated"])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(DISH_LIST_URL, {"cursor": "broken"})
+
+        self.assertEqual(response.status_code, 404)
+
+
+class CookKeysetPaginationTest(TestCase):
+    def setUp(self) -> None:
+        for index in range(8):
+            get_user_model().objects.create_user(
+                username=f"cook_{index}",
+                position="A" if index % 2 else "B",
+            )
+
+        self.client.force_login(get_user_model().objects.first())
+
+    def test_ties_on_position_are_broken_by_pk(self):
+        first = self.client.get(COOK_LIST_URL)
+        second = self.client.get(
+            COOK_LIST_URL,
+            {"cursor": first.context["page_obj"].next_cursor}
+        )
+
+        cooks = [
+            *first.context["cook_list"],
+            *second.context["cook_list"],
+        ]
+        self.assertEqual(
+            cooks,
+            list(get_user_model().objects.order_by("position", "pk"))
+        )
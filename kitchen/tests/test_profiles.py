@@ -0,0 +1,140 @@
+import importlib
+import os
+import sys
+from unittest import mock
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase
+from django.urls import Resolver404, resolve
+
+from restaurant_kitchen_service.cache_url import parse_cache_url
+from restaurant_kitchen_service.profiles import (
+    check_live_board,
+    check_production_settings,
+    check_shared_cache,
+    get_worker_count,
+)
+from restaurant_kitchen_service.settings import base
+
+
+TOOLBAR_MIDDLEWARE = "debug_toolbar.middleware.DebugToolbarMiddleware"
+
+
+class SettingsProfileTest(SimpleTestCase):
+    def load_profile(self, name, **environ):
+        with mock.patch.dict(os.environ, environ):
+            return importlib.reload(importlib.import_module(
+                f"restaurant_kitchen_service.settings.{name}"
+            ))
+
+    def load_base(self, **environ):
+        # The profiles read the base settings loaded for the test run.
+        self.addCleanup(importlib.reload, base)
+        return self.load_profile("base", **environ)
+
+    def test_tests_run_on_the_test_profile(self):
+        self.assertEqual(settings.KITCHEN_PROFILE, "test")
+        self.assertNotIn("debug_toolbar", settings.INSTALLED_APPS)
+        with self.assertRaises(Resolver404):
+            resolve("/__debug__/render_panel/")
+
+    def test_dev_profile_adds_the_toolbar(self):
+        dev = self.load_profile("dev", DEBUG="")
+
+        self.assertTrue(dev.DEBUG)
+        self.assertIn("debug_toolbar", dev.INSTALLED_APPS)
+        self.assertIn(TOOLBAR_MIDDLEWARE, dev.MIDDLEWARE)
+        self.assertNotIn(TOOLBAR_MIDDLEWARE, base.MIDDLEWARE)
+
+    def test_prod_profile_runs_the_shared_stack(self):
+        prod = self.load_profile("prod", DEBUG="False")
+
+        self.assertFalse(prod.DEBUG)
+        self.assertEqual(prod.MIDDLEWARE, base.MIDDLEWARE)
+        self.assertNotIn("debug_toolbar", prod.INSTALLED_APPS)
+
+    def test_prod_profile_refuses_debug(self):
+        with self.assertRaisesMessage(ImproperlyConfigured, "DEBUG"):
+            self.load_profile("prod", DEBUG="True")
+
+    def test_prod_profile_refuses_dev_only_apps(self):
+        for apps, middleware in (
+            ([*base.INSTALLED_APPS, "debug_toolbar"], base.MIDDLEWARE),
+            (base.INSTALLED_APPS, [*base.MIDDLEWARE, TOOLBAR_MIDDLEWARE]),
+        ):
+            with self.assertRaisesMessage(
+                ImproperlyConfigured, "debug_toolbar"
+            ):
+                check_production_settings(False, apps, middleware)
+
+        check_production_settings(
+            False, base.INSTALLED_APPS, base.MIDDLEWARE
+        )
+
+    def test_local_cache_across_workers_is_refused(self):
+        for url in ("locmem://", "file:///var/tmp/kitchen"):
+            with self.assertRaisesMessage(
+                ImproperlyConfigured, "single worker"
+            ):
+                check_shared_cache(
+                    {"default": parse_cache_url(url)}, workers=2
+                )
+
+        self.load_base(WEB_CONCURRENCY="4")
+        with self.assertRaisesMessage(ImproperlyConfigured, "LocMemCache"):
+            self.load_profile("prod", DEBUG="False", WEB_CONCURRENCY="4")
+
+        check_shared_cache({"default": parse_cache_url("locmem://")}, 1)
+        check_shared_cache(
+            {"default": parse_cache_url("redis://cache:6379/0")}, workers=4
+        )
+
+    def test_worker_count(self):
+        asgi = "restaurant_kitchen_service.asgi:application"
+        for argv, environ, workers in (
+            (["manage.py", "runserver"], {}, 1),
+            (["manage.py", "check"], {"WEB_CONCURRENCY": "3"}, 3),
+            (["/venv/bin/gunicorn", asgi, "--workers", "4"], {}, 4),
+            (["/venv/bin/gunicorn", asgi, "-w2"], {}, 2),
+            (
+                ["/venv/bin/gunicorn", asgi, "--workers=5"],
+                {"WEB_CONCURRENCY": "2"},
+                5,
+            ),
+            (["gunicorn", asgi], {"GUNICORN_CMD_ARGS": "-w 6"}, 6),
+            (["/venv/bin/uvicorn", asgi, "--workers", "3"], {}, 3),
+            (["/venv/bin/uvicorn", asgi], {"WEB_CONCURRENCY": "2"}, 2),
+        ):
+            with self.subTest(argv=argv, environ=environ):
+                self.assertEqual(get_worker_count(argv, environ), workers)
+
+    def test_prod_profile_reads_workers_from_the_command_line(self):
+        argv = ["gunicorn", "restaurant_kitchen_service.wsgi", "-w", "4"]
+        with mock.patch.object(sys, "argv", argv):
+            self.load_base()
+            with self.assertRaisesMessage(ImproperlyConfigured, "4 workers"):
+                self.load_profile("prod", DEBUG="False")
+
+    def test_live_board_across_workers_needs_redis(self):
+        with self.assertRaisesMessage(ImproperlyConfigured, "LIVE_BOARD"):
+            check_live_board(True, None, workers=4)
+        environ = {
+            "CACHE_URL": "dummy://",
+            "LIVE_BOARD": "True",
+            "WEB_CONCURRENCY": "2",
+        }
+        self.load_base(**environ)
+        with self.assertRaisesMessage(ImproperlyConfigured, "LIVE_BOARD"):
+            self.load_profile("prod", DEBUG="False", **environ)
+
+        check_live_board(True, None, workers=1)
+        check_live_board(True, "redis://cache:6379/0", workers=4)
+        check_live_board(False, None, workers=4)
+
+    def test_live_board_is_on_under_asgi(self):
+        self.assertFalse(base.KITCHEN_LIVE_BOARD)
+        self.assertTrue(self.load_profile("dev", DEBUG="").KITCHEN_LIVE_BOARD)
+        self.assertTrue(
+            self.load_base(KITCHEN_ASYNC_VIEWS="1").KITCHEN_LIVE_BOARD
+        )
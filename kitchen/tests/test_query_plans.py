@@ -0,0 +1,110 @@
+from io import StringIO
+from unittest import mock, skipUnless
+
+from django.core.cache import caches
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+
+from kitchen.query_plans import find_sequential_scans, record_queries
+from kitchen.seeding import seed_kitchen
+
+
+class ListIndexesTest(TestCase):
+    def get_index_columns(self, table):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, table
+            )
+
+        return [
+            constraint["columns"]
+            for constraint in constraints.values()
+            if constraint["index"]
+        ]
+
+    def test_cook_list_ordering_is_indexed(self):
+        self.assertIn(
+            ["position", "id"], self.get_index_columns("kitchen_cook")
+        )
+
+    def test_dishes_by_type_are_indexed_by_name(self):
+        self.assertIn(
+            ["dish_type_id", "name"], self.get_index_columns("kitchen_dish")
+        )
+
+
+@skipUnless(
+    connection.vendor == "sqlite",
+    "PostgreSQL rightly prefers sequential scans of tiny test tables",
+)
+class CheckQueryPlansTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_kitchen(dish_types=5, cooks=20, dishes=200)
+
+    def check_query_plans(self, *args):
+        output = StringIO()
+        call_command("check_query_plans", *args, stdout=output)
+        return output.getvalue()
+
+    def test_list_views_do_not_scan_tables(self):
+        output = self.check_query_plans("--fail")
+
+        self.assertNotIn("-> 404", output)
+        self.assertIn("0 queries with sequential scans", output)
+
+    def test_verbose_output_shows_plans(self):
+        output = self.check_query_plans("-v", "2")
+
+        self.assertIn("kitchen_cook_position_idx", output)
+        self.assertIn("kitchen_dish_type_name_idx", output)
+
+    def test_cached_pages_are_queried_again(self):
+        default = caches["default"]
+        first = record_queries("kitchen:dish-list", {"name": "dish 4"})
+
+        self.assertEqual(first[0], 200)
+        self.assertTrue(first[1])
+        self.assertEqual(
+            record_queries("kitchen:dish-list", {"name": "dish 4"}), first
+        )
+        self.assertIs(caches["default"], default)
+
+    @mock.patch(
+        "kitchen.management.commands.check_query_plans."
+        "find_sequential_scans",
+        return_value=["kitchen_dish"],
+    )
+    def test_fail_on_sequential_scan(self, find_sequential_scans):
+        self.assertIn(
+            "sequential scan of kitchen_dish", self.check_query_plans()
+        )
+
+        with self.assertRaisesMessage(CommandError, "scan whole tables"):
+            self.check_query_plans("--fail")
+
+
+class FindSequentialScansTest(TestCase):
+    def test_sqlite_plans(self):
+        plan = [
+            "SCAN kitchen_dishtype",
+            "SCAN kitchen_cook USING INDEX kitchen_cook_position_idx",
+            "SCAN kitchen_dish_fts VIRTUAL TABLE INDEX 0:M2",
+            "SEARCH kitchen_dish USING INTEGER PRIMARY KEY (rowid=?)",
+        ]
+
+        with mock.patch.object(connection, "vendor", "sqlite"):
+            self.assertEqual(
+                find_sequential_scans(plan), ["kitchen_dishtype"]
+            )
+
+    def test_postgresql_plans(self):
+        plan = [
+            "Limit  (cost=0.28..4.59 rows=51 width=40)",
+            '  ->  Seq Scan on "kitchen_dish"  (cost=0.00..184.00 rows=1)',
+            "  ->  Index Scan using kitchen_cook_position_idx on kitchen_cook",
+        ]
+
+        with mock.patch.object(connection, "vendor", "postgresql"):
+            self.assertEqual(find_sequential_scans(plan), ["kitchen_dish"])
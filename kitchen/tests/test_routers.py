@@ -0,0 +1,172 @@
+import time
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+from django.db import connections
+from django.test import (
+    SimpleTestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from kitchen import routers
+from kitchen.models import Dish, DishType
+from kitchen.routers import ReplicaRouter, ReplicaRouting, current_routing
+
+
+DISH_LIST_URL = reverse("kitchen:dish-list")
+DISH_CREATE_URL = reverse("kitchen:dish-create")
+
+
+@override_settings(KITCHEN_READ_REPLICAS=["replica"])
+class ReplicaRouterTest(SimpleTestCase):
+    def setUp(self):
+        self.router = ReplicaRouter()
+
+    def route(self, session=None):
+        token = current_routing.set(ReplicaRouting(session or {}, "replica"))
+        self.addCleanup(current_routing.reset, token)
+
+    def test_reads_stay_on_primary_outside_marked_views(self):
+        self.assertIsNone(self.router.db_for_read(Dish))
+
+    def test_reads_of_marked_views_go_to_the_replica(self):
+        self.route()
+
+        self.assertEqual(self.router.db_for_read(Dish), "replica")
+        self.assertIsNone(self.router.db_for_read(Session))
+
+    def test_pinned_session_reads_from_primary(self):
+        self.route({routers.PIN_SESSION_KEY: time.time() + 5})
+
+        self.assertIsNone(self.router.db_for_read(Dish))
+
+    def test_reads_inside_a_transaction_stay_on_primary(self):
+        self.route()
+
+        with mock.patch.object(
+            connections["default"], "in_atomic_block", True
+        ):
+            self.assertIsNone(self.router.db_for_read(Dish))
+
+    def test_writes_and_migrations_stay_on_primary(self):
+        self.route()
+
+        self.assertEqual(self.router.db_for_write(Dish), "default")
+        self.assertFalse(self.router.allow_migrate("replica", "kitchen"))
+        self.assertIsNone(self.router.allow_migrate("default", "kitchen"))
+
+
+# The primary stands in for the replica: reads routed to "default" by the
+# router were sent to the replica, unrouted ones (None) to the primary.
+class ReplicaRoutingMiddlewareTest(TransactionTestCase):
+    def setUp(self):
+        # Enabled per test only: the flush after each test would skip the
+        # tables of a "default" that allow_migrate() takes for a replica.
+        replicas = self.settings(KITCHEN_READ_REPLICAS=["default"])
+        replicas.enable()
+        self.addCleanup(replicas.disable)
+
+        self.cook = get_user_model().objects.create_user(username="chef")
+        self.dish_type = DishType.objects.create(name="Soups")
+        self.client.force_login(self.cook)
+        self.routes = []
+
+        db_for_read = ReplicaRouter.db_for_read
+
+        def record(router, model, **hints):
+            alias = db_for_read(router, model, **hints)
+            self.routes.append((model, alias))
+            return alias
+
+        patcher = mock.patch.object(
+            ReplicaRouter, "db_for_read", autospec=True, side_effect=record
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def kitchen_routes(self):
+        routes = {
+            alias
+            for model, alias in self.routes
+            if model._meta.app_label == "kitchen"
+        }
+        self.routes.clear()
+        return routes
+
+    def create_dish(self):
+        return self.client.post(DISH_CREATE_URL, {
+            "name": "Borscht",
+            "price": 5,
+            "dish_type": self.dish_type.pk,
+        })
+
+    def test_list_reads_from_replica(self):
+        self.client.get(DISH_LIST_URL)
+
+        self.assertEqual(self.kitchen_routes(), {"default"})
+        self.assertNotIn(
+            (Session, "default"), self.routes, "sessions stay on primary"
+        )
+
+    def test_unmarked_views_read_from_primary(self):
+        self.client.get(DISH_CREATE_URL)
+
+        self.assertEqual(self.kitchen_routes(), {None})
+
+    def test_author_reads_from_primary_after_write(self):
+        self.assertEqual(self.create_dish().status_code, 302)
+        self.kitchen_routes()
+
+        self.client.get(DISH_LIST_URL)
+        self.assertEqual(self.kitchen_routes(), {None})
+
+        with mock.patch.object(routers.time, "time", return_value=(
+            time.time() + settings.KITCHEN_REPLICA_PIN_SECONDS + 1
+        )):
+            self.client.get(DISH_LIST_URL)
+        self.assertEqual(self.kitchen_routes(), {"default"})
+
+    def test_other_sessions_keep_reading_from_replica(self):
+        self.create_dish()
+        self.client.logout()
+        self.client.force_login(self.cook)
+        self.kitchen_routes()
+
+        self.client.get(DISH_LIST_URL)
+
+        self.assertEqual(self.kitchen_routes(), {"default"})
+
+    async def test_async_requests_are_routed(self):
+        self.async_client.cookies = self.client.cookies
+
+        await self.async_client.get(DISH_LIST_URL)
+
+        self.assertEqual(self.kitchen_routes(), {"default"})
+        self.assertIsNone(current_routing.get())
+
+
+@skipUnless(
+    "replica_1" in settings.DATABASES,
+    "set DATABASE_REPLICA_URLS to test against a replica",
+)
+class ReplicaDatabaseTest(TransactionTestCase):
+    databases = "__all__"
+
+    def test_list_queries_run_on_replica(self):
+        cook = get_user_model().objects.create_user(username="chef")
+        self.client.force_login(cook)
+        dish_type = DishType.objects.create(name="Soups")
+        Dish.objects.create(name="Borscht", price=5, dish_type=dish_type)
+
+        with CaptureQueriesContext(connections["replica_1"]) as replica:
+            response = self.client.get(DISH_LIST_URL)
+
+        self.assertContains(response, "Borscht")
+        self.assertTrue(
+            any("kitchen_dish" in query["sql"] for query in replica)
+        )
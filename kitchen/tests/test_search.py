@@ -0,0 +1,69 @@
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+
+from kitchen.models import Dish, DishType
+from kitchen.search import SQLITE_HAS_TRIGRAM, search
+
+
+class SearchTest(TestCase):
+    def setUp(self) -> None:
+        self.dish_type = DishType.objects.create(name="Soups")
+        self.dish = Dish.objects.create(
+            name="Tomato soup",
+            price=5,
+            dish_type=self.dish_type
+        )
+        Dish.objects.create(
+            name="Pumpkin pie",
+            price=6,
+            dish_type=self.dish_type
+        )
+
+    def search_dishes(self, term):
+        return list(
+            search(Dish.objects.all(), "name", term)
+            .values_list("name", flat=True)
+        )
+
+    def test_substring_is_case_insensitive(self):
+        self.assertEqual(self.search_dishes("MATO S"), ["Tomato soup"])
+
+    def test_short_term(self):
+        self.assertEqual(self.search_dishes("pi"), ["Pumpkin pie"])
+
+    def test_empty_term_returns_everything(self):
+        self.assertEqual(len(self.search_dishes("  ")), 2)
+
+    def test_index_follows_updates_and_deletes(self):
+        self.dish.name = "Onion soup"
+        self.dish.save()
+        self.assertEqual(self.search_dishes("tomato"), [])
+        self.assertEqual(self.search_dishes("onion"), ["Onion soup"])
+
+        self.dish.delete()
+        self.assertEqual(self.search_dishes("soup"), [])
+
+    def test_cooks_and_dish_types(self):
+        get_user_model().objects.create_user(username="gordon_r")
+
+        self.assertEqual(
+            search(get_user_model().objects.all(), "username", "DON")
+            .get().username,
+            "gordon_r"
+        )
+        self.assertEqual(
+            search(DishType.objects.all(), "name", "oup").get(),
+            self.dish_type
+        )
+
+    @skipUnless(
+        connection.vendor == "sqlite" and SQLITE_HAS_TRIGRAM,
+        "FTS5 trigram tokenizer is unavailable"
+    )
+    def test_sqlite_uses_shadow_table(self):
+        queryset = search(Dish.objects.all(), "name", "soup")
+
+        self.assertIn("kitchen_dish_fts", str(queryset.query))
@@ -0,0 +1,83 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.db import transaction
+from django.test import TestCase
+
+from kitchen.models import Dish, DishType, KitchenStats
+
+
+def snapshot():
+    return (
+        list(DishType.objects.order_by("pk").values_list("pk", "name")),
+        list(
+            get_user_model()
+            .objects.order_by("pk")
+            .values_list("pk", "username", "position", "years_of_experience")
+        ),
+        list(
+            Dish.objects.order_by("pk")
+            .values_list("pk", "name", "price", "dish_type")
+        ),
+        list(
+            Dish.cooks.through.objects.order_by("dish", "cook")
+            .values_list("dish", "cook")
+        ),
+    )
+
+
+class SeedKitchenTest(TestCase):
+    def seed(self, *args):
+        output = StringIO()
+        call_command(
+            "seed_kitchen",
+            "--dish-types=5",
+            "--cooks=20",
+            "--dishes=300",
+            "--batch-size=50",
+            *args,
+            stdout=output,
+        )
+        return output.getvalue()
+
+    def test_seed_generates_dataset(self):
+        output = self.seed()
+
+        self.assertIn("Seeded 5 dish types, 20 cooks, 300 dishes", output)
+        self.assertIn("rows/s", output)
+        self.assertEqual(Dish.objects.count(), 300)
+        self.assertGreater(Dish.cooks.through.objects.count(), 300)
+        stats = KitchenStats.load()
+        self.assertEqual(
+            (stats.dish_types, stats.cooks, stats.dishes), (5, 20, 300)
+        )
+
+        cook = get_user_model().objects.get(username="s0_cook_3")
+        self.assertTrue(cook.check_password("kitchen12345"))
+        self.assertTrue(cook.is_active)
+        self.assertIsNotNone(cook.date_joined)
+
+        dish = Dish.objects.create(
+            name="Fresh", price=1, dish_type=DishType.objects.first()
+        )
+        self.assertGreater(dish.pk, 300)
+
+    def test_seed_is_deterministic(self):
+        with transaction.atomic():
+            self.seed("--seed=7")
+            first = snapshot()
+            transaction.set_rollback(True)
+
+        self.seed("--seed=7")
+
+        self.assertEqual(snapshot(), first)
+
+    def test_seed_twice_is_rejected(self):
+        self.seed()
+
+        with self.assertRaisesMessage(CommandError, "already loaded"):
+            self.seed()
+
+        self.seed("--seed=1")
+        self.assertEqual(Dish.objects.count(), 600)
@@ -0,0 +1,107 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, override_settings
+
+from kitchen.staticfiles import get_static_references
+
+
+class StaticPipelineTest(SimpleTestCase):
+    def setUp(self):
+        static_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, static_root)
+        self.static_root = Path(static_root)
+
+        settings = override_settings(
+            STATIC_ROOT=static_root,
+            STATICFILES_STORAGE=(
+                "kitchen.staticfiles.MinifiedManifestStaticFilesStorage"
+            ),
+            # Project files only, the admin ones take a while to compress.
+            STATICFILES_FINDERS=[
+                "django.contrib.staticfiles.finders.FileSystemFinder"
+            ],
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        call_command("collectstatic", interactive=False, verbosity=0)
+
+    def check_static_references(self):
+        output = StringIO()
+        call_command(
+            "check_static_references", stdout=output, stderr=output
+        )
+        return output.getvalue()
+
+    def test_files_are_minified_hashed_and_compressed(self):
+        source = Path(staticfiles_storage.path("js/live_board.js"))
+        hashed = self.static_root / staticfiles_storage.stored_name(
+            "js/live_board.js"
+        )
+
+        self.assertRegex(hashed.name, r"^live_board\.[0-9a-f]{12}\.js$")
+        self.assertNotIn("// Keeps dish cards", hashed.read_text())
+        self.assertLess(
+            hashed.stat().st_size,
+            (Path("static") / "js/live_board.js").stat().st_size,
+        )
+        self.assertEqual(source.read_text(), hashed.read_text())
+        self.assertTrue(hashed.with_name(f"{hashed.name}.gz").exists())
+        self.assertTrue(hashed.with_name(f"{hashed.name}.br").exists())
+
+    def test_template_references_resolve_in_manifest(self):
+        self.assertIn(
+            ("base.html", "css/styles.css"), get_static_references()
+        )
+        self.assertNotIn("not collected", self.check_static_references())
+
+    @mock.patch(
+        "kitchen.management.commands.check_static_references."
+        "get_static_references",
+        return_value=[("base.html", "css/missing.css")],
+    )
+    def test_missing_reference_fails(self, get_static_references):
+        with self.assertRaisesMessage(CommandError, "1 static references"):
+            self.check_static_references()
+
+
+class FreshProcessTest(SimpleTestCase):
+    def test_uncollected_manifest_fails_the_check(self):
+        # As in build.sh: a new process, with the production storage and
+        # nothing collected into STATIC_ROOT.
+        script = (
+            "import sys, django; django.setup(); "
+            "from django.conf import settings; "
+            "settings.STATIC_ROOT = sys.argv[1]; "
+            "from django.core.management import call_command; "
+            "call_command('check_static_references')"
+        )
+
+        with tempfile.TemporaryDirectory() as static_root:
+            result = subprocess.run(
+                [sys.executable, "-c", script, static_root],
+                cwd=settings.BASE_DIR,
+                env={
+                    **os.environ,
+                    "DJANGO_SETTINGS_MODULE": (
+                        "restaurant_kitchen_service.settings"
+                    ),
+                    "DJANGO_PROFILE": "prod",
+                    "DJANGO_SECRET_KEY": "check",
+                },
+                capture_output=True,
+                text=True,
+            )
+
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn("css/styles.css is not collected", result.stderr)
@@ -0,0 +1,57 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.template import engines
+from django.template.loaders.filesystem import Loader
+from django.test import TestCase
+from django.urls import reverse
+
+from kitchen.warmup import get_template_names, warm_up_templates
+
+
+DISH_LIST_URL = reverse("kitchen:dish-list")
+
+
+class TemplateWarmUpTest(TestCase):
+    def setUp(self):
+        self.client.force_login(
+            get_user_model().objects.create_user(username="chef")
+        )
+        self.cached_loader = engines["django"].engine.template_loaders[0]
+        self.cached_loader.reset()
+        self.addCleanup(warm_up_templates)
+
+    def read_dish_list_templates(self):
+        # Project templates read from disk by the first dish list request.
+        with mock.patch.object(
+            Loader, "get_contents", autospec=True, wraps=Loader.get_contents
+        ) as get_contents:
+            self.assertEqual(self.client.get(DISH_LIST_URL).status_code, 200)
+
+        project_templates = get_template_names(
+            engines["django"].engine.dirs[0]
+        )
+        return {
+            origin.template_name
+            for (loader, origin), kwargs in get_contents.call_args_list
+            if origin.template_name in project_templates
+        }
+
+    def test_project_templates_are_found(self):
+        names = get_template_names(engines["django"].engine.dirs[0])
+
+        self.assertIn("base.html", names)
+        self.assertIn("includes/pagination.html", names)
+        self.assertIn("kitchen/dish_list.html", names)
+        self.assertNotIn("kitchen/dish_form.txt", names)
+
+    def test_first_request_reads_templates_without_warm_up(self):
+        self.assertIn(
+            "kitchen/dish_list.html", self.read_dish_list_templates()
+        )
+
+    def test_first_request_uses_warmed_up_templates(self):
+        names = warm_up_templates()
+
+        self.assertIn("kitchen/dish_list.html", names)
+        self.assertEqual(self.read_dish_list_templates(), set())
@@ -1,6 +1,29 @@
+from django.conf import settings
 from django.urls import path
 
+from .api import (
+    AnalyticsApiView,
+    AsyncAnalyticsApiView,
+    AsyncCookApiDetailView,
+    AsyncCookApiListView,
+    AsyncDishApiDetailView,
+    AsyncDishApiListView,
+    AsyncDishTypeApiDetailView,
+    AsyncDishTypeApiListView,
+    DishApiListView,
+    DishApiDetailView,
+    DishApiExportView,
+    CookApiListView,
+    CookApiDetailView,
+    DishTypeApiListView,
+    DishTypeApiDetailView,
+    MenuSnapshotView,
+)
 from .views import (
+    AnalyticsView,
+    AsyncDishDetailView,
+    AsyncDishListView,
+    AsyncIndexView,
     IndexView,
     DishTypeListView,
     DishTypeCreateView,
@@ -8,6 +31,7 @@ from .views import (
     DishTypeDeleteView,
     CookListView,
     CookDetailView,
+    CookWorkloadView,
     CookCreateView,
     CookDeleteView,
     CookUpdateView,
@@ -17,12 +41,22 @@ from .views import (
     DishCreateView,
     DishUpdateView,
     DishAddCooksView,
-    DishDeleteView
+    DishDeleteView,
+    CacheStatsView,
+    MetricsView,
+    LiveEventsView,
 )
 
 
+def as_view(view, async_view):
+    # ASGI deployments serve the read-heavy pages through async variants.
+    if settings.KITCHEN_ASYNC_VIEWS:
+        return async_view.as_view()
+    return view.as_view()
+
+
 urlpatterns = [
-    path("", IndexView.as_view(), name="index"),
+    path("", as_view(IndexView, AsyncIndexView), name="index"),
     
     path("dish_type/", DishTypeListView.as_view(), name="dish-type-list"),
     path("dish_type/create/",
@@ -39,6 +73,9 @@ urlpatterns = [
     path(
         "cook/<int:pk>/", CookDetailView.as_view(), name="cook-detail"
     ),
+    path(
+        "cook/workload/", CookWorkloadView.as_view(), name="cook-workload"
+    ),
     path("cook/create/", CookCreateView.as_view(), name="cook-create"),
     path(
         "cook/<int:pk>/cook-update/",
@@ -56,8 +93,16 @@ urlpatterns = [
         name="cook-delete",
     ),
 
-    path("dishes/", DishListView.as_view(), name="dish-list"),
-    path("dishes/<int:pk>/", DishDetailView.as_view(), name="dish-detail"),
+    path(
+        "dishes/",
+        as_view(DishListView, AsyncDishListView),
+        name="dish-list",
+    ),
+    path(
+        "dishes/<int:pk>/",
+        as_view(DishDetailView, AsyncDishDetailView),
+        name="dish-detail",
+    ),
     path("dishes/create/", DishCreateView.as_view(), name="dish-create"),
     path("dishes/<int:pk>/update/",
          DishUpdateView.as_view(),
@@ -68,6 +113,55 @@ urlpatterns = [
     path("dishes/<int:pk>/add-cooks/",
          DishAddCooksView.as_view(),
          name="dish-add-cooks"),
+
+    path("analytics/", AnalyticsView.as_view(), name="analytics"),
+    path("cache-stats/", CacheStatsView.as_view(), name="cache-stats"),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
+    path("live/events/", LiveEventsView.as_view(), name="live-events"),
+
+    path(
+        "api/dishes/",
+        as_view(DishApiListView, AsyncDishApiListView),
+        name="api-dish-list",
+    ),
+    path(
+        "api/dishes/<int:pk>/",
+        as_view(DishApiDetailView, AsyncDishApiDetailView),
+        name="api-dish-detail",
+    ),
+    path(
+        "api/dishes/export/",
+        # Streamed by the sync view under ASGI as well, see
+        # kitchen.async_views.StreamingASGIHandler.
+        DishApiExportView.as_view(),
+        name="api-dish-export",
+    ),
+    path(
+        "api/cooks/",
+        as_view(CookApiListView, AsyncCookApiListView),
+        name="api-cook-list",
+    ),
+    path(
+        "api/cooks/<int:pk>/",
+        as_view(CookApiDetailView, AsyncCookApiDetailView),
+        name="api-cook-detail",
+    ),
+    path(
+        "api/analytics/",
+        as_view(AnalyticsApiView, AsyncAnalyticsApiView),
+        name="api-analytics",
+    ),
+    path("api/menu/", MenuSnapshotView.as_view(), name="api-menu"),
+    path(
+        "api/dish_types/",
+        as_view(DishTypeApiListView, AsyncDishTypeApiListView),
+        name="api-dish-type-list",
+    ),
+    path(
+        "api/dish_types/<int:pk>/",
+        as_view(DishTypeApiDetailView, AsyncDishTypeApiDetailView),
+        name="api-dish-type-detail",
+    ),
 ]
 
 app_name = "kitchen"
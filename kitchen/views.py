@@ -1,9 +1,27 @@
+from hmac import compare_digest
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.contrib.auth.mixins import LoginRequiredMixin
-from django.shortcuts import render
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.db.models import Prefetch
+from django.http import (
+    Http404,
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.template.response import TemplateResponse
 from django.urls import reverse_lazy
 from django.views import View, generic
 
+from kitchen.analytics import get_kitchen_analytics
+from kitchen.async_views import (
+    AsyncDetailMixin,
+    AsyncKeysetListMixin,
+    AsyncLoginRequiredMixin,
+)
+from kitchen.cache import get_cache_stats, get_model_versions
+from kitchen.conditional import AsyncConditionalGetMixin, ConditionalGetMixin
 from kitchen.forms import (
     DishTypeSearchForm,
     CookSearchForm,
@@ -11,30 +29,47 @@ from kitchen.forms import (
     DishForm,
     CookCreateForm, DishAddCookForm,
 )
-from kitchen.models import Cook, DishType, Dish
+from kitchen.live import STREAM_HEADERS, Subscriber, hub, stream_events
+from kitchen.metrics import render_prometheus
+from kitchen.models import Cook, DishType, Dish, KitchenStats
+from kitchen.pagination import (
+    CachedSearchPaginationMixin,
+    KeysetPaginationMixin,
+)
+from kitchen.search import search
 
 
 class IndexView(View):
-    def get_context_data(self, **kwargs):
+    def get_context_data(self, stats, **kwargs):
         context = {
-            "cooks": len(get_user_model().objects.all()),
-            "dish_types": DishType.objects.count(),
-            "dishes": Dish.objects.count(),
+            "cooks": stats.cooks,
+            "dish_types": stats.dish_types,
+            "dishes": stats.dishes,
         }
 
         return context
 
     def get(self, request):
-        return render(request,
-                      "kitchen/index.html",
-                      context=self.get_context_data())
+        context = self.get_context_data(KitchenStats.load())
+
+        return TemplateResponse(request, "kitchen/index.html", context)
 
 
-class DishTypeListView(LoginRequiredMixin, generic.ListView):
+class DishTypeListView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    CachedSearchPaginationMixin,
+    generic.ListView,
+):
     model = DishType
+    read_replica = True
     context_object_name = "dish_type_list"
     template_name = "kitchen/dish_type_list.html"
     paginate_by = 6
+    keyset_ordering = ("name",)
+    search_form_class = DishTypeSearchForm
+    search_field = "name"
+    conditional_models = (DishType,)
 
     def get_context_data(self, *, object_list=None, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -53,8 +88,8 @@ class DishTypeListView(LoginRequiredMixin, generic.ListView):
         form = DishTypeSearchForm(self.request.GET)
 
         if form.is_valid():
-            return queryset.filter(
-                name__icontains=form.cleaned_data["name"]
+            return search(
+                queryset, "name", form.cleaned_data["name"]
             )
 
         return queryset
@@ -80,9 +115,19 @@ class DishTypeDeleteView(LoginRequiredMixin, generic.DeleteView):
     template_name = "kitchen/dish_type_confirm_delete.html"
 
 
-class CookListView(LoginRequiredMixin, generic.ListView):
+class CookListView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    CachedSearchPaginationMixin,
+    generic.ListView,
+):
     model = Cook
+    read_replica = True
     paginate_by = 6
+    keyset_ordering = ("position", "pk")
+    search_form_class = CookSearchForm
+    search_field = "username"
+    conditional_models = (Cook,)
 
     def get_context_data(self, *, object_list=None, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -101,15 +146,90 @@ class CookListView(LoginRequiredMixin, generic.ListView):
         form = CookSearchForm(self.request.GET)
 
         if form.is_valid():
-            return queryset.filter(
-                username__icontains=form.cleaned_data["username"]
+            return search(
+                queryset, "username", form.cleaned_data["username"]
             )
 
         return queryset
 
 
-class CookDetailView(LoginRequiredMixin, generic.DetailView):
+class CookDetailView(
+    LoginRequiredMixin, ConditionalGetMixin, generic.DetailView
+):
+    model = Cook
+    read_replica = True
+    queryset = Cook.objects.prefetch_related(
+        Prefetch("dishes", queryset=Dish.objects.with_dish_type())
+    )
+
+    def get_conditional_state(self):
+        updated_at = Cook.objects.filter(pk=self.kwargs["pk"]).values_list(
+            "updated_at", flat=True
+        ).first()
+
+        if updated_at is None:
+            return None, None
+        return updated_at, get_model_versions(Dish, DishType)
+
+
+class CookWorkloadView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    KeysetPaginationMixin,
+    generic.ListView,
+):
+    # Busiest cooks first, read from the maintained Cook.dishes_count and
+    # its index rather than by counting assignments per request.
     model = Cook
+    read_replica = True
+    template_name = "kitchen/cook_workload.html"
+    paginate_by = 20
+    keyset_ordering = ("-dishes_count", "pk")
+    conditional_models = (Cook,)
+
+    def get_queryset(self):
+        return Cook.objects.only(
+            "username",
+            "first_name",
+            "last_name",
+            "position",
+            "years_of_experience",
+            "dishes_count",
+        )
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+
+        context["max_dishes_count"] = (
+            Cook.objects.order_by("-dishes_count")
+            .values_list("dishes_count", flat=True)
+            .first()
+        )
+
+        return context
+
+
+class AnalyticsView(
+    LoginRequiredMixin, ConditionalGetMixin, generic.TemplateView
+):
+    read_replica = True
+    template_name = "kitchen/analytics.html"
+    conditional_models = (Dish, Cook, DishType)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        analytics = get_kitchen_analytics()
+
+        context["analytics"] = analytics
+        context["max_dishes"] = max(
+            (row["dishes"] for row in analytics["cooks_per_dish"]),
+            default=0,
+        )
+        context["max_dish_type_dishes"] = max(
+            (row["dishes"] for row in analytics["dish_types"]), default=0
+        )
+
+        return context
 
 
 class CookCreateView(LoginRequiredMixin, generic.CreateView):
@@ -135,36 +255,87 @@ class CookDeleteView(LoginRequiredMixin, generic.DeleteView):
     success_url = reverse_lazy("kitchen:cook-list")
 
 
-class DishListView(LoginRequiredMixin, generic.ListView):
+class DishListView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    CachedSearchPaginationMixin,
+    generic.ListView,
+):
     model = Dish
+    read_replica = True
     paginate_by = 6
+    keyset_ordering = ("name",)
+    search_form_class = DishSearchForm
+    search_field = "name"
+    conditional_models = (Dish, DishType)
 
     def get_context_data(self, *, object_list=None, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        model = self.request.GET.get("model", "")
+        name = self.request.GET.get("name", "")
 
         context["search_form"] = DishSearchForm(initial={
-            "model": model
+            "name": name
         })
 
         return context
 
+    def get_cached_page_queryset(self):
+        return Dish.objects.for_list()
+
     def get_queryset(self):
-        queryset = Dish.objects.all()
+        queryset = Dish.objects.for_list()
 
         form = DishSearchForm(self.request.GET)
 
         if form.is_valid():
-            return queryset.filter(
-                name__icontains=form.cleaned_data["name"]
+            return search(
+                queryset, "name", form.cleaned_data["name"]
             )
 
         return queryset
 
 
-class DishDetailView(LoginRequiredMixin, generic.DetailView):
+class DishDetailView(
+    LoginRequiredMixin, ConditionalGetMixin, generic.DetailView
+):
     model = Dish
+    read_replica = True
+    queryset = Dish.objects.for_detail()
+
+    def get_conditional_state(self):
+        row = Dish.objects.filter(pk=self.kwargs["pk"]).values_list(
+            "updated_at", "dish_type__updated_at"
+        ).first()
+
+        if row is None:
+            return None, None
+        return max(row), (row, get_model_versions(Cook))
+
+
+class AsyncIndexView(IndexView):
+    async def get(self, request):
+        context = self.get_context_data(await KitchenStats.aload())
+
+        return TemplateResponse(request, "kitchen/index.html", context)
+
+
+class AsyncDishListView(
+    AsyncLoginRequiredMixin,
+    AsyncConditionalGetMixin,
+    AsyncKeysetListMixin,
+    DishListView,
+):
+    pass
+
+
+class AsyncDishDetailView(
+    AsyncLoginRequiredMixin,
+    AsyncConditionalGetMixin,
+    AsyncDetailMixin,
+    DishDetailView,
+):
+    pass
 
 
 class DishCreateView(LoginRequiredMixin, generic.CreateView):
@@ -188,3 +359,47 @@ class DishAddCooksView(LoginRequiredMixin, generic.UpdateView):
 class DishDeleteView(LoginRequiredMixin, generic.DeleteView):
     model = Dish
     success_url = reverse_lazy("kitchen:dish-list")
+
+
+class CacheStatsView(LoginRequiredMixin, UserPassesTestMixin, View):
+    def test_func(self):
+        return self.request.user.is_staff
+
+    def get(self, request):
+        return JsonResponse(get_cache_stats())
+
+
+class MetricsView(UserPassesTestMixin, View):
+    raise_exception = True
+
+    def test_func(self):
+        token = getattr(settings, "KITCHEN_METRICS_TOKEN", None)
+        authorization = self.request.headers.get("Authorization", "")
+
+        return self.request.user.is_staff or bool(
+            token and compare_digest(authorization, f"Bearer {token}")
+        )
+
+    def get(self, request):
+        return HttpResponse(
+            render_prometheus(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
+
+class LiveEventsView(LoginRequiredMixin, View):
+    # Server-sent events for WSGI deployments; each open stream holds a
+    # worker thread. asgi.py serves this URL with kitchen.live.LiveEventsApp.
+
+    def get(self, request):
+        if not settings.KITCHEN_LIVE_BOARD:
+            raise Http404("The live board is turned off")
+
+        response = StreamingHttpResponse(
+            stream_events(hub.subscribe(Subscriber())),
+            content_type="text/event-stream",
+        )
+        for header, value in STREAM_HEADERS.items():
+            response[header] = value
+
+        return response
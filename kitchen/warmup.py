@@ -0,0 +1,40 @@
+from pathlib import Path
+
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
+
+
+# Project templates compiled when a worker boots.
+WARM_UP_PATTERNS = (
+    "base.html",
+    "includes/*.html",
+    "kitchen/*.html",
+    "registration/*.html",
+)
+
+
+def get_template_names(directory):
+    directory = Path(directory)
+
+    return sorted(
+        {
+            path.relative_to(directory).as_posix()
+            for pattern in WARM_UP_PATTERNS
+            for path in directory.glob(pattern)
+        }
+    )
+
+
+def warm_up_templates():
+    # Fill the cached loader before the first request, which would
+    # otherwise pay for reading and compiling every template it renders.
+    names = []
+
+    for engine in engines.all():
+        if not isinstance(engine, DjangoTemplates):
+            continue
+        for directory in engine.engine.dirs:
+            for name in get_template_names(directory):
+                engine.get_template(name)
+                names.append(name)
+    return names
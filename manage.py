@@ -9,6 +9,9 @@ def main():
     os.environ.setdefault(
         "DJANGO_SETTINGS_MODULE", "restaurant_kitchen_service.settings"
     )
+    os.environ.setdefault(
+        "DJANGO_PROFILE", "test" if sys.argv[1:2] == ["test"] else "dev"
+    )
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
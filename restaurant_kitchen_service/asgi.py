@@ -9,8 +9,17 @@ https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "restaurant_kitchen_service.settings")
+os.environ.setdefault("DJANGO_PROFILE", "prod")
+os.environ.setdefault("KITCHEN_ASYNC_VIEWS", "1")
 
-application = get_asgi_application()
+django.setup(set_prefix=False)
+
+from kitchen.async_views import StreamingASGIHandler  # noqa: E402
+from kitchen.live import LiveEventsApp  # noqa: E402 (needs loaded apps)
+
+django_application = StreamingASGIHandler()
+
+application = LiveEventsApp(django_application)
@@ -0,0 +1,50 @@
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+from django.core.exceptions import ImproperlyConfigured
+
+
+BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+    "rediss": "django.core.cache.backends.redis.RedisCache",
+    "dummy": "django.core.cache.backends.dummy.DummyCache",
+}
+
+# Backends keeping a copy of the cache per worker process or per host,
+# where incr() and add() are not atomic between processes either.
+LOCAL_BACKENDS = {BACKENDS["locmem"], BACKENDS["file"]}
+
+INT_OPTIONS = ("max_entries", "cull_frequency")
+
+
+def parse_cache_url(url, timeout=300, key_prefix=""):
+    parts = urlsplit(url)
+
+    if parts.scheme not in BACKENDS:
+        raise ImproperlyConfigured(
+            f"Unsupported cache URL scheme {parts.scheme!r}, "
+            f"expected one of: {', '.join(BACKENDS)}"
+        )
+
+    config = {
+        "BACKEND": BACKENDS[parts.scheme],
+        "TIMEOUT": timeout,
+        "KEY_PREFIX": key_prefix,
+    }
+
+    if parts.scheme == "locmem":
+        config["LOCATION"] = parts.netloc or "kitchen"
+    elif parts.scheme == "file":
+        config["LOCATION"] = parts.path
+    elif parts.scheme in ("redis", "rediss"):
+        config["LOCATION"] = urlunsplit(parts._replace(query=""))
+
+    options = {
+        key.upper(): int(value) if key in INT_OPTIONS else value
+        for key, value in parse_qsl(parts.query)
+    }
+    if options:
+        config["OPTIONS"] = options
+
+    return config
@@ -0,0 +1,36 @@
+from django.core.exceptions import ImproperlyConfigured
+
+
+POSTGRESQL_ENGINE = "django.db.backends.postgresql"
+POOL_MODES = ("pgbouncer", "process")
+
+
+def configure_pool(config, mode, max_size=10, timeout=10, max_idle=300):
+    if not mode:
+        return config
+
+    if mode not in POOL_MODES:
+        raise ImproperlyConfigured(
+            f"Unsupported DATABASE_POOL {mode!r}, "
+            f"expected one of: {', '.join(POOL_MODES)}"
+        )
+    if config.get("ENGINE") != POSTGRESQL_ENGINE:
+        raise ImproperlyConfigured(
+            "DATABASE_POOL requires a PostgreSQL DATABASE_URL"
+        )
+
+    if mode == "pgbouncer":
+        # In transaction pooling, every transaction may run on another
+        # server connection, so the cursor of .iterator() cannot stay open.
+        return {**config, "DISABLE_SERVER_SIDE_CURSORS": True}
+
+    return {
+        **config,
+        "ENGINE": "kitchen.db.postgresql",
+        "CONN_MAX_AGE": 0,
+        "POOL": {
+            "MAX_SIZE": max_size,
+            "TIMEOUT": timeout,
+            "MAX_IDLE": max_idle,
+        },
+    }
@@ -0,0 +1,78 @@
+import shlex
+
+from django.core.exceptions import ImproperlyConfigured
+
+from restaurant_kitchen_service.cache_url import LOCAL_BACKENDS
+
+
+# Apps of the dev profile that must never serve production traffic.
+DEV_ONLY_APPS = ("debug_toolbar",)
+
+
+def check_production_settings(debug, installed_apps, middleware):
+    # Called by the prod profile, so a misconfigured worker fails to boot
+    # instead of serving requests.
+    if debug:
+        raise ImproperlyConfigured(
+            "DEBUG must be off in the prod profile, "
+            "use DJANGO_PROFILE=dev for development"
+        )
+
+    dev_only = [
+        entry
+        for entry in [*installed_apps, *middleware]
+        if entry.split(".")[0] in DEV_ONLY_APPS
+    ]
+    if dev_only:
+        raise ImproperlyConfigured(
+            f"Dev-only apps in the prod profile: {', '.join(dev_only)}"
+        )
+
+
+# Servers whose --workers/-w option sets the worker count.
+SERVERS = ("gunicorn", "uvicorn")
+
+
+def get_worker_count(argv, environ):
+    # The last --workers/-w of the server command line (gunicorn also reads
+    # GUNICORN_CMD_ARGS), else WEB_CONCURRENCY, which both servers read as
+    # their default. Workers set in a gunicorn config file are not seen.
+    program = argv[0] if argv else ""
+    workers = environ.get("WEB_CONCURRENCY", 1)
+
+    if not any(server in program for server in SERVERS):
+        return int(workers)
+
+    args = [*shlex.split(environ.get("GUNICORN_CMD_ARGS", "")), *argv[1:]]
+    for index, arg in enumerate(args):
+        if arg in ("-w", "--workers") and index + 1 < len(args):
+            workers = args[index + 1]
+        elif arg.startswith("--workers="):
+            workers = arg.split("=", 1)[1]
+        elif arg.startswith("-w") and arg[2:].isdigit():
+            workers = arg[2:]
+
+    return int(workers)
+
+
+def check_shared_cache(caches, workers):
+    # Writes bump the model versions of kitchen.cache and refresh the menu
+    # snapshot in the cache of the worker handling them: with a local cache
+    # the other workers keep serving pages and menus from before the write.
+    backend = caches["default"]["BACKEND"]
+
+    if backend in LOCAL_BACKENDS and workers > 1:
+        raise ImproperlyConfigured(
+            f"{backend} is not shared by the {workers} workers, "
+            f"set CACHE_URL to a redis:// URL or run a single worker"
+        )
+
+
+def check_live_board(live_board, redis_url, workers):
+    # Without Redis, changes reach the boards of the writing process only.
+    if live_board and not redis_url and workers > 1:
+        raise ImproperlyConfigured(
+            f"The live board needs LIVE_REDIS_URL or a redis:// CACHE_URL "
+            f"to serve {workers} workers, run a single worker "
+            f"or set LIVE_BOARD=False"
+        )
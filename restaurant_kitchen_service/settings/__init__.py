@@ -0,0 +1,20 @@
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+
+# DJANGO_PROFILE picks the settings module. manage.py defaults to "dev"
+# ("test" for manage.py test), wsgi.py and asgi.py to "prod".
+KITCHEN_PROFILE = os.getenv("DJANGO_PROFILE", "prod")
+
+if KITCHEN_PROFILE == "dev":
+    from .dev import *  # noqa: F401,F403
+elif KITCHEN_PROFILE == "test":
+    from .test import *  # noqa: F401,F403
+elif KITCHEN_PROFILE == "prod":
+    from .prod import *  # noqa: F401,F403
+else:
+    raise ImproperlyConfigured(
+        f"Unknown DJANGO_PROFILE {KITCHEN_PROFILE!r}, "
+        f"expected dev, test or prod"
+    )
@@ -0,0 +1,215 @@
+import os
+import sys
+from pathlib import Path
+from dotenv import load_dotenv
+
+import dj_database_url
+
+from restaurant_kitchen_service.cache_url import parse_cache_url
+from restaurant_kitchen_service.database_pool import configure_pool
+from restaurant_kitchen_service.profiles import get_worker_count
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+load_dotenv(BASE_DIR / ".env")
+
+SECRET_KEY = os.getenv("DJANGO_SECRET_KEY")
+
+# Settings shared by the dev, test and prod profiles (see __init__.py).
+DEBUG = False
+
+ALLOWED_HOSTS = ["127.0.0.1",
+                 "kitchen-mate.onrender.com"]
+
+INSTALLED_APPS = [
+    "django.contrib.admin",
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+    "crispy_forms",
+    "kitchen",
+]
+
+MIDDLEWARE = [
+    "kitchen.middleware.ProfilingMiddleware",
+    "django.middleware.security.SecurityMiddleware",
+    "kitchen.middleware.AsyncWhiteNoiseMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "kitchen.middleware.ReplicaRoutingMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+]
+
+# Set by asgi.py: read-heavy pages and the JSON API switch to async views.
+KITCHEN_ASYNC_VIEWS = os.getenv("KITCHEN_ASYNC_VIEWS") == "1"
+
+ROOT_URLCONF = "restaurant_kitchen_service.urls"
+
+TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "DIRS": [BASE_DIR / "templates"],
+        "OPTIONS": {
+            # Cached in development too: the autoreloader clears the cache
+            # when a template changes.
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
+            "context_processors": [
+                "django.template.context_processors.debug",
+                "django.template.context_processors.request",
+                "django.contrib.auth.context_processors.auth",
+                "django.contrib.messages.context_processors.messages",
+                "kitchen.context_processors.live_board",
+            ],
+        },
+    },
+]
+
+# Compile the project templates when a worker starts (kitchen.warmup).
+KITCHEN_TEMPLATE_WARMUP = os.getenv("TEMPLATE_WARMUP") != "False"
+
+CRISPY_TEMPLATE_PACK = "bootstrap4"
+
+WSGI_APPLICATION = "restaurant_kitchen_service.wsgi.application"
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "db.sqlite3",
+    }
+}
+
+DATABASE_OPTIONS = {
+    "conn_max_age": int(os.getenv("DATABASE_CONN_MAX_AGE", 500)),
+    "conn_health_checks": os.getenv("DATABASE_HEALTH_CHECKS") != "False",
+}
+
+# DATABASE_POOL=pgbouncer for a transaction-pooling PgBouncer in front of
+# PostgreSQL, or DATABASE_POOL=process for a pool shared by the threads of
+# each worker (kitchen.db.postgresql). Pool stats are served at /metrics/.
+DATABASE_POOL = os.getenv("DATABASE_POOL", "")
+
+POOL_OPTIONS = {
+    "max_size": int(os.getenv("DATABASE_POOL_SIZE", 10)),
+    "timeout": float(os.getenv("DATABASE_POOL_TIMEOUT", 10)),
+    "max_idle": float(os.getenv("DATABASE_POOL_MAX_IDLE", 300)),
+}
+
+db_from_env = dj_database_url.config(
+    default=os.getenv("DATABASE_URL"), **DATABASE_OPTIONS
+)
+
+DATABASES["default"].update(
+    configure_pool(db_from_env, DATABASE_POOL, **POOL_OPTIONS)
+)
+
+# Comma-separated URLs of read replicas of DATABASE_URL. List, detail,
+# search and API reads go to a random replica; see kitchen.routers.
+KITCHEN_READ_REPLICAS = []
+
+for index, url in enumerate(
+    filter(None, os.getenv("DATABASE_REPLICA_URLS", "").split(",")), 1
+):
+    alias = f"replica_{index}"
+    DATABASES[alias] = configure_pool(
+        dj_database_url.parse(url.strip(), **DATABASE_OPTIONS),
+        DATABASE_POOL,
+        **POOL_OPTIONS,
+    )
+    DATABASES[alias]["TEST"] = {"MIRROR": "default"}
+    KITCHEN_READ_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ["kitchen.routers.ReplicaRouter"]
+
+# Seconds a session reads from the primary after writing, to outlast the
+# replication lag.
+KITCHEN_REPLICA_PIN_SECONDS = float(
+    os.getenv("DATABASE_REPLICA_PIN_SECONDS", 5)
+)
+
+# Worker processes serving the site: --workers of the gunicorn or uvicorn
+# command line, else WEB_CONCURRENCY. The prod profile refuses per-process
+# state with more than one.
+KITCHEN_WORKERS = get_worker_count(sys.argv, os.environ)
+
+# locmem://, file:///var/tmp/kitchen or redis://host:6379/0 (any server
+# speaking the Redis protocol, e.g. Valkey or KeyDB, works for local runs).
+CACHE_URL = os.getenv("CACHE_URL", "locmem://")
+
+CACHES = {
+    "default": parse_cache_url(
+        CACHE_URL,
+        timeout=int(os.getenv("CACHE_TIMEOUT", 300)),
+        key_prefix=os.getenv("CACHE_KEY_PREFIX", "kitchen"),
+    )
+}
+
+# Share of requests timed by kitchen.middleware.ProfilingMiddleware (0 turns
+# it off). Histograms are served at /metrics/ to staff users or to scrapers
+# sending "Authorization: Bearer <METRICS_TOKEN>".
+KITCHEN_PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", 0))
+
+KITCHEN_METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+# Every open live board (kitchen.live) holds a connection, so it is on by
+# default under ASGI only. Threaded WSGI workers (gunicorn -k gthread) may
+# turn it on with LIVE_BOARD=True; sync workers would be held by each tab.
+KITCHEN_LIVE_BOARD = os.getenv(
+    "LIVE_BOARD", str(KITCHEN_ASYNC_VIEWS)
+) == "True"
+
+# Changes reach the boards served by other worker processes over Redis
+# pub/sub, through the cache server unless LIVE_REDIS_URL is set.
+KITCHEN_LIVE_REDIS_URL = os.getenv("LIVE_REDIS_URL") or (
+    CACHE_URL if CACHE_URL.startswith(("redis://", "rediss://")) else None
+)
+
+AUTH_PASSWORD_VALIDATORS = [
+    {
+        "NAME": "django.contrib.auth.password_validation."
+        "UserAttributeSimilarityValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation." 
+                "MinimumLengthValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation." 
+                "CommonPasswordValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation." 
+                "NumericPasswordValidator",
+    },
+]
+
+AUTH_USER_MODEL = "kitchen.Cook"
+
+LOGIN_REDIRECT_URL = "/"
+
+LANGUAGE_CODE = "en-us"
+
+TIME_ZONE = "UTC"
+
+USE_I18N = True
+
+USE_TZ = True
+
+STATIC_URL = "static/"
+
+STATICFILES_DIRS = (BASE_DIR / "static",)
+
+STATIC_ROOT = BASE_DIR / "staticfiles/"
+
+DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
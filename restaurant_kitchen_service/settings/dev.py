@@ -0,0 +1,28 @@
+import os
+
+from .base import *  # noqa: F401,F403
+from .base import INSTALLED_APPS, KITCHEN_ASYNC_VIEWS, MIDDLEWARE
+
+DEBUG = os.getenv("DEBUG") != "False"
+
+INTERNAL_IPS = [
+    "127.0.0.1",
+]
+
+INSTALLED_APPS = [*INSTALLED_APPS, "debug_toolbar"]
+
+MIDDLEWARE = list(MIDDLEWARE)
+
+# debug_toolbar 3.2 is sync-only and would run every async view in a thread.
+if not KITCHEN_ASYNC_VIEWS:
+    MIDDLEWARE.insert(
+        MIDDLEWARE.index("kitchen.middleware.AsyncWhiteNoiseMiddleware") + 1,
+        "debug_toolbar.middleware.DebugToolbarMiddleware",
+    )
+
+# runserver serves every request in a thread of its single process.
+KITCHEN_LIVE_BOARD = os.getenv("LIVE_BOARD") != "False"
+
+# debug_toolbar only looks at APP_DIRS, but the explicit template loaders
+# include app_directories, which finds the toolbar templates.
+SILENCED_SYSTEM_CHECKS = ["debug_toolbar.W006"]
@@ -0,0 +1,29 @@
+import os
+
+from restaurant_kitchen_service.profiles import (
+    check_live_board,
+    check_production_settings,
+    check_shared_cache,
+)
+
+from .base import *  # noqa: F401,F403
+from .base import (
+    CACHES,
+    INSTALLED_APPS,
+    KITCHEN_LIVE_BOARD,
+    KITCHEN_LIVE_REDIS_URL,
+    KITCHEN_WORKERS,
+    MIDDLEWARE,
+)
+
+# Read only so that a stray DEBUG=True fails below instead of leaking
+# tracebacks.
+DEBUG = os.getenv("DEBUG", "False") != "False"
+
+# build.sh collects minified, fingerprinted and pre-compressed files, see
+# kitchen.staticfiles. {% static %} fails for uncollected files.
+STATICFILES_STORAGE = "kitchen.staticfiles.MinifiedManifestStaticFilesStorage"
+
+check_production_settings(DEBUG, INSTALLED_APPS, MIDDLEWARE)
+check_shared_cache(CACHES, KITCHEN_WORKERS)
+check_live_board(KITCHEN_LIVE_BOARD, KITCHEN_LIVE_REDIS_URL, KITCHEN_WORKERS)
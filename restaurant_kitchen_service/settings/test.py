@@ -0,0 +1,4 @@
+from .base import *  # noqa: F401,F403
+
+# Tests create many users; the default PBKDF2 rounds dominate their setup.
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
@@ -11,5 +11,6 @@ import os
 
 from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "restaurant_kitchen_service.settings")
+os.environ.setdefault("DJANGO_PROFILE", "prod")
 
 application = get_wsgi_application()
@@ -0,0 +1,105 @@
+// Search-as-you-type cook selector for <select data-cook-picker>.
+// Only the selected cooks are rendered by the server; matches are fetched
+// page by page from the cook API.
+(function () {
+  "use strict";
+
+  function label(cook) {
+    var name = [cook.first_name, cook.last_name].join(" ").trim();
+    return name ? cook.username + " (" + name + ")" : cook.username;
+  }
+
+  function CookPicker(select) {
+    this.select = select;
+    this.url = select.dataset.url;
+    this.next = null;
+    this.timer = null;
+
+    this.chips = document.createElement("div");
+    this.chips.className = "mb-2";
+    this.input = document.createElement("input");
+    this.input.type = "search";
+    this.input.className = "form-control";
+    this.input.placeholder = "Search cooks by username...";
+    this.results = document.createElement("div");
+    this.results.className = "list-group mt-1";
+    this.more = document.createElement("button");
+    this.more.type = "button";
+    this.more.className = "btn btn-sm btn-secondary mt-1";
+    this.more.textContent = "More";
+    this.more.hidden = true;
+
+    select.hidden = true;
+    select.after(this.chips, this.input, this.results, this.more);
+
+    this.input.addEventListener("input", this.onInput.bind(this));
+    this.more.addEventListener("click", this.fetch.bind(this, false));
+    this.renderChips();
+  }
+
+  CookPicker.prototype.onInput = function () {
+    clearTimeout(this.timer);
+    this.timer = setTimeout(this.fetch.bind(this, true), 250);
+  };
+
+  CookPicker.prototype.fetch = function (reset) {
+    var params = new URLSearchParams({q: this.input.value, limit: 20});
+    if (!reset && this.next) {
+      params.set("cursor", this.next);
+    }
+    fetch(this.url + "?" + params, {credentials: "same-origin"})
+      .then(function (response) { return response.json(); })
+      .then(function (page) {
+        if (reset) {
+          this.results.textContent = "";
+        }
+        page.results.forEach(this.renderResult, this);
+        this.next = page.next;
+        this.more.hidden = !page.next;
+      }.bind(this));
+  };
+
+  CookPicker.prototype.renderResult = function (cook) {
+    var item = document.createElement("button");
+    item.type = "button";
+    item.className = "list-group-item list-group-item-action";
+    item.textContent = label(cook);
+    item.addEventListener("click", this.add.bind(this, cook));
+    this.results.append(item);
+  };
+
+  CookPicker.prototype.add = function (cook) {
+    var value = String(cook.id);
+    var exists = Array.prototype.some.call(this.select.options, function (o) {
+      return o.value === value;
+    });
+    if (!exists) {
+      this.select.add(new Option(label(cook), value, true, true));
+    }
+    this.renderChips();
+  };
+
+  CookPicker.prototype.renderChips = function () {
+    this.chips.textContent = "";
+    Array.prototype.forEach.call(this.select.options, function (option) {
+      if (!option.selected) {
+        return;
+      }
+      var chip = document.createElement("span");
+      chip.className = "badge badge-dark mr-1 p-2";
+      chip.textContent = option.text + " ×";
+      chip.style.cursor = "pointer";
+      chip.addEventListener("click", function () {
+        option.remove();
+        this.renderChips();
+      }.bind(this));
+      this.chips.append(chip);
+    }, this);
+  };
+
+  document.addEventListener("DOMContentLoaded", function () {
+    document.querySelectorAll("select[data-cook-picker]").forEach(
+      function (select) { new CookPicker(select); }
+    );
+  });
+})();
@@ -0,0 +1,70 @@
+// Keeps dish cards and cook pages current from the server-sent event
+// stream instead of reloading on a timer. Rows on the page are updated in
+// place; added or removed rows only reveal the reload banner, since they
+// change ordering and pagination.
+(function () {
+  "use strict";
+
+  var board = document.querySelector("[data-live-board]");
+  if (!board || !window.EventSource) {
+    return;
+  }
+
+  var cookId = board.dataset.cook ? Number(board.dataset.cook) : null;
+
+  function showBanner() {
+    board.hidden = false;
+  }
+
+  function fill(element, row) {
+    element.querySelectorAll("[data-live-field]").forEach(function (field) {
+      var value = row[field.dataset.liveField];
+      if (value !== undefined) {
+        field.textContent = (field.dataset.liveLabel || "") +
+          (value === null ? "None" : value);
+      }
+    });
+  }
+
+  function onDishes(event) {
+    var data = JSON.parse(event.data);
+
+    data.changed.forEach(function (dish) {
+      var element = document.querySelector(
+        '[data-live-dish="' + dish.id + '"]'
+      );
+      var assigned = cookId !== null && dish.cooks.indexOf(cookId) !== -1;
+
+      if (element && (cookId === null || assigned)) {
+        fill(element, dish);
+      } else if (element || assigned) {
+        showBanner();
+      }
+    });
+    data.deleted.forEach(function (id) {
+      if (document.querySelector('[data-live-dish="' + id + '"]')) {
+        showBanner();
+      }
+    });
+  }
+
+  function onCooks(event) {
+    var data = JSON.parse(event.data);
+
+    data.changed.forEach(function (cook) {
+      var element = document.querySelector(
+        '[data-live-cook="' + cook.id + '"]'
+      );
+      if (element) {
+        fill(element, cook);
+      }
+    });
+    if (data.deleted.indexOf(cookId) !== -1) {
+      showBanner();
+    }
+  }
+
+  var source = new EventSource(board.dataset.url);
+  source.addEventListener("dishes", onDishes);
+  source.addEventListener("cooks", onCooks);
+})();